@@ -0,0 +1,128 @@
+"""
+Custo de CPU x economia de banda da compressão gzip
+
+Parte 1 (offline): para corpos típicos (página de transações, link com muitos
+produtos, validação de cupom), mede o tamanho e o tempo de compactar e
+descompactar em cada nível do gzip, e estima o tempo de transferência na
+banda informada. Compactar compensa quando o tempo de CPU é menor que o
+tempo de rede economizado.
+
+Parte 2 (ponta a ponta): pagina as transações e cria links grandes contra a
+API falsa, com e sem gzip, contando os bytes que trafegaram.
+
+Uso:
+    python benchmarks/bench_compression.py [--bandwidth-mbps 10] [--payload-size 512]
+        [--page-size 100] [--products 200] [--repeat 200]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from upay import UpayClient  # noqa: E402
+from upay.codec import default_codec  # noqa: E402
+from upay.compression import GZIP_LEVEL, accept_encoding  # noqa: E402
+from fake_api import FakeUpayAPI, make_transaction  # noqa: E402
+
+LEVELS = (1, GZIP_LEVEL, 9)
+
+
+def big_link(products: int) -> Dict[str, Any]:
+    """Link de pagamento com muitos produtos (corpo de envio grande)"""
+    return {
+        "title": "Combo Benchmark",
+        "amount": 10000 * products,
+        "description": "Link criado pelo benchmark de compressão",
+        "products": [
+            {"productId": f"prod_{i:06d}", "quantity": 1 + i % 3, "title": f"Produto {i}", "amountCents": 990 + i}
+            for i in range(products)
+        ],
+    }
+
+
+def per_call(fn: Callable[[], Any], repeat: int) -> float:
+    """Tempo médio (segundos) de fn()"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def offline(bodies: List[Tuple[str, bytes]], bandwidth: float, repeat: int) -> None:
+    print(f"Banda estimada: {bandwidth * 8 / 1e6:g} Mbit/s\n")
+    print(f"{'corpo':<28} {'nível':>5} {'bytes':>10} {'razão':>7} {'compactar':>11} {'descompactar':>13} {'economia rede':>14}")
+    for name, body in bodies:
+        print(f"{name:<28} {'-':>5} {len(body):>10,} {1:>7.2f} {'-':>11} {'-':>13} {'-':>14}")
+        for level in LEVELS:
+            packed = gzip.compress(body, level)
+            compress = per_call(lambda: gzip.compress(body, level), repeat)
+            decompress = per_call(lambda: gzip.decompress(packed), repeat)
+            saved = (len(body) - len(packed)) / bandwidth
+            print(
+                f"{'':<28} {level:>5} {len(packed):>10,} {len(body) / len(packed):>7.2f}"
+                f" {compress * 1e3:>8.3f} ms {decompress * 1e3:>10.3f} ms {saved * 1e3:>11.3f} ms"
+            )
+    print()
+
+
+def end_to_end(args: argparse.Namespace, link: Dict[str, Any]) -> None:
+    print(f"{'cenário':<36} {'tempo':>10} {'enviados':>12} {'recebidos':>12}")
+    for compressed in (False, True):
+        with FakeUpayAPI(
+            payload_size=args.payload_size,
+            total_transactions=args.page_size * 10,
+            gzip_responses=compressed
+        ) as api:
+            upay = UpayClient(
+                api_key="bench",
+                base_url=api.url,
+                gzip_threshold=1024 if compressed else None
+            )
+            label = "gzip" if compressed else "sem compressão"
+            cases = (
+                ("paginação", lambda: upay.transactions.list_all(limit=args.page_size)),
+                ("links grandes (x20)", lambda: [upay.payment_links.create(link) for _ in range(20)]),
+            )
+            for case, run in cases:
+                run()  # aquecimento (abre a conexão)
+                api.bytes_in = api.bytes_out = 0
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+                print(f"{case + ', ' + label:<36} {elapsed * 1e3:>7.1f} ms {api.bytes_in:>12,} {api.bytes_out:>12,}")
+            upay.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bandwidth-mbps", type=float, default=10.0, help="banda usada na estimativa de transferência")
+    parser.add_argument("--payload-size", type=int, default=512, help="bytes por transação")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--products", type=int, default=200, help="produtos no link grande")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    
+    codec = default_codec()
+    link = big_link(args.products)
+    page = codec.encode({
+        "transactions": [make_transaction(i, args.payload_size) for i in range(args.page_size)],
+        "pagination": {"total": args.page_size, "page": 1, "limit": args.page_size, "totalPages": 1},
+    })
+    bodies = [
+        (f"transações ({args.page_size}/página)", page),
+        (f"link ({args.products} produtos)", codec.encode(link)),
+        ("validação de cupom", codec.encode({"code": "PROMO10", "amountCents": 10000})),
+    ]
+    
+    print(f"Accept-Encoding: {accept_encoding()}, codec {codec.name}\n")
+    offline(bodies, args.bandwidth_mbps * 1e6 / 8, args.repeat)
+    end_to_end(args, link)
+
+
+if __name__ == "__main__":
+    main()
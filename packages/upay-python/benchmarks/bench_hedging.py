@@ -0,0 +1,91 @@
+"""
+Latência de cauda de transactions.get com e sem hedging
+
+A API falsa atrasa uma fração das respostas (--tail-ratio) em --tail-ms,
+imitando a resposta lenta ocasional da API. O benchmark roda as mesmas
+chamadas sem hedging e com HedgingPolicy, e mostra p50/p99/p99.9 e a carga
+extra enviada à API.
+
+Uso:
+    python benchmarks/bench_hedging.py [--requests 2000] [--latency-ms 5]
+        [--tail-ms 200] [--tail-ratio 0.02] [--percentile 0.95] [--budget 0.05]
+        [--concurrency 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from upay import HedgingPolicy, UpayClient  # noqa: E402
+from fake_api import FakeUpayAPI  # noqa: E402
+from bench_suite import percentile  # noqa: E402
+
+
+def run(api: FakeUpayAPI, args: argparse.Namespace, policy: Optional[HedgingPolicy]) -> None:
+    upay = UpayClient(
+        api_key="bench",
+        base_url=api.url,
+        pool_maxsize=args.concurrency * 2,
+        hedging_policy=policy
+    )
+    latencies: List[float] = []
+    
+    def call(i: int) -> None:
+        start = time.perf_counter()
+        upay.transactions.get(f"tx_{i % 1000:08d}")
+        latencies.append(time.perf_counter() - start)
+    
+    # Aquecimento: abre as conexões e, com hedging, forma a janela de latências
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        list(pool.map(call, range(200)))
+    latencies.clear()
+    before = api.requests
+    
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        list(pool.map(call, range(args.requests)))
+    sent = api.requests - before
+    upay.close()
+    
+    latencies.sort()
+    label = "sem hedging" if policy is None else f"hedging p{policy.percentile * 100:g}"
+    print(
+        f"{label:<16} p50 {percentile(latencies, 0.5) * 1e3:7.2f} ms"
+        f"  p99 {percentile(latencies, 0.99) * 1e3:7.2f} ms"
+        f"  p99.9 {percentile(latencies, 0.999) * 1e3:7.2f} ms"
+        f"  carga extra {(sent / args.requests - 1) * 100:+5.1f}%"
+    )
+    if policy is not None:
+        print(f"{'':<16} {policy.stats()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="latência normal da API falsa")
+    parser.add_argument("--tail-ms", type=float, default=200.0, help="atraso extra das respostas lentas")
+    parser.add_argument("--tail-ratio", type=float, default=0.02, help="fração de respostas lentas")
+    parser.add_argument("--percentile", type=float, default=0.95)
+    parser.add_argument("--budget", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    
+    with FakeUpayAPI(
+        latency=args.latency_ms / 1000,
+        tail_latency=args.tail_ms / 1000,
+        tail_ratio=args.tail_ratio
+    ) as api:
+        print(
+            f"{args.requests} x transactions.get, {args.concurrency} threads, {args.tail_ratio:.1%} das "
+            f"respostas com +{args.tail_ms:g} ms\n"
+        )
+        run(api, args, None)
+        run(api, args, HedgingPolicy(percentile=args.percentile, budget=args.budget))
+
+
+if __name__ == "__main__":
+    main()
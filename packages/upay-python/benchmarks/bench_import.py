@@ -0,0 +1,74 @@
+"""
+Benchmark do tempo de importação do SDK (python -X importtime)
+
+Mede, em um processo novo para cada cenário, o tempo acumulado de
+importação e quantos módulos foram carregados por causa do SDK.
+
+Uso:
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SCENARIOS = [
+    ("import upay", "import upay"),
+    ("verify_webhook_signature", "from upay import verify_webhook_signature"),
+    ("WebhookRouter", "from upay import WebhookRouter"),
+    ("UpayClient", "from upay import UpayClient"),
+    ("AsyncUpayClient", "from upay import AsyncUpayClient"),
+]
+
+
+def run_importtime(statement: str) -> dict:
+    """Executa o import em um interpretador novo e lê a saída do -X importtime"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    
+    total_us = 0
+    modules = []
+    started = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        name = name.rstrip()
+        # O "site" é o último módulo da inicialização do interpretador; o
+        # que vem depois foi puxado pelo statement
+        if not started:
+            started = name == " site"
+            continue
+        modules.append(name.strip())
+        # Só as linhas de nível zero somam no total (o cumulativo já inclui os filhos)
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return {"total_ms": total_us / 1000, "modules": modules}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    print(f"{'cenário':<28} {'mediana':>10} {'módulos':>8}  carrega requests/asyncio")
+    for label, statement in SCENARIOS:
+        runs = [run_importtime(statement) for _ in range(args.repeat)]
+        median = statistics.median(run["total_ms"] for run in runs)
+        modules = runs[0]["modules"]
+        heavy = [name for name in ("requests", "asyncio", "httpx") if name in modules]
+        print(f"{label:<28} {median:>8.1f}ms {len(modules):>8}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
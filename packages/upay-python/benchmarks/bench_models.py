@@ -0,0 +1,82 @@
+"""
+Benchmark de memória: transações como dicts vs modelos com __slots__
+
+Decodifica páginas de transações no formato da API e mede, com tracemalloc,
+a memória ocupada pela lista resultante em cada modo.
+
+Uso:
+    python benchmarks/bench_models.py [--count 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from upay.codec import default_codec  # noqa: E402
+from upay.models import Transaction  # noqa: E402
+
+
+def make_page(count: int) -> bytes:
+    """Gera o corpo de uma listagem de transações"""
+    items = [
+        {
+            "id": f"tx_{i:08d}",
+            "displayId": f"#{i}",
+            "product": "Plano Mensal",
+            "amountCents": 4990 + i % 100,
+            "status": "PAID" if i % 3 else "PENDING",
+            "paymentMethod": "PIX",
+            "client": {"id": f"cl_{i % 5000}", "name": "Maria Silva", "email": "maria@example.com"},
+            "paymentLink": {"id": "pl_1", "title": "Checkout", "slug": "checkout"},
+            "metadata": {"pedido": str(i)},
+            "createdAt": "2024-01-01T12:00:00.000Z",
+            "updatedAt": "2024-01-01T12:05:00.000Z",
+            "paidAt": "2024-01-01T12:05:00.000Z",
+        }
+        for i in range(count)
+    ]
+    return default_codec().encode({"transactions": items})
+
+
+def measure(label: str, build) -> int:
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {size / 1024 ** 2:>9.1f} MiB {size / len(result):>8.0f} B/item {elapsed:>7.2f}s")
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    
+    codec = default_codec()
+    body = make_page(args.count)
+    
+    def as_dicts():
+        return codec.decode(body)["transactions"]
+    
+    def as_models():
+        return [Transaction.from_dict(item) for item in codec.decode(body)["transactions"]]
+    
+    print(f"{args.count} transações, codec {codec.name}\n")
+    dicts = measure("dicts", as_dicts)
+    models = measure("modelos (models=True)", as_models)
+    print(f"\nEconomia: {(1 - models / dicts) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Reproduz uma gravação do RecordingAdapter pelo SDK, sem rede
+
+Reenvia pelo HttpClient cada requisição gravada (mesmo método, caminho e
+corpo), respondida pelo ReplayAdapter. Sem --speed, as respostas chegam
+imediatamente e o tempo medido é só o do SDK (montagem da URL, codec,
+retentativas, hooks...); com --speed 1 o ritmo gravado é respeitado.
+
+Uso:
+    python benchmarks/bench_replay.py gravacao.jsonl.gz [--repeat 10] [--speed 0] [--profile]
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from upay import UpayClient  # noqa: E402
+from upay.replay import ReplayAdapter  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=10, help="vezes que a gravação é reproduzida")
+    parser.add_argument("--speed", type=float, default=0.0, help="1 = ritmo gravado, 0 = sem espera")
+    parser.add_argument("--profile", action="store_true", help="roda sob cProfile e mostra as funções mais caras")
+    args = parser.parse_args()
+    
+    adapter = ReplayAdapter(args.recording, speed=args.speed, loop=True)
+    upay = UpayClient(api_key="replay", base_url="http://replay.invalid", adapter=adapter)
+    http = upay._http
+    prefix = f"/api/{http.version}"
+    
+    calls = []
+    for entry in adapter.entries:
+        parts = urlsplit(entry["url"])
+        body = entry.get("request_body")
+        data = http.codec.decode(body.encode("utf-8")) if body else None
+        if parts.path.startswith(prefix):
+            endpoint = parts.path[len(prefix):]
+            calls.append((entry["method"], endpoint, data, dict(parse_qsl(parts.query))))
+        else:
+            # Endpoints fora da versão (ex.: /api/coupons/validate) são públicos
+            calls.append((entry["method"], None, data, parts.path))
+    
+    def replay():
+        for method, endpoint, data, extra in calls:
+            try:
+                if endpoint is None:
+                    http.request_public(method, extra, data)
+                else:
+                    http.request(method, endpoint, data=data, params=extra or None)
+            except Exception:
+                # Respostas de erro gravadas também fazem parte do perfil
+                pass
+    
+    profiler = cProfile.Profile() if args.profile else None
+    print(f"{len(calls)} trocas x {args.repeat}, codec {http.codec.name}\n")
+    
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        if profiler is not None:
+            profiler.runcall(replay)
+        else:
+            replay()
+    elapsed = time.perf_counter() - start
+    
+    total = len(calls) * args.repeat
+    print(f"{total} requisições em {elapsed:.3f}s ({total / elapsed:,.0f} req/s, {elapsed / total * 1e6:,.1f} µs/req)")
+    
+    if profiler is not None:
+        print()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Suíte de benchmarks do SDK contra uma API Upay falsa local
+
+Mede vazão (ops/s) e latência p50/p99 de payment_links.create,
+transactions.list, paginação, validação de cupons e verificação de
+webhooks, no cliente síncrono (sequencial e com threads) e no assíncrono
+(se o httpx estiver instalado). Os resultados podem ser gravados em JSON e
+comparados com uma execução anterior.
+
+Uso:
+    python benchmarks/bench_suite.py [--latency-ms 0] [--payload-size 512]
+        [--requests 300] [--concurrency 16] [--only pagination] [--gzip-responses]
+        [--output resultados.json] [--compare anterior.json]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import importlib.util
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import upay  # noqa: E402
+from upay import UpayClient, WebhookVerifier  # noqa: E402
+from upay.codec import default_codec  # noqa: E402
+from fake_api import FakeUpayAPI  # noqa: E402
+
+# (nome, função que roda o cenário e retorna o resultado)
+Scenario = Tuple[str, Callable[[], Dict[str, Any]]]
+
+LINK = {"title": "Benchmark", "amount": 10000, "description": "Link criado pelo benchmark"}
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Percentil pelo método nearest-rank"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p * len(sorted_values)) - 1)]
+
+
+def summarize(name: str, mode: str, latencies: List[float], elapsed: float, **extra) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    result = {
+        "name": name,
+        "mode": mode,
+        "ops": len(latencies),
+        "seconds": round(elapsed, 6),
+        "throughput": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+    }
+    result.update(extra)
+    return result
+
+
+def timed(fn: Callable[[], Any], latencies: List[float]) -> Callable[[Any], None]:
+    """Envolve fn() anotando a duração de cada chamada"""
+    def run(_=None):
+        start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - start)
+    return run
+
+
+def run_sequential(name: str, fn: Callable[[], Any], count: int, **extra) -> Dict[str, Any]:
+    fn()  # aquecimento (abre a conexão)
+    latencies: List[float] = []
+    op = timed(fn, latencies)
+    start = time.perf_counter()
+    for _ in range(count):
+        op()
+    return summarize(name, "sync", latencies, time.perf_counter() - start, **extra)
+
+
+def run_threads(name: str, fn: Callable[[], Any], count: int, concurrency: int, **extra) -> Dict[str, Any]:
+    latencies: List[float] = []
+    op = timed(fn, latencies)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda _: fn(), range(concurrency)))  # aquecimento
+        start = time.perf_counter()
+        list(executor.map(op, range(count)))
+        elapsed = time.perf_counter() - start
+    return summarize(name, f"threads x{concurrency}", latencies, elapsed, **extra)
+
+
+async def run_async(name: str, fn: Callable[[], Any], count: int, concurrency: int, **extra) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    
+    async def op():
+        async with semaphore:
+            start = time.perf_counter()
+            await fn()
+            latencies.append(time.perf_counter() - start)
+    
+    await asyncio.gather(*(fn() for _ in range(concurrency)))  # aquecimento
+    start = time.perf_counter()
+    await asyncio.gather(*(op() for _ in range(count)))
+    return summarize(name, f"async x{concurrency}", latencies, time.perf_counter() - start, **extra)
+
+
+def run_batch(name: str, fn: Callable[[], Any], repeat: int, batch_size: int, **extra) -> Dict[str, Any]:
+    """Mede uma operação em lote; latência por lote, vazão por item"""
+    fn()
+    latencies: List[float] = []
+    op = timed(fn, latencies)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        op()
+    elapsed = time.perf_counter() - start
+    result = summarize(name, "batch", latencies, elapsed, batch_size=batch_size, **extra)
+    result["throughput"] = round(repeat * batch_size / elapsed, 2)
+    return result
+
+
+def sync_benchmarks(api: FakeUpayAPI, args) -> List[Scenario]:
+    upay = UpayClient(api_key="bench", base_url=api.url, pool_maxsize=args.concurrency)
+    codes = [f"PROMO{i}" for i in range(args.concurrency)]
+    pages = {"pages": -(-args.transactions // args.page_size), "items": args.transactions}
+    n, c = args.requests, args.concurrency
+    
+    def create():
+        return upay.payment_links.create(LINK)
+    
+    def list_page():
+        return upay.transactions.list(limit=args.page_size)
+    
+    def iterate():
+        return sum(1 for _ in upay.transactions.iter_all(limit=args.page_size))
+    
+    def iterate_prefetch():
+        return sum(1 for _ in upay.transactions.iter_all(limit=args.page_size, prefetch=True))
+    
+    def list_all():
+        return upay.transactions.list_all(limit=args.page_size, concurrency=c)
+    
+    def validate():
+        return upay.coupons.validate("PROMO10", 10000)
+    
+    def validate_many():
+        return upay.coupons.validate_many(codes, 10000, concurrency=c)
+    
+    return [
+        ("payment_links.create", lambda: run_sequential("payment_links.create", create, n)),
+        ("payment_links.create", lambda: run_threads("payment_links.create", create, n, c)),
+        ("transactions.list", lambda: run_sequential("transactions.list", list_page, n)),
+        ("transactions.list", lambda: run_threads("transactions.list", list_page, n, c)),
+        ("pagination.iter_all", lambda: run_sequential("pagination.iter_all", iterate, args.pagination_runs, **pages)),
+        ("pagination.iter_all(prefetch)", lambda: run_sequential(
+            "pagination.iter_all(prefetch)", iterate_prefetch, args.pagination_runs, **pages
+        )),
+        ("pagination.list_all", lambda: run_sequential("pagination.list_all", list_all, args.pagination_runs, **pages)),
+        ("coupons.validate", lambda: run_sequential("coupons.validate", validate, n)),
+        ("coupons.validate", lambda: run_threads("coupons.validate", validate, n, c)),
+        ("coupons.validate_many", lambda: run_batch(
+            "coupons.validate_many", validate_many, max(1, n // len(codes)), len(codes)
+        )),
+    ]
+
+
+def async_benchmarks(api: FakeUpayAPI, args) -> List[Scenario]:
+    if importlib.util.find_spec("httpx") is None:
+        print("httpx não instalado: pulando os cenários assíncronos\n")
+        return []
+    
+    from upay import AsyncUpayClient
+    pages = {"pages": -(-args.transactions // args.page_size), "items": args.transactions}
+    n, c = args.requests, args.concurrency
+    
+    def scenario(name: str, make_op, count: int, concurrency: int, **extra) -> Scenario:
+        # Um event loop (e um cliente) por cenário
+        async def run():
+            async with AsyncUpayClient(api_key="bench", base_url=api.url, max_connections=c) as upay:
+                return await run_async(name, make_op(upay), count, concurrency, **extra)
+        return name, lambda: asyncio.run(run())
+    
+    async def iterate(upay):
+        return [item async for item in upay.transactions.iter_all(limit=args.page_size)]
+    
+    return [
+        scenario("payment_links.create", lambda upay: lambda: upay.payment_links.create(LINK), n, c),
+        scenario("transactions.list", lambda upay: lambda: upay.transactions.list(limit=args.page_size), n, c),
+        scenario("pagination.iter_all", lambda upay: lambda: iterate(upay), args.pagination_runs, 1, **pages),
+        scenario(
+            "pagination.list_all",
+            lambda upay: lambda: upay.transactions.list_all(limit=args.page_size, concurrency=c),
+            args.pagination_runs,
+            1,
+            **pages
+        ),
+        scenario("coupons.validate", lambda upay: lambda: upay.coupons.validate("PROMO10", 10000), n, c),
+    ]
+
+
+def webhook_benchmarks(args) -> List[Scenario]:
+    secret = "whsec_" + "a" * 32
+    body = json.dumps({
+        "id": "evt_1",
+        "type": "transaction.paid",
+        "data": {"filler": "x" * max(0, args.payload_size - 80)},
+    }).encode()
+    signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    verifier = WebhookVerifier(secret)
+    count = args.requests * 100
+    deliveries = [(body, signature)] * 1000
+    
+    return [
+        ("webhooks.verify", lambda: run_sequential("webhooks.verify", lambda: verifier.verify(body, signature), count)),
+        ("webhooks.verify_many", lambda: run_batch(
+            "webhooks.verify_many",
+            lambda: verifier.verify_many(deliveries),
+            max(1, count // len(deliveries)),
+            len(deliveries)
+        )),
+    ]
+
+
+def print_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    line = (
+        f"{result['name']:<32} {result['mode']:<12} {result['throughput']:>12,.1f} ops/s"
+        f"  p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms"
+    )
+    if baseline:
+        change = (result["throughput"] / baseline["throughput"] - 1) * 100 if baseline["throughput"] else 0.0
+        line += f"  ({change:+.1f}% vazão, p99 antes {baseline['p99_ms']:.3f} ms)"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latência da API falsa por resposta")
+    parser.add_argument("--payload-size", type=int, default=512, help="bytes por item nas respostas")
+    parser.add_argument("--transactions", type=int, default=1000, help="total da listagem paginada")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=300, help="operações por cenário")
+    parser.add_argument("--pagination-runs", type=int, default=5, help="paginações completas por cenário")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--gzip-responses", action="store_true", help="a API falsa compacta as respostas com gzip")
+    parser.add_argument("--only", help="roda só os cenários cujo nome contém este texto")
+    parser.add_argument("--output", help="grava os resultados neste arquivo JSON")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args()
+    
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = {(r["name"], r["mode"]): r for r in json.load(fh)["results"]}
+    
+    results = []
+    
+    with FakeUpayAPI(
+        latency=args.latency_ms / 1000,
+        payload_size=args.payload_size,
+        total_transactions=args.transactions,
+        gzip_responses=args.gzip_responses
+    ) as api:
+        print(
+            f"API falsa em {api.url} (latência {args.latency_ms} ms, itens de "
+            f"~{args.payload_size} bytes{', gzip' if args.gzip_responses else ''}), "
+            f"codec {default_codec().name}\n"
+        )
+        scenarios = sync_benchmarks(api, args) + async_benchmarks(api, args) + webhook_benchmarks(args)
+        for name, run in scenarios:
+            if args.only and args.only not in name:
+                continue
+            result = run()
+            results.append(result)
+            print_result(result, baseline.get((result["name"], result["mode"])))
+    
+    if args.output:
+        report = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "sdk_version": upay.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "codec": default_codec().name,
+            "config": vars(args),
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark da verificação de assinaturas de webhook
+
+Compara verify_webhook_signature (HMAC preparado a cada chamada) com um
+WebhookVerifier reutilizável, com um e com dois secrets ativos.
+
+Uso:
+    python benchmarks/bench_webhooks.py [--payload-size 2048] [--count 50000]
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from upay import WebhookVerifier, verify_webhook_signature  # noqa: E402
+
+
+def make_deliveries(count: int, payload_size: int, secret: str):
+    """Gera pares (payload, assinatura) com corpos JSON do tamanho pedido"""
+    filler = "x" * max(0, payload_size - 80)
+    deliveries = []
+    for i in range(count):
+        body = json.dumps({"id": f"evt_{i}", "type": "transaction.paid", "data": filler}).encode()
+        signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        deliveries.append((memoryview(body), signature))
+    return deliveries
+
+
+def measure(label: str, fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {rate:>12,.0f} webhooks/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payload-size", type=int, default=2048)
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+    
+    secret = "whsec_" + "a" * 32
+    deliveries = make_deliveries(args.count, args.payload_size, secret)
+    single = WebhookVerifier(secret)
+    rotating = WebhookVerifier(["whsec_novo", secret])
+    
+    print(f"{args.count} entregas de {args.payload_size} bytes\n")
+    baseline = measure(
+        "verify_webhook_signature",
+        lambda: [verify_webhook_signature(p, s, secret) for p, s in deliveries],
+        args.count
+    )
+    reused = measure("WebhookVerifier.verify_many", lambda: single.verify_many(deliveries), args.count)
+    measure("WebhookVerifier.verify_many (2 secrets)", lambda: rotating.verify_many(deliveries), args.count)
+    print(f"\nGanho do verificador reutilizável: {reused / baseline:.2f}x")
+    
+    assert all(single.verify_many(deliveries)) and all(rotating.verify_many(deliveries))
+
+
+if __name__ == "__main__":
+    main()
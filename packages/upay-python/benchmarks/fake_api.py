@@ -0,0 +1,289 @@
+"""
+API Upay falsa para os benchmarks
+
+Sobe, no próprio processo, um servidor HTTP/1.1 (keep-alive) que imita os
+endpoints usados pelos benchmarks, com latência e tamanho de resposta
+configuráveis. Não valida a API key nem persiste nada. Aceita corpos com
+Content-Encoding: gzip e, com gzip_responses=True, compacta as respostas
+para clientes que enviam Accept-Encoding: gzip. fail() faz as próximas
+requisições falharem com um status escolhido e headers guarda os headers das
+últimas requisições (usados também pelos testes).
+
+Uso:
+    with FakeUpayAPI(latency=0.02, payload_size=512, total_transactions=1000) as api:
+        upay = UpayClient(api_key="bench", base_url=api.url)
+"""
+
+import gzip
+import json
+import random
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+def make_transaction(i: int, payload_size: int) -> Dict[str, Any]:
+    """Transação no formato da API, com metadata de ~payload_size bytes"""
+    return {
+        "id": f"tx_{i:08d}",
+        "displayId": f"#{i}",
+        "product": "Curso Python",
+        "amountCents": 10000 + i % 500,
+        "status": ("PAID", "PENDING", "CANCELLED")[i % 3],
+        "paymentMethod": ("PIX", "CREDIT_CARD", "BOLETO")[i % 3],
+        "clientId": f"cl_{i % 97:05d}",
+        "client": {
+            "id": f"cl_{i % 97:05d}",
+            "name": "Cliente Benchmark",
+            "email": f"cliente{i % 97}@example.com",
+            "document": "12345678900",
+        },
+        "metadata": {"orderId": f"ord_{i}", "notes": "x" * max(0, payload_size - 400)},
+        "createdAt": "2024-01-01T12:00:00.000Z",
+        "updatedAt": "2024-01-01T12:00:00.000Z",
+    }
+
+
+def make_payment_link(slug: str, payload_size: int) -> Dict[str, Any]:
+    """Link de pagamento no formato da API"""
+    return {
+        "id": f"pl_{slug}",
+        "slug": slug,
+        "title": "Curso Python",
+        "amount": 10000,
+        "status": "ACTIVE",
+        "description": "x" * max(0, payload_size - 300),
+        "createdAt": "2024-01-01T12:00:00.000Z",
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # O padrão (5) recusa conexões quando muitos clientes conectam juntos
+    request_queue_size = 1024
+
+
+class FakeUpayAPI:
+    """Servidor em thread própria que responde como a API Upay"""
+    
+    def __init__(
+        self,
+        latency: float = 0.0,
+        payload_size: int = 512,
+        total_transactions: int = 1000,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        gzip_responses: bool = False,
+        tail_latency: float = 0.0,
+        tail_ratio: float = 0.0
+    ):
+        """
+        Args:
+            latency: Atraso (segundos) acrescentado a cada resposta
+            payload_size: Tamanho aproximado (bytes) de cada item retornado
+            total_transactions: Total de transações da listagem paginada
+            host: Endereço de escuta
+            port: Porta (0 escolhe uma livre)
+            gzip_responses: Compacta as respostas (nível 6) quando o cliente
+                aceita gzip
+            tail_latency: Atraso extra (segundos) das respostas lentas
+            tail_ratio: Fração das respostas que recebem tail_latency
+        """
+        self.latency = latency
+        self.payload_size = payload_size
+        self.total_transactions = total_transactions
+        self.gzip_responses = gzip_responses
+        self.tail_latency = tail_latency
+        self.tail_ratio = tail_ratio
+        self.requests = 0
+        # Bytes de corpo recebidos e enviados, como trafegaram
+        self.bytes_in = 0
+        self.bytes_out = 0
+        # Corpos recebidos em POST /products e /clients
+        self.created: List[Dict[str, Any]] = []
+        # Headers das últimas requisições, na ordem de chegada
+        self.headers: Deque[Dict[str, str]] = deque(maxlen=1000)
+        self._failures: List[Any] = []
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "FakeUpayAPI":
+        # Com o intervalo padrão (0,5 s), stop() demora até meio segundo
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-upay",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self) -> "FakeUpayAPI":
+        return self.start()
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
+    
+    def fail(self, status: int, times: int = 1, retry_after: Optional[float] = None) -> None:
+        """
+        Faz as próximas requisições falharem
+        
+        Args:
+            status: Status HTTP das respostas de erro
+            times: Quantas requisições seguidas falham
+            retry_after: Valor do header Retry-After (None não envia)
+        """
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * times)
+    
+    def _next_failure(self, headers: Dict[str, str]) -> Optional[Any]:
+        with self._lock:
+            self.requests += 1
+            self.headers.append(headers)
+            return self._failures.pop(0) if self._failures else None
+    
+    def _handler(self) -> type:
+        api = self
+        
+        # Corpos pré-serializados: o servidor não deve ser o gargalo
+        @lru_cache(maxsize=1024)
+        def transactions_page(page: int, limit: int) -> bytes:
+            start = (page - 1) * limit
+            items = [
+                make_transaction(i, api.payload_size)
+                for i in range(start, min(start + limit, api.total_transactions))
+            ]
+            return json.dumps({
+                "message": "ok",
+                "transactions": items,
+                "pagination": {
+                    "total": api.total_transactions,
+                    "page": page,
+                    "limit": limit,
+                    "totalPages": -(-api.total_transactions // limit),
+                },
+            }).encode()
+        
+        @lru_cache(maxsize=1024)
+        def transaction(i: int) -> bytes:
+            return json.dumps(make_transaction(i, api.payload_size)).encode()
+        
+        @lru_cache(maxsize=1024)
+        def gzipped(body: bytes) -> bytes:
+            return gzip.compress(body, 6)
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers e corpo saem em escritas separadas; sem isto o Nagle
+            # somado ao ACK atrasado do cliente acrescenta ~40 ms por resposta
+            disable_nagle_algorithm = True
+            
+            def log_message(self, format, *args):
+                pass
+            
+            def _reply(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+                delay = api.latency
+                if api.tail_ratio and random.random() < api.tail_ratio:
+                    delay += api.tail_latency
+                if delay:
+                    time.sleep(delay)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if api.gzip_responses and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzipped(body)
+                    self.send_header("Content-Encoding", "gzip")
+                api.bytes_out += len(body)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def _read_body(self) -> Dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                if not length:
+                    return {}
+                api.bytes_in += length
+                body = self.rfile.read(length)
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                return json.loads(body)
+            
+            def _fail(self) -> bool:
+                """Responde com a próxima falha programada, se houver"""
+                failure = api._next_failure(dict(self.headers))
+                if failure is None:
+                    return False
+                status, retry_after = failure
+                headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+                self._reply(status, json.dumps({"message": f"Erro {status}"}).encode(), headers)
+                return True
+            
+            def do_GET(self):
+                if self._fail():
+                    return
+                url = urlparse(self.path)
+                if url.path == "/api/v1/transactions":
+                    query = parse_qs(url.query)
+                    page = int(query.get("page", ["1"])[0])
+                    limit = int(query.get("limit", ["10"])[0])
+                    return self._reply(200, transactions_page(page, limit))
+                if url.path.startswith("/api/v1/transactions/"):
+                    digits = "".join(c for c in url.path.rsplit("/", 1)[-1] if c.isdigit())
+                    return self._reply(200, transaction(int(digits or 0)))
+                if url.path.startswith("/api/v1/payment-links/slug/"):
+                    # Como a API real, devolve o link dentro de { message, paymentLink }
+                    slug = url.path.rsplit("/", 1)[-1]
+                    return self._reply(200, json.dumps({
+                        "message": "ok",
+                        "paymentLink": make_payment_link(slug, api.payload_size),
+                    }).encode())
+                self._reply(404, b'{"message": "Not found"}')
+            
+            def do_POST(self):
+                path = urlparse(self.path).path
+                data = self._read_body()
+                if self._fail():
+                    return
+                if path == "/api/v1/payment-links":
+                    link = dict(
+                        data,
+                        id=f"pl_{api.requests:08d}",
+                        slug=f"link-{api.requests}",
+                        description="x" * max(0, api.payload_size - 300),
+                        createdAt="2024-01-01T12:00:00.000Z",
+                    )
+                    return self._reply(201, json.dumps({"message": "ok", "data": link}).encode())
+                if path in ("/api/v1/products", "/api/v1/clients"):
+                    with api._lock:
+                        api.created.append(data)
+                        item = dict(data, id=f"{path.rsplit('/', 1)[-1][:2]}_{len(api.created):08d}")
+                    return self._reply(201, json.dumps({"message": "ok", "data": item}).encode())
+                if path == "/api/coupons/validate":
+                    amount = data.get("amountCents", 0)
+                    valid = not data.get("code", "").startswith("INVALID")
+                    discount = amount // 10 if valid else 0
+                    return self._reply(200, json.dumps({
+                        "valid": valid,
+                        "discountAmount": discount,
+                        "finalAmount": amount - discount,
+                        "coupon": {"discountPercentage": 10} if valid else {},
+                        "error": None if valid else "Cupom inválido",
+                    }).encode())
+                self._reply(404, b'{"message": "Not found"}')
+        
+        return Handler
@@ -34,6 +34,12 @@ setup(
     install_requires=[
         "requests>=2.28.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "fast": ["orjson>=3.6.0"],
+        "otel": ["opentelemetry-api>=1.20.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+    },
     keywords="upay payment pix boleto credit-card gateway sdk python",
     project_urls={
         "Bug Reports": "https://github.com/anthonymengottii/upay-sdks/issues",
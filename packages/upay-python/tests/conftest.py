@@ -0,0 +1,33 @@
+"""
+Fixtures dos testes offline
+
+Os testes rodam contra a API falsa dos benchmarks (benchmarks/fake_api.py),
+que sobe no próprio processo; nenhum acesso à API real é necessário.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from fake_api import FakeUpayAPI  # noqa: E402
+from upay import RetryPolicy, UpayClient  # noqa: E402
+
+
+@pytest.fixture
+def api():
+    """API falsa rodando numa porta livre"""
+    with FakeUpayAPI() as server:
+        yield server
+
+
+@pytest.fixture
+def client(api):
+    """Cliente síncrono apontado para a API falsa, sem retries nem rate limit"""
+    upay = UpayClient(api_key="test", base_url=api.url, retry_policy=RetryPolicy(max_attempts=1))
+    yield upay
+    upay.close()
@@ -0,0 +1,63 @@
+"""
+Teste de fumaça do AsyncUpayClient contra a API falsa (pulado sem httpx)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from upay import AsyncUpayClient, RetryPolicy, UpayNotFoundError
+
+pytest.importorskip("httpx")
+
+
+def make_client(api):
+    return AsyncUpayClient(api_key="test", base_url=api.url, retry_policy=RetryPolicy(max_attempts=1))
+
+
+def test_async_client_smoke(api):
+    async def run():
+        async with make_client(api) as upay:
+            tx = await upay.transactions.get("tx_00000005")
+            page = await upay.transactions.list(page=1, limit=10)
+            link = await upay.payment_links.create({"title": "Curso Python", "amount": 10000})
+            by_slug = await upay.payment_links.get_by_slug("curso-python")
+            coupon = await upay.coupons.validate("PROMO10", 10000)
+            return tx, page, link, by_slug, coupon
+    
+    tx, page, link, by_slug, coupon = asyncio.run(run())
+    
+    assert tx["id"] == "tx_00000005"
+    assert len(page["data"]) == 10
+    assert link["title"] == "Curso Python"
+    assert by_slug["slug"] == "curso-python"
+    assert coupon["valid"] is True
+    assert all(headers.get("Authorization") == "Bearer test" for headers in list(api.headers)[:4])
+
+
+def test_async_concurrent_requests_share_the_pool(api):
+    api.latency = 0.1
+    
+    async def run():
+        async with make_client(api) as upay:
+            return await asyncio.gather(*(upay.transactions.get(f"tx_{i:08d}") for i in range(20)))
+    
+    started = time.perf_counter()
+    results = asyncio.run(run())
+    
+    # Em sequência seriam 2 s
+    assert time.perf_counter() - started < 1.0
+    assert [tx["id"] for tx in results] == [f"tx_{i:08d}" for i in range(20)]
+    assert api.requests == 20
+
+
+def test_async_errors_are_raised(api):
+    api.fail(404)
+    
+    async def run():
+        async with make_client(api) as upay:
+            await upay.transactions.get("tx_00000001")
+    
+    with pytest.raises(UpayNotFoundError):
+        asyncio.run(run())
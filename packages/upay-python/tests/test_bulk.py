@@ -0,0 +1,61 @@
+"""
+Testes de bulk_create/bulk_update com falhas parciais
+"""
+
+import asyncio
+
+import pytest
+
+from upay import AsyncUpayClient, UpayNotFoundError
+from upay.bulk import run_bulk
+
+
+def test_invalid_items_do_not_stop_the_batch(client, api):
+    items = [
+        {"name": "Camiseta", "price": 5990},
+        {"name": "Caneca", "price": "abc"},  # TypeError na validação
+        None,  # AttributeError na validação
+        {"name": "", "price": 1000},  # ValueError na validação
+        {"name": "Boné", "price": 3990},
+    ]
+    
+    results = client.products.bulk_create(items, concurrency=4)
+    
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["success"] for r in results] == [True, False, False, False, True]
+    assert isinstance(results[1]["error"], TypeError)
+    assert isinstance(results[2]["error"], AttributeError)
+    assert isinstance(results[3]["error"], ValueError)
+    assert results[0]["data"]["data"]["name"] == "Camiseta"
+    # Só os itens válidos chegaram à API
+    assert sorted(item["name"] for item in api.created) == ["Boné", "Camiseta"]
+
+
+def test_api_error_is_kept_in_the_item_result(client, api):
+    api.fail(404)
+    
+    results = client.clients.bulk_create(
+        [{"name": "Maria", "email": "maria@example.com"}],
+        concurrency=1
+    )
+    
+    assert results[0]["success"] is False
+    assert isinstance(results[0]["error"], UpayNotFoundError)
+
+
+def test_async_bulk_create_with_invalid_items(api):
+    async def run():
+        async with AsyncUpayClient(api_key="test", base_url=api.url) as upay:
+            return await upay.products.bulk_create(
+                [{"name": "Camiseta", "price": 5990}, {"name": "Caneca", "price": "abc"}, None]
+            )
+    
+    results = asyncio.run(run())
+    
+    assert [r["success"] for r in results] == [True, False, False]
+    assert [item["name"] for item in api.created] == ["Camiseta"]
+
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        run_bulk([{}], lambda item: None, lambda item: item, concurrency=0)
@@ -0,0 +1,109 @@
+"""
+Testes do cache de leitura (TTL, LRU e invalidação)
+"""
+
+import pytest
+
+from upay import ReadCache, RetryPolicy, UpayClient
+from upay import cache as cache_module
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Relógio controlado pelo teste no lugar de time.monotonic"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = ReadCache(ttl=10, ttl_by_resource={"products": 60})
+    cache.store("payment_links", ("id", "pl_1"), "link")
+    cache.store("products", ("id", "pr_1"), "produto")
+    
+    clock[0] += 11
+    
+    assert cache.lookup("payment_links", ("id", "pl_1")) == (False, None)
+    assert cache.lookup("products", ("id", "pr_1")) == (True, "produto")
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ReadCache(maxsize=2)
+    cache.store("products", "a", 1)
+    cache.store("products", "b", 2)
+    cache.lookup("products", "a")
+    
+    cache.store("products", "c", 3)
+    
+    assert cache.lookup("products", "b") == (False, None)
+    assert cache.lookup("products", "a") == (True, 1)
+    assert cache.lookup("products", "c") == (True, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_counters():
+    cache = ReadCache()
+    cache.lookup("products", "a")
+    cache.store("products", "a", 1, tags=("pr_1",))
+    cache.lookup("products", "a")
+    cache.invalidate("products", "pr_1")
+    
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "invalidations": 1,
+        "size": 0,
+    }
+
+
+def test_invalidate_removes_every_entry_of_the_object():
+    cache = ReadCache()
+    cache.store("payment_links", ("id", "pl_1"), "link", tags=("pl_1",))
+    cache.store("payment_links", ("slug", "promo"), "link", tags=("pl_1",))
+    cache.store("payment_links", ("id", "pl_2"), "outro", tags=("pl_2",))
+    
+    cache.invalidate("payment_links", "pl_1")
+    
+    assert cache.lookup("payment_links", ("id", "pl_1")) == (False, None)
+    assert cache.lookup("payment_links", ("slug", "promo")) == (False, None)
+    assert cache.lookup("payment_links", ("id", "pl_2")) == (True, "outro")
+
+
+def test_store_skips_a_value_invalidated_during_the_fetch():
+    cache = ReadCache()
+    generation = cache.generation()
+    # Um update() do mesmo link termina enquanto o get() ainda busca
+    cache.invalidate("payment_links", "pl_1")
+    
+    cache.store("payment_links", ("slug", "promo"), "velho", tags=("pl_1",), generation=generation)
+    cache.store("payment_links", ("id", "pl_2"), "outro", tags=("pl_2",), generation=generation)
+    
+    assert cache.lookup("payment_links", ("slug", "promo")) == (False, None)
+    assert cache.lookup("payment_links", ("id", "pl_2")) == (True, "outro")
+
+
+def test_store_skips_when_the_invalidation_history_was_dropped():
+    cache = ReadCache(maxsize=1)
+    generation = cache.generation()
+    cache.invalidate("products", "pr_1")
+    cache.invalidate("products", "pr_2")
+    
+    cache.store("products", ("id", "pr_3"), "produto", tags=("pr_3",), generation=generation)
+    
+    assert cache.lookup("products", ("id", "pr_3")) == (False, None)
+
+
+def test_invalidated_link_is_fetched_again(api):
+    cache = ReadCache()
+    upay = UpayClient(api_key="test", base_url=api.url, cache=cache, retry_policy=RetryPolicy(max_attempts=1))
+    
+    first = upay.payment_links.get_by_slug("promo")
+    assert upay.payment_links.get_by_slug("promo") is first
+    cache.invalidate("payment_links", first["id"])
+    
+    assert upay.payment_links.get_by_slug("promo") is not first
+    assert api.requests == 2
+    upay.close()
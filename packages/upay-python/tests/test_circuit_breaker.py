@@ -0,0 +1,162 @@
+"""
+Testes do circuit breaker (transições closed -> open -> half_open -> closed)
+"""
+
+import time
+
+import pytest
+
+from upay import (
+    CircuitBreaker,
+    Hooks,
+    RetryPolicy,
+    UpayCircuitOpenError,
+    UpayClient,
+    UpayNotFoundError,
+    UpayServerError,
+)
+from upay.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+
+
+def make_client(api, breaker, **kwargs):
+    return UpayClient(
+        api_key="test",
+        base_url=api.url,
+        circuit_breaker=breaker,
+        retry_policy=RetryPolicy(max_attempts=1),
+        **kwargs
+    )
+
+
+def call(upay, tx_id="tx_00000001"):
+    try:
+        return upay.transactions.get(tx_id)
+    except Exception as e:
+        return e
+
+
+def test_opens_after_failure_rate_and_fails_fast(api):
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, probe_interval=60)
+    upay = make_client(api, breaker)
+    api.fail(503, times=2)
+    
+    results = [call(upay) for _ in range(4)]
+    
+    assert [type(r).__name__ for r in results] == ["UpayServerError", "UpayServerError", "dict", "dict"]
+    assert breaker.state("transactions") == OPEN
+    
+    with pytest.raises(UpayCircuitOpenError) as info:
+        upay.transactions.get("tx_00000001")
+    assert api.requests == 4  # a chamada barrada não chegou à API
+    assert 0 < info.value.retry_after <= 60
+    assert info.value.code == "CIRCUIT_OPEN"
+    assert info.value.status == 503
+    # Outros grupos não são afetados
+    assert breaker.state("payment-links") == CLOSED
+
+
+def test_half_open_probe_success_closes_the_circuit(api):
+    breaker = CircuitBreaker(window=2, min_calls=2, probe_interval=0.1)
+    upay = make_client(api, breaker)
+    api.fail(503, times=2)
+    call(upay)
+    call(upay)
+    assert breaker.state("transactions") == OPEN
+    
+    time.sleep(0.15)
+    assert breaker.state("transactions") == HALF_OPEN
+    
+    assert call(upay)["id"] == "tx_00000001"
+    assert breaker.state("transactions") == CLOSED
+
+
+def test_half_open_probe_failure_reopens_the_circuit(api):
+    breaker = CircuitBreaker(window=2, min_calls=2, probe_interval=0.1)
+    upay = make_client(api, breaker)
+    api.fail(503, times=3)
+    call(upay)
+    call(upay)
+    time.sleep(0.15)
+    
+    assert isinstance(call(upay), UpayServerError)
+    assert breaker.state("transactions") == OPEN
+    assert isinstance(call(upay), UpayCircuitOpenError)
+
+
+def test_only_one_probe_at_a_time():
+    breaker = CircuitBreaker(window=1, min_calls=1, probe_interval=0.05)
+    breaker.after_call("transactions", False, True, 0.01)
+    time.sleep(0.06)
+    
+    assert breaker.before_call("transactions") is True
+    with pytest.raises(UpayCircuitOpenError):
+        breaker.before_call("transactions")
+
+
+def test_client_errors_do_not_count_as_failures(api):
+    breaker = CircuitBreaker(window=3, min_calls=3)
+    upay = make_client(api, breaker)
+    api.fail(404, times=3)
+    
+    results = [call(upay) for _ in range(3)]
+    
+    assert all(isinstance(r, UpayNotFoundError) for r in results)
+    assert breaker.state("transactions") == CLOSED
+
+
+def test_slow_calls_open_the_circuit(api):
+    api.latency = 0.05
+    breaker = CircuitBreaker(slow_call_duration=0.03, slow_call_rate=0.5, window=2, min_calls=2)
+    upay = make_client(api, breaker)
+    
+    call(upay)
+    call(upay)
+    
+    assert breaker.state("transactions") == OPEN
+
+
+def test_state_changes_reach_listeners_and_hooks(api):
+    changes, hooked = [], []
+    
+    class CircuitHooks(Hooks):
+        def on_circuit_state_change(self, group, old_state, new_state):
+            hooked.append((group, old_state, new_state))
+    
+    breaker = CircuitBreaker(window=1, min_calls=1, probe_interval=0.05)
+    breaker.add_listener(lambda *event: changes.append(event))
+    upay = make_client(api, breaker, hooks=[CircuitHooks()])
+    api.fail(500)
+    call(upay)
+    time.sleep(0.06)
+    call(upay)
+    
+    expected = [
+        ("transactions", CLOSED, OPEN),
+        ("transactions", OPEN, HALF_OPEN),
+        ("transactions", HALF_OPEN, CLOSED),
+    ]
+    assert changes == expected
+    assert hooked == expected
+
+
+def test_stats_and_reset():
+    breaker = CircuitBreaker(window=4, min_calls=4)
+    for failed in (True, False, False):
+        breaker.after_call("clients", False, failed, 0.01)
+    
+    stats = breaker.stats()["clients"]
+    assert stats["state"] == CLOSED
+    assert stats["calls"] == 3
+    assert stats["failure_rate"] == pytest.approx(1 / 3)
+    
+    breaker.reset()
+    assert breaker.stats() == {}
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(window=5, min_calls=6)
+    with pytest.raises(ValueError):
+        CircuitBreaker(half_open_calls=0)
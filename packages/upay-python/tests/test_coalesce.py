@@ -0,0 +1,147 @@
+"""
+Testes do agrupamento de GETs simultâneos (single-flight)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from upay import AsyncUpayClient, RetryPolicy, UpayClient, UpayNotFoundError
+from upay.coalesce import AsyncSingleFlight, SingleFlight
+
+
+def make_client(api):
+    return UpayClient(
+        api_key="test",
+        base_url=api.url,
+        coalesce_requests=True,
+        retry_policy=RetryPolicy(max_attempts=1)
+    )
+
+
+def concurrently(fn, count):
+    """Chama fn() em `count` threads liberadas ao mesmo tempo"""
+    barrier = threading.Barrier(count)
+    
+    def call(_):
+        barrier.wait()
+        try:
+            return fn()
+        except Exception as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(call, range(count)))
+
+
+def test_identical_gets_share_one_request(api):
+    api.latency = 0.2
+    upay = make_client(api)
+    
+    results = concurrently(lambda: upay.transactions.get("tx_00000001"), 10)
+    
+    assert api.requests == 1
+    assert all(result is results[0] for result in results)
+    assert upay.coalescing_stats() == {"requests": 1, "coalesced": 9}
+    upay.close()
+
+
+def test_different_urls_are_not_coalesced(api):
+    api.latency = 0.1
+    upay = make_client(api)
+    ids = iter(range(4))
+    lock = threading.Lock()
+    
+    def get():
+        with lock:
+            i = next(ids)
+        return upay.transactions.get(f"tx_{i:08d}")
+    
+    results = concurrently(get, 4)
+    
+    assert api.requests == 4
+    assert sorted(result["id"] for result in results) == [f"tx_{i:08d}" for i in range(4)]
+    upay.close()
+
+
+def test_errors_are_shared_too(api):
+    api.latency = 0.2
+    api.fail(404)
+    upay = make_client(api)
+    
+    results = concurrently(lambda: upay.transactions.get("tx_00000001"), 5)
+    
+    assert api.requests == 1
+    assert all(isinstance(result, UpayNotFoundError) for result in results)
+    upay.close()
+
+
+def test_later_calls_send_a_new_request(api):
+    upay = make_client(api)
+    
+    upay.transactions.get("tx_00000001")
+    upay.transactions.get("tx_00000001")
+    
+    assert api.requests == 2
+    upay.close()
+
+
+def test_posts_are_never_coalesced(api):
+    api.latency = 0.1
+    upay = make_client(api)
+    
+    concurrently(lambda: upay.products.create({"name": "Caneca", "price": 2990}), 3)
+    
+    assert len(api.created) == 3
+    upay.close()
+
+
+def test_single_flight_releases_the_key_after_an_error():
+    flight = SingleFlight()
+    
+    def fail():
+        raise RuntimeError("falhou")
+    
+    with pytest.raises(RuntimeError):
+        flight.do("k", fail)
+    
+    assert flight.do("k", lambda: 42) == 42
+
+
+def test_async_identical_gets_share_one_request(api):
+    api.latency = 0.2
+    
+    async def run():
+        async with AsyncUpayClient(api_key="test", base_url=api.url, coalesce_requests=True) as upay:
+            results = await asyncio.gather(*(upay.transactions.get("tx_00000001") for _ in range(10)))
+            return results, upay.coalescing_stats()
+    
+    results, stats = asyncio.run(run())
+    
+    assert api.requests == 1
+    assert {result["id"] for result in results} == {"tx_00000001"}
+    assert stats == {"requests": 1, "coalesced": 9}
+
+
+def test_async_cancelling_the_leader_does_not_cancel_followers():
+    flight = AsyncSingleFlight()
+    
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "ok"
+    
+    async def run():
+        leader = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower, leader.cancelled()
+    
+    result, leader_cancelled = asyncio.run(run())
+    
+    assert result == "ok"
+    assert leader_cancelled
+    assert flight.stats() == {"requests": 1, "coalesced": 1}
@@ -0,0 +1,56 @@
+"""
+Testes dos codecs JSON (biblioteca padrão e orjson)
+"""
+
+import math
+
+import pytest
+
+from upay.codec import OrjsonCodec, StdlibCodec
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonCodec()
+    return StdlibCodec()
+
+
+def test_round_trip(codec):
+    obj = {"name": "Caneca", "price": 2990, "tags": ["café", None], "active": True}
+    
+    data = codec.encode(obj)
+    
+    assert isinstance(data, bytes)
+    assert codec.decode(data) == obj
+    assert codec.decode(memoryview(data)) == obj
+    assert codec.decode(data.decode("utf-8")) == obj
+
+
+def test_non_str_keys_become_strings(codec):
+    assert codec.decode(codec.encode({1: "a", 2.5: "b", None: "c"})) == {"1": "a", "2.5": "b", "null": "c"}
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_floats_become_null(codec, value):
+    assert codec.decode(codec.encode({"amount": value, "items": [value, 1.5]})) == {
+        "amount": None,
+        "items": [None, 1.5],
+    }
+
+
+def test_integers_beyond_64_bits_are_encoded(codec):
+    assert codec.decode(codec.encode({"big": 2 ** 70})) == {"big": 2 ** 70}
+
+
+def test_decode_rejects_invalid_json(codec):
+    with pytest.raises(ValueError):
+        codec.decode(b"<html>")
+
+
+def test_both_codecs_produce_the_same_bytes():
+    pytest.importorskip("orjson")
+    obj = {"b": [1, 2.5, "ç"], "a": {"x": None, 3: math.nan}}
+    
+    assert OrjsonCodec().encode(obj) == StdlibCodec().encode(obj)
@@ -0,0 +1,107 @@
+"""
+Testes da compressão gzip dos corpos enviados e das respostas
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from fake_api import FakeUpayAPI
+from upay import AsyncUpayClient, RetryPolicy, UpayClient
+from upay.compression import accept_encoding, compress_body
+
+PRODUCT = {"name": "Caneca", "price": 2990, "description": "Caneca de cerâmica " * 100}
+
+
+def make_client(url, **kwargs):
+    return UpayClient(api_key="test", base_url=url, retry_policy=RetryPolicy(max_attempts=1), **kwargs)
+
+
+@pytest.fixture
+def gzip_api():
+    """API falsa que compacta as respostas"""
+    with FakeUpayAPI(gzip_responses=True, payload_size=4096) as server:
+        yield server
+
+
+def test_compress_body_respects_the_threshold():
+    payload = b'{"a": "' + b"x" * 100 + b'"}'
+    headers = {"Content-Type": "application/json"}
+    
+    assert compress_body(payload, headers, None) == (payload, headers)
+    assert compress_body(payload, headers, len(payload) + 1) == (payload, headers)
+    assert compress_body(None, headers, 0) == (None, headers)
+    
+    body, compressed_headers = compress_body(payload, headers, len(payload))
+    
+    assert gzip.decompress(body) == payload
+    assert compressed_headers == {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    # Os headers recebidos não são alterados
+    assert headers == {"Content-Type": "application/json"}
+
+
+def test_large_bodies_are_sent_compressed(api):
+    upay = make_client(api.url, gzip_threshold=1024)
+    
+    upay.products.create(PRODUCT)
+    
+    assert api.created == [PRODUCT]
+    assert api.headers[-1].get("Content-Encoding") == "gzip"
+    assert api.bytes_in < len(json.dumps(PRODUCT).encode("utf-8")) / 4
+    upay.close()
+
+
+def test_small_bodies_are_sent_as_is(api):
+    upay = make_client(api.url, gzip_threshold=1024)
+    
+    upay.products.create({"name": "Caneca", "price": 2990})
+    
+    assert "Content-Encoding" not in api.headers[-1]
+    assert api.created == [{"name": "Caneca", "price": 2990}]
+    upay.close()
+
+
+def test_compression_is_off_by_default(api):
+    upay = make_client(api.url)
+    
+    upay.products.create(PRODUCT)
+    
+    assert "Content-Encoding" not in api.headers[-1]
+    upay.close()
+
+
+def test_gzip_responses_are_decoded(gzip_api):
+    upay = make_client(gzip_api.url)
+    
+    page = upay.transactions.list(page=1, limit=20)
+    
+    assert len(page["data"]) == 20
+    assert "gzip" in gzip_api.headers[-1]["Accept-Encoding"]
+    assert "gzip" in accept_encoding()
+    # ~20 transações de 4 KB quase todas repetidas viram poucos KB
+    assert gzip_api.bytes_out < 20 * 4096 / 10
+    upay.close()
+
+
+def test_async_gzip_request_and_response(gzip_api):
+    pytest.importorskip("httpx")
+    
+    async def run():
+        async with AsyncUpayClient(
+            api_key="test",
+            base_url=gzip_api.url,
+            gzip_threshold=1024,
+            retry_policy=RetryPolicy(max_attempts=1)
+        ) as upay:
+            product = await upay.products.create(PRODUCT)
+            tx = await upay.transactions.get("tx_00000001")
+            return product, tx
+    
+    product, tx = asyncio.run(run())
+    
+    assert product["data"]["name"] == "Caneca"
+    assert tx["id"] == "tx_00000001"
+    assert gzip_api.created == [PRODUCT]
+    assert gzip_api.headers[0].get("Content-Encoding") == "gzip"
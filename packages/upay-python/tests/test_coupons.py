@@ -0,0 +1,108 @@
+"""
+Testes da validação de cupons (validate, memo e validate_many)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from upay import AsyncUpayClient, Hooks, RetryPolicy, UpayClient
+
+
+class Endpoints(Hooks):
+    def __init__(self):
+        self.endpoints = []
+    
+    def on_request(self, info):
+        self.endpoints.append(info.endpoint)
+
+
+def make_client(api, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=3, backoff_base=0.001))
+    return UpayClient(api_key="test", base_url=api.url, **kwargs)
+
+
+def test_validate_goes_without_authorization(api):
+    upay = make_client(api)
+    
+    result = upay.coupons.validate("PROMO10", 10000)
+    
+    assert result["valid"] is True
+    assert result["discountCents"] == 1000
+    assert result["finalAmountCents"] == 9000
+    assert "Authorization" not in api.headers[-1]
+    upay.close()
+
+
+def test_validate_uses_retries_and_hooks(api):
+    hooks = Endpoints()
+    upay = make_client(api, hooks=[hooks])
+    api.fail(503)
+    
+    assert upay.coupons.validate("PROMO10", 10000)["valid"] is True
+    assert api.requests == 2
+    assert hooks.endpoints == ["/api/coupons/validate"] * 2
+    upay.close()
+
+
+def test_memo_reuses_results_per_code_amount_and_products(api):
+    upay = make_client(api, coupon_cache_ttl=60)
+    
+    first = upay.coupons.validate("PROMO10", 10000, ["pr_2", "pr_1"])
+    again = upay.coupons.validate("PROMO10", 10000, ["pr_1", "pr_2"])
+    upay.coupons.validate("PROMO10", 20000, ["pr_1", "pr_2"])
+    
+    assert again is first
+    assert api.requests == 2
+    upay.close()
+
+
+def test_without_memo_every_call_hits_the_api(api):
+    upay = make_client(api)
+    
+    upay.coupons.validate("PROMO10", 10000)
+    upay.coupons.validate("PROMO10", 10000)
+    
+    assert api.requests == 2
+    upay.close()
+
+
+def test_validate_many_keeps_the_order(api):
+    upay = make_client(api)
+    codes = ["PROMO10", "INVALID", "", "FRETE"]
+    
+    results = upay.coupons.validate_many(codes, 10000)
+    
+    assert [result["code"] for result in results] == codes
+    assert [result["valid"] for result in results] == [True, False, False, True]
+    # O código vazio falha antes de ir à API, sem interromper os demais
+    assert results[2]["message"] == "Código do cupom é obrigatório"
+    assert api.requests == 3
+    upay.close()
+
+
+def test_validate_many_runs_in_parallel(api):
+    api.latency = 0.2
+    upay = make_client(api)
+    
+    started = time.perf_counter()
+    upay.coupons.validate_many([f"PROMO{i}" for i in range(4)], 10000, concurrency=4)
+    
+    assert time.perf_counter() - started < 0.6
+    upay.close()
+
+
+def test_async_validate_many_keeps_the_order(api):
+    pytest.importorskip("httpx")
+    codes = ["PROMO10", "INVALID", "FRETE"]
+    
+    async def run():
+        async with AsyncUpayClient(api_key="test", base_url=api.url) as upay:
+            return await upay.coupons.validate_many(codes, 10000, concurrency=2)
+    
+    results = asyncio.run(run())
+    
+    assert [result["code"] for result in results] == codes
+    assert [result["valid"] for result in results] == [True, False, True]
+    assert all("Authorization" not in headers for headers in api.headers)
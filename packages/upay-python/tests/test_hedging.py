@@ -0,0 +1,140 @@
+"""
+Testes do hedging de GETs (HedgingPolicy e HttpClient._hedged_send)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from upay import HedgingPolicy, RetryPolicy, UpayClient
+from upay.transport import Transport, TransportResponse
+
+
+class ScriptedTransport(Transport):
+    """Cada chamada usa o próximo (atraso, status) do roteiro"""
+    
+    def __init__(self, script):
+        self.script = list(script)
+        self.calls = 0
+        self._lock = threading.Lock()
+    
+    def send(self, method, url, payload, headers, timeout):
+        with self._lock:
+            delay, status = self.script[self.calls]
+            self.calls += 1
+        time.sleep(delay)
+        body = b'{"id": "tx_1", "status": %d}' % status
+        return TransportResponse(status, "", {}, body)
+
+
+def make_client(transport, policy):
+    return UpayClient(
+        api_key="test",
+        base_url="http://upay.invalid",
+        transport=transport,
+        hedging_policy=policy,
+        retry_policy=RetryPolicy(max_attempts=1)
+    )
+
+
+def test_budget_accounting():
+    policy = HedgingPolicy(budget=0.5, burst=2)
+    
+    # O orçamento começa vazio
+    assert policy.try_hedge() is False
+    
+    # Cada requisição elegível acrescenta `budget` fichas
+    policy.on_request()
+    assert policy.try_hedge() is False
+    policy.on_request()
+    assert policy.try_hedge() is True
+    
+    # As fichas não passam de burst
+    for _ in range(10):
+        policy.on_request()
+    assert [policy.try_hedge() for _ in range(3)] == [True, True, False]
+    
+    assert policy.stats() == {"requests": 12, "hedged": 3, "hedge_wins": 0, "budget_denied": 3}
+
+
+def test_slow_primary_is_hedged_and_the_hedge_wins():
+    transport = ScriptedTransport([(0.5, 200), (0.0, 200)])
+    # budget=1: a primeira requisição já rende uma ficha
+    upay = make_client(transport, HedgingPolicy(delay=0.05, budget=1.0))
+    
+    started = time.perf_counter()
+    upay.transactions.get("tx_1")
+    
+    assert time.perf_counter() - started < 0.4
+    assert upay.hedging_stats() == {"requests": 1, "hedged": 1, "hedge_wins": 1, "budget_denied": 0}
+
+
+def test_exhausted_budget_waits_for_the_primary():
+    transport = ScriptedTransport([(0.2, 200)])
+    upay = make_client(transport, HedgingPolicy(delay=0.05, budget=0.0, burst=0))
+    
+    upay.transactions.get("tx_1")
+    
+    assert transport.calls == 1
+    assert upay.hedging_stats() == {"requests": 1, "hedged": 0, "hedge_wins": 0, "budget_denied": 1}
+
+
+def test_server_error_does_not_win_the_race():
+    # A primeira responde 503 antes da segunda responder 200
+    transport = ScriptedTransport([(0.1, 503), (0.2, 200)])
+    upay = make_client(transport, HedgingPolicy(delay=0.05, budget=1.0))
+    
+    result = upay.transactions.get("tx_1")
+    
+    assert result["status"] == 200
+    assert upay.hedging_stats()["hedge_wins"] == 1
+
+
+def test_only_the_primary_latency_is_recorded():
+    transport = ScriptedTransport([(0.3, 200), (0.0, 200)])
+    policy = HedgingPolicy(delay=0.05, budget=1.0)
+    upay = make_client(transport, policy)
+    
+    upay.transactions.get("tx_1")
+    # Espera a primeira requisição (perdedora) terminar
+    time.sleep(0.4)
+    
+    (window,) = policy._windows.values()
+    assert len(window.samples) == 1
+    assert window.samples[0] >= 0.3
+    upay.close()
+
+
+def test_async_cancelled_copy_does_not_break_the_race():
+    httpx = pytest.importorskip("httpx")
+    from upay.async_http import AsyncHttpClient
+    
+    class FakeClient:
+        """A primeira requisição demora; a cópia é cancelada no meio"""
+        
+        def __init__(self):
+            self.calls = 0
+        
+        async def request(self, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                await asyncio.sleep(0.1)
+                return httpx.Response(200)
+            asyncio.current_task().cancel()
+            await asyncio.sleep(1)
+    
+    async def run():
+        http = AsyncHttpClient(
+            api_key="test",
+            base_url="http://upay.invalid",
+            hedging_policy=HedgingPolicy(delay=0.01, budget=1.0)
+        )
+        await http.client.aclose()
+        http.client = FakeClient()
+        return await http._hedged_request("GET", "http://upay.invalid/x", None, {}, None, "/x")
+    
+    response = asyncio.run(run())
+    
+    assert response.status_code == 200
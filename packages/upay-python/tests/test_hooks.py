@@ -0,0 +1,83 @@
+"""
+Testes dos hooks de requisição (on_request/on_response/on_retry/on_error)
+"""
+
+import asyncio
+
+import pytest
+
+from upay import AsyncUpayClient, Hooks, MetricsCollector, RetryPolicy, UpayClient
+from upay.transport import Transport
+
+
+class Recorder(Hooks):
+    def __init__(self):
+        self.events = []
+    
+    def on_request(self, info):
+        self.events.append("request")
+    
+    def on_response(self, info):
+        self.events.append("response")
+    
+    def on_retry(self, info, error, delay):
+        self.events.append("retry")
+    
+    def on_error(self, info, error):
+        self.events.append(("error", type(error).__name__))
+
+
+class BrokenTransport(Transport):
+    def send(self, method, url, payload, headers, timeout):
+        raise RuntimeError("bug no transporte")
+
+
+def test_retry_then_response(api):
+    hooks = Recorder()
+    upay = UpayClient(
+        api_key="test",
+        base_url=api.url,
+        hooks=[hooks],
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001)
+    )
+    api.fail(503, retry_after=0)
+    
+    upay.transactions.get("tx_00000001")
+    
+    assert hooks.events == ["request", "retry", "request", "response"]
+    upay.close()
+
+
+def test_unexpected_transport_error_still_emits_on_error():
+    hooks = Recorder()
+    metrics = MetricsCollector()
+    upay = UpayClient(
+        api_key="test",
+        base_url="http://upay.invalid",
+        hooks=[hooks],
+        metrics=metrics,
+        transport=BrokenTransport()
+    )
+    
+    with pytest.raises(RuntimeError):
+        upay.transactions.get("tx_00000001")
+    
+    assert hooks.events == ["request", ("error", "RuntimeError")]
+    assert all(count == 0 for count in metrics.snapshot()["in_flight"].values())
+
+
+def test_cancelled_async_request_emits_on_error(api):
+    api.latency = 1.0
+    hooks = Recorder()
+    
+    async def run():
+        async with AsyncUpayClient(api_key="test", base_url=api.url, hooks=[hooks]) as upay:
+            task = asyncio.ensure_future(upay.transactions.get("tx_00000001"))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+    
+    asyncio.run(run())
+    
+    assert hooks.events == ["request", ("error", "CancelledError")]
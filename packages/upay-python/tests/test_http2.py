@@ -0,0 +1,55 @@
+"""
+Testes do HTTP2Transport (pulados sem httpx e h2)
+"""
+
+import socket
+
+import pytest
+
+from upay import HTTP2Transport, RetryPolicy, UpayClient
+from upay.transport import TransportError
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+def test_requests_go_through_one_connection(api):
+    transport = HTTP2Transport()
+    upay = UpayClient(
+        api_key="test",
+        base_url=api.url,
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=1)
+    )
+    
+    for i in range(3):
+        assert upay.transactions.get(f"tx_{i:08d}")["id"] == f"tx_{i:08d}"
+    link = upay.payment_links.create({"title": "Curso Python", "amount": 10000})
+    
+    assert link["title"] == "Curso Python"
+    assert upay.pool_stats() == {"new_connections": 1, "reused_connections": 3}
+    upay.close()
+
+
+def test_falls_back_to_http11_without_alpn(api):
+    # Sem TLS não há ALPN: o httpx fala HTTP/1.1 com a API falsa
+    transport = HTTP2Transport()
+    
+    response = transport.send("GET", f"{api.url}/api/v1/transactions/tx_00000001", None, {}, 5.0)
+    
+    assert response.status_code == 200
+    assert response.http_version == "HTTP/1.1"
+    assert response.ttfb > 0
+    transport.close()
+
+
+def test_network_errors_become_transport_errors():
+    # Porta sem ninguém escutando
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    transport = HTTP2Transport()
+    
+    with pytest.raises(TransportError):
+        transport.send("GET", f"http://127.0.0.1:{port}/", None, {}, 1.0)
+    transport.close()
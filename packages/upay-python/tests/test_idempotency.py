@@ -0,0 +1,103 @@
+"""
+Testes das chaves de idempotência (header, retentativas e resultado)
+"""
+
+import asyncio
+
+import pytest
+
+from upay import AsyncUpayClient, RetryPolicy, UpayClient, UpayServerError
+
+LINK = {"title": "Curso Python", "amount": 10000}
+
+
+def make_client(url, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=3, backoff_base=0.001))
+    return UpayClient(api_key="test", base_url=url, **kwargs)
+
+
+def sent_keys(api):
+    return [headers.get("Idempotency-Key") for headers in api.headers]
+
+
+def test_a_key_is_generated_and_sent(api):
+    upay = make_client(api.url)
+    
+    link = upay.payment_links.create(LINK)
+    
+    assert sent_keys(api) == [link["idempotencyKey"]]
+    assert len(link["idempotencyKey"]) == 36
+    upay.close()
+
+
+def test_the_given_key_is_sent(api):
+    upay = make_client(api.url)
+    
+    link = upay.payment_links.create(LINK, idempotency_key="pedido-42")
+    
+    assert sent_keys(api) == ["pedido-42"]
+    assert link["idempotencyKey"] == "pedido-42"
+    upay.close()
+
+
+def test_every_retry_reuses_the_same_key(api):
+    upay = make_client(api.url)
+    api.fail(503, times=2)
+    
+    link = upay.payment_links.create(LINK)
+    
+    assert api.requests == 3
+    assert sent_keys(api) == [link["idempotencyKey"]] * 3
+    upay.close()
+
+
+def test_the_key_is_on_the_error(api):
+    upay = make_client(api.url)
+    api.fail(500, times=3)
+    
+    with pytest.raises(UpayServerError) as info:
+        upay.payment_links.create(LINK, idempotency_key="pedido-42")
+    
+    assert info.value.idempotency_key == "pedido-42"
+    assert sent_keys(api) == ["pedido-42"] * 3
+    upay.close()
+
+
+def test_gets_send_no_key(api):
+    upay = make_client(api.url)
+    
+    upay.transactions.get("tx_00000001")
+    
+    assert sent_keys(api) == [None]
+    upay.close()
+
+
+def test_no_key_when_disabled(api):
+    upay = make_client(api.url, idempotency_keys=False)
+    api.fail(503)
+    
+    # Sem chave, o POST não é repetido
+    with pytest.raises(UpayServerError) as info:
+        upay.payment_links.create(LINK)
+    
+    assert sent_keys(api) == [None]
+    assert info.value.idempotency_key is None
+    assert "idempotencyKey" not in upay.payment_links.create(LINK)
+    upay.close()
+
+
+def test_async_retries_reuse_the_same_key(api):
+    pytest.importorskip("httpx")
+    api.fail(503, times=2)
+    
+    async def run():
+        async with AsyncUpayClient(
+            api_key="test",
+            base_url=api.url,
+            retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001)
+        ) as upay:
+            return await upay.payment_links.create(LINK)
+    
+    link = asyncio.run(run())
+    
+    assert sent_keys(api) == [link["idempotencyKey"]] * 3
@@ -0,0 +1,37 @@
+"""
+Testes dos imports sob demanda: o cliente síncrono não carrega asyncio/httpx
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def loaded_modules(code):
+    """Executa code num processo novo e retorna os módulos carregados"""
+    output = subprocess.check_output(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+        cwd=ROOT
+    )
+    return set(output.decode().split())
+
+
+def test_sync_client_does_not_load_asyncio():
+    modules = loaded_modules("from upay import UpayClient\nUpayClient(api_key='test')")
+    
+    assert "upay.client" in modules
+    assert not {"asyncio", "httpx", "upay.async_http", "upay.async_client"} & modules
+
+
+def test_webhook_verification_does_not_load_the_http_stack():
+    modules = loaded_modules("from upay import verify_webhook_signature")
+    
+    assert not {"requests", "asyncio", "sqlite3", "upay.client"} & modules
+
+
+def test_sync_webhook_router_does_not_load_asyncio():
+    modules = loaded_modules("from upay import WebhookRouter")
+    
+    assert not {"asyncio", "sqlite3", "requests"} & modules
@@ -0,0 +1,135 @@
+"""
+Testes do MetricsCollector (buckets dos histogramas e texto do Prometheus)
+"""
+
+import threading
+from urllib.request import urlopen
+
+import pytest
+
+from upay import MetricsCollector, RetryPolicy, UpayClient, UpayServerError
+from upay.hooks import RequestInfo
+from upay.metrics import serve_metrics
+
+
+def finished(method, endpoint, status, seconds):
+    info = RequestInfo(method, endpoint, "http://upay.invalid" + endpoint, 1, 0)
+    info.status = status
+    info.total_time = seconds
+    return info
+
+
+def observe(metrics, info):
+    metrics.on_request(info)
+    metrics.on_response(info)
+
+
+def test_latencies_land_in_cumulative_buckets():
+    metrics = MetricsCollector(buckets=(0.1, 0.5, 1.0))
+    for seconds in (0.05, 0.1, 0.3, 0.7, 2.0):
+        observe(metrics, finished("GET", "/transactions/{id}", 200, seconds))
+    
+    hist = metrics.snapshot()["latency"][("GET", "/transactions/{id}", "200")]
+    
+    # O limite é inclusivo (le = "menor ou igual")
+    assert hist["buckets"] == {0.1: 2, 0.5: 3, 1.0: 4, float("inf"): 5}
+    assert hist["count"] == 5
+    assert hist["sum"] == pytest.approx(3.15)
+
+
+def test_buckets_must_be_increasing():
+    with pytest.raises(ValueError):
+        MetricsCollector(buckets=(1.0, 0.5))
+    with pytest.raises(ValueError):
+        MetricsCollector(buckets=())
+
+
+def test_threads_are_summed_and_survive_thread_exit():
+    metrics = MetricsCollector(buckets=(1.0,))
+    
+    def work():
+        for _ in range(100):
+            observe(metrics, finished("GET", "/products/{id}", 200, 0.01))
+    
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert metrics.snapshot()["latency"][("GET", "/products/{id}", "200")]["count"] == 400
+    # Os shards das threads encerradas já foram consolidados
+    assert metrics.snapshot()["latency"][("GET", "/products/{id}", "200")]["count"] == 400
+
+
+def test_render_prometheus_text():
+    metrics = MetricsCollector(buckets=(0.1, 1.0))
+    observe(metrics, finished("GET", "/transactions/{id}", 200, 0.05))
+    observe(metrics, finished("GET", "/transactions/{id}", 200, 0.5))
+    info = finished("POST", "/payment-links", 503, 0.2)
+    metrics.on_request(info)
+    metrics.on_error(info, UpayServerError("fora do ar"))
+    metrics.on_circuit_state_change("/payment-links", "closed", "open")
+    
+    text = metrics.render()
+    
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# TYPE upay_request_duration_seconds histogram" in lines
+    labels = 'method="GET",endpoint="/transactions/{id}",status="200"'
+    assert f'upay_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    assert f'upay_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in lines
+    assert f'upay_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"upay_request_duration_seconds_sum{{{labels}}} 0.55" in lines
+    assert f"upay_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert 'upay_requests_in_flight{method="GET",endpoint="/transactions/{id}"} 0' in lines
+    assert 'upay_errors_total{method="POST",endpoint="/payment-links",error="UpayServerError"} 1' in lines
+    assert "# TYPE upay_retries_total counter" in lines
+    assert 'upay_circuit_state{group="/payment-links",state="open"} 1' in lines
+    assert 'upay_circuit_state{group="/payment-links",state="closed"} 0' in lines
+
+
+def test_render_escapes_label_values():
+    metrics = MetricsCollector(buckets=(1.0,), namespace="loja")
+    observe(metrics, finished("GET", 'a"b\\c\nd', 200, 0.5))
+    
+    assert 'loja_request_duration_seconds_count{method="GET",endpoint="a\\"b\\\\c\\nd",status="200"} 1' in (
+        metrics.render().splitlines()
+    )
+
+
+def test_client_requests_and_retries_are_recorded(api):
+    metrics = MetricsCollector()
+    upay = UpayClient(
+        api_key="test",
+        base_url=api.url,
+        metrics=metrics,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.001)
+    )
+    api.fail(503)
+    
+    upay.transactions.get("tx_00000001")
+    
+    data = metrics.snapshot()
+    assert data["retries"] == {("GET", "/transactions/{id}", "UpayServerError"): 1}
+    assert data["latency"][("GET", "/transactions/{id}", "503")]["count"] == 1
+    assert data["latency"][("GET", "/transactions/{id}", "200")]["count"] == 1
+    assert data["in_flight"] == {("GET", "/transactions/{id}"): 0}
+    upay.close()
+
+
+def test_serve_metrics():
+    metrics = MetricsCollector(buckets=(1.0,))
+    observe(metrics, finished("GET", "/products/{id}", 200, 0.5))
+    server = serve_metrics(metrics, port=0)
+    try:
+        host, port = server.server_address[:2]
+        with urlopen(f"http://{host}:{port}/metrics") as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    assert body == metrics.render()
+    assert content_type.startswith("text/plain; version=0.0.4")
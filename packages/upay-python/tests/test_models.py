@@ -0,0 +1,65 @@
+"""
+Testes dos modelos tipados (models=True)
+"""
+
+import asyncio
+
+from upay import AsyncUpayClient, ReadCache, RetryPolicy, UpayClient
+from upay.models import PaymentLink, Transaction
+
+
+def test_get_returns_a_model(api):
+    upay = UpayClient(api_key="test", base_url=api.url, models=True, retry_policy=RetryPolicy(max_attempts=1))
+    
+    tx = upay.transactions.get("tx_00000007")
+    
+    assert isinstance(tx, Transaction)
+    assert tx.id == "tx_00000007"
+    assert tx.client.email == "cliente7@example.com"
+    assert tx["amountCents"] == 10007
+    upay.close()
+
+
+def test_get_stays_a_dict_without_models(client):
+    tx = client.transactions.get("tx_00000007")
+    
+    assert type(tx) is dict
+    assert tx["id"] == "tx_00000007"
+
+
+def test_async_get_returns_a_model(api):
+    async def run():
+        async with AsyncUpayClient(api_key="test", base_url=api.url, models=True) as upay:
+            return await upay.transactions.get("tx_00000003")
+    
+    tx = asyncio.run(run())
+    
+    assert isinstance(tx, Transaction)
+    assert tx.amount_cents == 10003
+
+
+def test_get_by_slug_unwraps_the_envelope(api):
+    cache = ReadCache()
+    upay = UpayClient(api_key="test", base_url=api.url, models=True, cache=cache,
+                      retry_policy=RetryPolicy(max_attempts=1))
+    
+    link = upay.payment_links.get_by_slug("curso-python")
+    
+    assert isinstance(link, PaymentLink)
+    assert link.id == "pl_curso-python"
+    assert link.slug == "curso-python"
+    # O valor guardado no cache é o link, não o envelope
+    assert cache.lookup("payment_links", ("slug", "curso-python")) == (True, link)
+    upay.close()
+
+
+def test_async_get_by_slug_unwraps_the_envelope(api):
+    async def run():
+        async with AsyncUpayClient(api_key="test", base_url=api.url) as upay:
+            return await upay.payment_links.get_by_slug("curso-python")
+    
+    link = asyncio.run(run())
+    
+    assert type(link) is dict
+    assert link["id"] == "pl_curso-python"
+    assert "paymentLink" not in link
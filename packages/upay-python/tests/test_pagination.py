@@ -0,0 +1,55 @@
+"""
+Testes da paginação automática (iter_all/list_all)
+"""
+
+import pytest
+
+from upay import RetryPolicy, UpayClient, UpayNotFoundError
+
+
+def test_list_all_returns_every_page_in_order(client, api):
+    api.total_transactions = 250
+    
+    items = client.transactions.list_all(limit=20, concurrency=4)
+    
+    assert [item["id"] for item in items] == [f"tx_{i:08d}" for i in range(250)]
+    assert api.requests == 13
+
+
+def test_iter_all_walks_the_pages(client, api):
+    api.total_transactions = 45
+    
+    ids = [item["id"] for item in client.transactions.iter_all(limit=10, prefetch=True)]
+    
+    assert ids == [f"tx_{i:08d}" for i in range(45)]
+
+
+def test_transient_page_errors_are_retried_by_the_http_client(api):
+    api.total_transactions = 30
+    upay = UpayClient(
+        api_key="test",
+        base_url=api.url,
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001)
+    )
+    api.fail(503, times=2, retry_after=0)
+    
+    items = upay.transactions.list_all(limit=10)
+    
+    assert len(items) == 30
+    # 3 páginas + 2 retentativas, sem repetição extra na paginação
+    assert api.requests == 5
+    upay.close()
+
+
+def test_client_errors_stop_the_iteration_without_retry(api):
+    upay = UpayClient(
+        api_key="test",
+        base_url=api.url,
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001)
+    )
+    api.fail(404)
+    
+    with pytest.raises(UpayNotFoundError):
+        upay.transactions.list_all(limit=10)
+    assert api.requests == 1
+    upay.close()
@@ -0,0 +1,88 @@
+"""
+Testes do pool de conexões (PooledHTTPAdapter e pool_stats)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from upay import RetryPolicy, UpayClient
+
+
+def make_client(api, **kwargs):
+    return UpayClient(api_key="test", base_url=api.url, retry_policy=RetryPolicy(max_attempts=1), **kwargs)
+
+
+def concurrent_gets(upay, count):
+    barrier = threading.Barrier(count)
+    
+    def get(i):
+        barrier.wait()
+        return upay.transactions.get(f"tx_{i:08d}")
+    
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(get, range(count)))
+
+
+def test_pool_options_reach_the_adapter(api):
+    upay = make_client(api, pool_connections=3, pool_maxsize=7, pool_block=True, keepalive_timeout=9.0)
+    adapter = upay._http.transport.adapter
+    
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert adapter._pool_block is True
+    assert adapter.keepalive_timeout == 9.0
+    upay.close()
+
+
+def test_sequential_requests_reuse_one_connection(api):
+    upay = make_client(api)
+    
+    for i in range(5):
+        upay.transactions.get(f"tx_{i:08d}")
+    
+    assert upay.pool_stats() == {
+        "new_connections": 1,
+        "reused_connections": 4,
+        "expired_connections": 0,
+        "discarded_connections": 0,
+    }
+    upay.close()
+
+
+def test_idle_connections_expire(api):
+    upay = make_client(api, keepalive_timeout=0.05)
+    
+    upay.transactions.get("tx_00000001")
+    time.sleep(0.1)
+    upay.transactions.get("tx_00000002")
+    
+    stats = upay.pool_stats()
+    assert stats["expired_connections"] == 1
+    assert stats["new_connections"] == 2
+    upay.close()
+
+
+def test_small_pool_discards_extra_connections(api):
+    api.latency = 0.1
+    upay = make_client(api, pool_maxsize=2)
+    
+    concurrent_gets(upay, 6)
+    
+    stats = upay.pool_stats()
+    assert stats["new_connections"] == 6
+    assert stats["discarded_connections"] == 4
+    upay.close()
+
+
+def test_blocking_pool_never_opens_more_than_maxsize(api):
+    api.latency = 0.05
+    upay = make_client(api, pool_maxsize=2, pool_block=True)
+    
+    concurrent_gets(upay, 6)
+    
+    stats = upay.pool_stats()
+    assert stats["new_connections"] == 2
+    assert stats["reused_connections"] == 4
+    assert stats["discarded_connections"] == 0
+    upay.close()
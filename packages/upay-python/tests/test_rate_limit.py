@@ -0,0 +1,76 @@
+"""
+Testes do limitador de requisições (TokenBucket e FileTokenBucket)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from upay import AsyncUpayClient, FileTokenBucket, TokenBucket, UpayClient
+
+
+def test_burst_then_waits_for_refill():
+    bucket = TokenBucket(rate=10, burst=3)
+    
+    waits = [bucket.reserve() for _ in range(5)]
+    
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    # Reservas seguidas entram na fila: 0,1 s e 0,2 s de espera
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_tokens_do_not_exceed_burst():
+    bucket = TokenBucket(rate=100, burst=2)
+    time.sleep(0.05)  # repõe 5 fichas, mas o limite é 2
+    
+    waits = [bucket.reserve() for _ in range(3)]
+    
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] > 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_file_bucket_is_shared_by_instances(tmp_path):
+    path = str(tmp_path / "rate-limit")
+    first = FileTokenBucket(path, rate=10, burst=2)
+    second = FileTokenBucket(path, rate=10, burst=2)
+    
+    assert first.reserve() == 0.0
+    assert second.reserve() == 0.0
+    # O saldo está no arquivo: a terceira reserva espera, seja qual for a instância
+    assert first.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_client_requests_are_paced(api):
+    upay = UpayClient(api_key="test", base_url=api.url, rate_limiter=TokenBucket(rate=20, burst=1))
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: upay.transactions.get(f"tx_{i:08d}"), range(6)))
+    elapsed = time.perf_counter() - started
+    
+    assert api.requests == 6
+    # 1 requisição imediata + 5 a 20/s
+    assert elapsed >= 0.24
+    upay.close()
+
+
+def test_async_client_requests_are_paced(api):
+    async def run():
+        limiter = TokenBucket(rate=20, burst=1)
+        async with AsyncUpayClient(api_key="test", base_url=api.url, rate_limiter=limiter) as upay:
+            started = time.perf_counter()
+            await asyncio.gather(*(upay.transactions.get(f"tx_{i:08d}") for i in range(6)))
+            return time.perf_counter() - started
+    
+    assert asyncio.run(run()) >= 0.24
+    assert api.requests == 6
@@ -0,0 +1,114 @@
+"""
+Testes da gravação e reprodução de trocas HTTP (RecordingAdapter/ReplayAdapter)
+"""
+
+import pytest
+
+from upay import (
+    RecordingAdapter,
+    ReplayAdapter,
+    RetryPolicy,
+    UpayClient,
+    UpayError,
+    UpayNotFoundError,
+)
+from upay.replay import read_recording
+
+LINK = {"title": "Curso Python", "amount": 10000}
+
+
+def make_client(base_url, adapter):
+    return UpayClient(
+        api_key="test",
+        base_url=base_url,
+        adapter=adapter,
+        retry_policy=RetryPolicy(max_attempts=1)
+    )
+
+
+@pytest.fixture
+def recording(api, tmp_path):
+    """Grava algumas trocas com a API falsa e retorna (arquivo, resultados)"""
+    path = str(tmp_path / "trocas.jsonl.gz")
+    upay = make_client(api.url, RecordingAdapter(path))
+    results = [
+        upay.transactions.get("tx_00000001"),
+        upay.transactions.list(page=2, limit=5),
+        upay.payment_links.create(LINK, idempotency_key="pedido-1"),
+        upay.coupons.validate("PROMO10", 10000),
+        upay.transactions.get("tx_00000001"),
+    ]
+    api.fail(404)
+    with pytest.raises(UpayNotFoundError):
+        upay.transactions.get("tx_00000002")
+    upay.close()
+    return path, results
+
+
+def test_recording_has_every_exchange(recording):
+    path, _ = recording
+    
+    entries = list(read_recording(path))
+    
+    assert [(entry["method"], entry["url"], entry["status"]) for entry in entries] == [
+        ("GET", "/api/v1/transactions/tx_00000001", 200),
+        ("GET", "/api/v1/transactions?page=2&limit=5", 200),
+        ("POST", "/api/v1/payment-links", 201),
+        ("POST", "/api/coupons/validate", 200),
+        ("GET", "/api/v1/transactions/tx_00000001", 200),
+        ("GET", "/api/v1/transactions/tx_00000002", 404),
+    ]
+    assert all("authorization" not in {name.lower() for name in entry["headers"]} for entry in entries)
+
+
+def test_replay_returns_the_recorded_responses(recording):
+    path, results = recording
+    upay = make_client("http://replay.invalid", ReplayAdapter(path, speed=0))
+    
+    replayed = [
+        upay.transactions.get("tx_00000001"),
+        upay.transactions.list(page=2, limit=5),
+        upay.payment_links.create(LINK, idempotency_key="pedido-1"),
+        upay.coupons.validate("PROMO10", 10000),
+        upay.transactions.get("tx_00000001"),
+    ]
+    
+    assert replayed == results
+    with pytest.raises(UpayNotFoundError):
+        upay.transactions.get("tx_00000002")
+    upay.close()
+
+
+def test_unmatched_request_raises_replay_miss(recording):
+    path, _ = recording
+    upay = make_client("http://replay.invalid", ReplayAdapter(path, speed=0))
+    
+    with pytest.raises(UpayError) as info:
+        upay.transactions.get("tx_99999999")
+    
+    assert info.value.code == "REPLAY_MISS"
+    assert "/api/v1/transactions/tx_99999999" in info.value.message
+    upay.close()
+
+
+def test_exhausted_responses_raise_unless_looping(recording):
+    path, _ = recording
+    once = make_client("http://replay.invalid", ReplayAdapter(path, speed=0))
+    looping = make_client("http://replay.invalid", ReplayAdapter(path, speed=0, loop=True))
+    
+    for _ in range(2):
+        once.transactions.get("tx_00000001")
+    with pytest.raises(UpayError):
+        once.transactions.get("tx_00000001")
+    
+    for _ in range(5):
+        assert looping.transactions.get("tx_00000001")["id"] == "tx_00000001"
+    once.close()
+    looping.close()
+
+
+def test_negative_speed_is_rejected(recording):
+    path, _ = recording
+    
+    with pytest.raises(ValueError):
+        ReplayAdapter(path, speed=-1)
@@ -0,0 +1,124 @@
+"""
+Testes das retentativas (RetryPolicy + HttpClient) contra a API falsa
+"""
+
+import socket
+import time
+
+import pytest
+
+from upay import (
+    Hooks,
+    RetryPolicy,
+    UpayClient,
+    UpayRateLimitError,
+    UpayServerError,
+    UpayValidationError,
+)
+from upay.retry import parse_retry_after
+
+LINK = {"title": "Curso Python", "amount": 10000}
+
+
+def make_client(url, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=3, backoff_base=0.001))
+    return UpayClient(api_key="test", base_url=url, **kwargs)
+
+
+def test_transient_errors_are_retried(api):
+    upay = make_client(api.url)
+    api.fail(503, times=2)
+    
+    tx = upay.transactions.get("tx_00000001")
+    
+    assert tx["id"] == "tx_00000001"
+    assert api.requests == 3
+
+
+def test_gives_up_after_max_attempts(api):
+    upay = make_client(api.url)
+    api.fail(502, times=5)
+    
+    with pytest.raises(UpayServerError):
+        upay.transactions.get("tx_00000001")
+    assert api.requests == 3
+
+
+def test_client_errors_are_not_retried(api):
+    upay = make_client(api.url)
+    api.fail(400)
+    
+    with pytest.raises(UpayValidationError):
+        upay.transactions.get("tx_00000001")
+    assert api.requests == 1
+
+
+def test_post_without_idempotency_key_is_not_retried(api):
+    upay = make_client(api.url, idempotency_keys=False)
+    api.fail(503)
+    
+    with pytest.raises(UpayServerError):
+        upay.payment_links.create(LINK)
+    assert api.requests == 1
+
+
+def test_post_with_idempotency_key_is_retried(api):
+    upay = make_client(api.url)
+    api.fail(503)
+    
+    link = upay.payment_links.create(LINK)
+    
+    assert link["title"] == "Curso Python"
+    assert api.requests == 2
+
+
+def test_retry_after_is_respected(api):
+    upay = make_client(api.url)
+    api.fail(429, retry_after=0.2)
+    
+    started = time.perf_counter()
+    upay.transactions.get("tx_00000001")
+    
+    assert time.perf_counter() - started >= 0.2
+    assert api.requests == 2
+
+
+def test_retry_after_above_the_limit_is_not_waited(api):
+    upay = make_client(api.url, retry_policy=RetryPolicy(max_attempts=3, max_retry_after=1))
+    api.fail(429, retry_after=120)
+    
+    with pytest.raises(UpayRateLimitError):
+        upay.transactions.get("tx_00000001")
+    assert api.requests == 1
+
+
+def test_network_errors_are_retried():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    
+    retries = []
+    
+    class CountRetries(Hooks):
+        def on_retry(self, info, error, delay):
+            retries.append(info.attempt)
+    
+    upay = make_client(f"http://127.0.0.1:{port}", hooks=[CountRetries()])
+    
+    with pytest.raises(Exception, match="Erro na requisição"):
+        upay.transactions.get("tx_00000001")
+    assert retries == [1, 2]
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=2.0)
+    
+    assert all(0 <= policy.compute_delay(attempt) <= 2.0 for attempt in range(1, 10))
+    assert policy.compute_delay(1, retry_after=3.0) == 3.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("amanhã") is None
+    assert parse_retry_after(None) is None
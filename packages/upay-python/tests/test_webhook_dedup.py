@@ -0,0 +1,107 @@
+"""
+Testes do WebhookDeduplicator e dos backends
+"""
+
+import time
+
+from upay import SQLiteDedupBackend, WebhookDeduplicator
+
+
+def test_redelivery_within_ttl_is_a_duplicate():
+    dedup = WebhookDeduplicator(maxsize=10, ttl=60)
+    
+    assert dedup.seen("evt_1") is False
+    assert dedup.seen("evt_1") is True
+    assert dedup.seen("evt_2") is False
+    assert dedup.stats() == {"unique": 2, "duplicates": 1, "backend_lookups": 0, "size": 2}
+
+
+def test_ids_expire_after_ttl():
+    dedup = WebhookDeduplicator(ttl=0.05)
+    
+    assert dedup.seen("evt_1") is False
+    time.sleep(0.1)
+    assert dedup.seen("evt_1") is False
+
+
+def test_lru_is_bounded_and_forget_allows_reprocessing():
+    dedup = WebhookDeduplicator(maxsize=2, ttl=60)
+    for event_id in ("evt_1", "evt_2", "evt_3"):
+        dedup.seen(event_id)
+    
+    assert dedup.stats()["size"] == 2
+    # evt_1 saiu do LRU e não há backend
+    assert dedup.seen("evt_1") is False
+    
+    dedup.forget("evt_3")
+    assert dedup.seen("evt_3") is False
+
+
+def test_sqlite_backend_survives_restart(tmp_path):
+    path = str(tmp_path / "webhooks.db")
+    dedup = WebhookDeduplicator(maxsize=1, ttl=60, backend=SQLiteDedupBackend(path))
+    dedup.seen("evt_1")
+    dedup.close()
+    
+    dedup = WebhookDeduplicator(maxsize=1, ttl=60, backend=SQLiteDedupBackend(path))
+    assert dedup.seen("evt_1") is True
+    assert dedup.seen("evt_2") is False
+    dedup.close()
+
+
+def test_sqlite_iter_ids_reads_in_batches(tmp_path):
+    backend = SQLiteDedupBackend(str(tmp_path / "webhooks.db"), batch_size=3)
+    expires_at = time.time() + 60
+    for i in range(10):
+        backend.add(f"evt_{i}", expires_at)
+    backend.add("expirado", time.time() - 1)
+    
+    ids = backend.iter_ids()
+    assert not isinstance(ids, list)
+    assert sorted(ids) == sorted(f"evt_{i}" for i in range(10))
+    backend.close()
+
+
+def test_bloom_skips_backend_for_new_ids(tmp_path):
+    backend = SQLiteDedupBackend(str(tmp_path / "webhooks.db"))
+    dedup = WebhookDeduplicator(maxsize=1, ttl=60, backend=backend, bloom_capacity=1000)
+    
+    for i in range(100):
+        assert dedup.seen(f"evt_{i}") is False
+    # Com o filtro vazio no início, quase nenhum ID novo consulta o SQLite
+    assert dedup.stats()["backend_lookups"] <= 5
+    # evt_0 saiu do LRU, mas o filtro manda consultar o backend
+    assert dedup.seen("evt_0") is True
+    dedup.close()
+
+
+def test_bloom_rebuild_runs_in_background_and_keeps_ids(tmp_path):
+    backend = SQLiteDedupBackend(str(tmp_path / "webhooks.db"))
+    dedup = WebhookDeduplicator(maxsize=1, ttl=60, backend=backend, bloom_capacity=20)
+    first = dedup.bloom
+    
+    for i in range(25):
+        dedup.seen(f"evt_{i}")
+    dedup.close()  # espera a reconstrução em andamento
+    
+    assert dedup.bloom is not first
+    assert all(f"evt_{i}" in dedup.bloom for i in range(25))
+
+
+def test_ids_seen_during_rebuild_go_to_the_new_filter(tmp_path):
+    backend = SQLiteDedupBackend(str(tmp_path / "webhooks.db"))
+    dedup = WebhookDeduplicator(maxsize=1, ttl=60, backend=backend, bloom_capacity=1000)
+    original = backend.iter_ids
+    
+    def slow_iter_ids():
+        ids = list(original())
+        # Um evento chega depois da leitura do backend, antes da troca
+        dedup.seen("evt_durante")
+        yield from ids
+    
+    backend.iter_ids = slow_iter_ids
+    dedup.rebuild_bloom()
+    
+    assert "evt_durante" in dedup.bloom
+    assert dedup.seen("evt_durante") is True
+    dedup.close()
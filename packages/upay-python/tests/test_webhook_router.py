@@ -0,0 +1,53 @@
+"""
+Testes do WebhookRouter e do AsyncWebhookRouter
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+
+from upay import AsyncWebhookRouter, WebhookDeduplicator, WebhookRouter
+
+SECRET = "segredo"
+
+
+def signed(event):
+    body = json.dumps(event).encode()
+    return body, hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_redelivered_events_run_once():
+    calls = []
+    with WebhookRouter(SECRET, dedup=WebhookDeduplicator()) as router:
+        router.add_handler("transaction.paid", calls.append)
+        body, signature = signed({"id": "evt_1", "type": "transaction.paid"})
+        router.dispatch(body, signature)
+        router.dispatch(body, signature)
+        router.join()
+    
+    assert [event["id"] for event in calls] == ["evt_1"]
+
+
+def test_async_router_runs_sync_handlers_off_the_event_loop():
+    threads = {}
+    
+    def sync_handler(event):
+        threads["sync"] = threading.get_ident()
+    
+    async def async_handler(event):
+        threads["async"] = threading.get_ident()
+    
+    async def run():
+        async with AsyncWebhookRouter(SECRET) as router:
+            router.add_handler("transaction.paid", sync_handler)
+            router.add_handler("transaction.paid", async_handler)
+            await router.dispatch(*signed({"id": "evt_1", "type": "transaction.paid"}))
+            await router.join()
+        return threading.get_ident()
+    
+    loop_thread = asyncio.run(run())
+    
+    assert threads["async"] == loop_thread
+    assert threads["sync"] != loop_thread
@@ -0,0 +1,84 @@
+"""
+Testes do WebhookVerifier (rotação de secrets, lotes e tipos de payload)
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from upay import WebhookVerifier, verify_webhook_signature
+
+BODY = '{"event": "transaction.paid", "data": {"id": "tx_1", "product": "Café"}}'.encode("utf-8")
+
+
+def sign(body, secret):
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def test_accepts_bytes_bytearray_memoryview_and_str():
+    verifier = WebhookVerifier("secret")
+    signature = sign(BODY, "secret")
+    
+    assert verifier.verify(BODY, signature)
+    assert verifier.verify(bytearray(BODY), signature)
+    assert verifier.verify(memoryview(BODY), signature)
+    assert verifier.verify(BODY.decode("utf-8"), signature)
+
+
+def test_accepts_the_sha256_prefix():
+    verifier = WebhookVerifier("secret")
+    
+    assert verifier.verify(BODY, "sha256=" + sign(BODY, "secret"))
+
+
+def test_rejects_wrong_or_missing_signatures():
+    verifier = WebhookVerifier("secret")
+    
+    assert not verifier.verify(BODY, sign(BODY, "outro"))
+    assert not verifier.verify(BODY + b" ", sign(BODY, "secret"))
+    assert not verifier.verify(BODY, None)
+    assert not verifier.verify(b"", sign(b"", "secret"))
+    # Assinatura com caracteres fora de ASCII não deve levantar exceção
+    assert not verifier.verify(BODY, "assinatura-inválida")
+
+
+def test_rotation_accepts_old_and_new_secrets():
+    verifier = WebhookVerifier(["secret_novo", "secret_antigo"])
+    
+    assert verifier.verify(BODY, sign(BODY, "secret_novo"))
+    assert verifier.verify(BODY, sign(BODY, "secret_antigo"))
+    assert not verifier.verify(BODY, sign(BODY, "secret_removido"))
+
+
+def test_empty_secrets_are_rejected():
+    with pytest.raises(ValueError):
+        WebhookVerifier(["", ""])
+
+
+def test_verify_many_keeps_the_order():
+    verifier = WebhookVerifier(["secret_novo", "secret_antigo"])
+    deliveries = [
+        (BODY, sign(BODY, "secret_novo")),
+        (memoryview(BODY), "errada"),
+        (BODY.decode("utf-8"), sign(BODY, "secret_antigo")),
+        (BODY, None),
+    ]
+    
+    assert verifier.verify_many(deliveries) == [True, False, True, False]
+    assert verifier.verify_many(iter(deliveries)) == [True, False, True, False]
+
+
+def test_the_verifier_is_reusable():
+    verifier = WebhookVerifier("secret")
+    other = b'{"event": "transaction.created"}'
+    
+    # O estado do HMAC preparado não pode vazar de uma verificação para outra
+    for _ in range(3):
+        assert verifier.verify(BODY, sign(BODY, "secret"))
+        assert verifier.verify(other, sign(other, "secret"))
+
+
+def test_verify_webhook_signature_matches_the_verifier():
+    assert verify_webhook_signature(BODY, sign(BODY, "secret"), "secret")
+    assert not verify_webhook_signature(BODY, sign(BODY, "secret"), "")
@@ -1,31 +1,103 @@
 """
 SDK oficial da Upay para Python
+
+Os nomes públicos são importados sob demanda (PEP 562): `from upay import
+verify_webhook_signature` carrega só o módulo de webhooks, sem requests nem
+os recursos da API.
 """
 
-from .client import UpayClient
-from .utils import (
-    UpayError,
-    UpayAuthenticationError,
-    UpayValidationError,
-    UpayNotFoundError,
-    UpayRateLimitError,
-    UpayServerError,
-    verify_webhook_signature,
-    extract_webhook_signature,
-    WebhookEventType,
-)
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "1.0.0"
 
-__all__ = [
-    "UpayClient",
-    "UpayError",
-    "UpayAuthenticationError",
-    "UpayValidationError",
-    "UpayNotFoundError",
-    "UpayRateLimitError",
-    "UpayServerError",
-    "verify_webhook_signature",
-    "extract_webhook_signature",
-    "WebhookEventType",
-]
+# Nome público -> módulo que o define
+_EXPORTS = {
+    "UpayClient": ".client",
+    "AsyncUpayClient": ".async_client",
+    "RetryPolicy": ".retry",
+    "HedgingPolicy": ".hedging",
+    "CircuitBreaker": ".circuit_breaker",
+    "RateLimiter": ".rate_limit",
+    "TokenBucket": ".rate_limit",
+    "FileTokenBucket": ".rate_limit",
+    "ReadCache": ".cache",
+    "JSONCodec": ".codec",
+    "StdlibCodec": ".codec",
+    "OrjsonCodec": ".codec",
+    "Hooks": ".hooks",
+    "RequestInfo": ".hooks",
+    "OpenTelemetryHooks": ".hooks",
+    "MetricsCollector": ".metrics",
+    "serve_metrics": ".metrics",
+    "RecordingAdapter": ".replay",
+    "Transport": ".transport",
+    "RequestsTransport": ".transport",
+    "HTTP2Transport": ".transport",
+    "ReplayAdapter": ".replay",
+    "UpayError": ".utils.errors",
+    "UpayAuthenticationError": ".utils.errors",
+    "UpayValidationError": ".utils.errors",
+    "UpayNotFoundError": ".utils.errors",
+    "UpayRateLimitError": ".utils.errors",
+    "UpayServerError": ".utils.errors",
+    "UpayWebhookError": ".utils.errors",
+    "UpayCircuitOpenError": ".utils.errors",
+    "verify_webhook_signature": ".utils.webhooks",
+    "extract_webhook_signature": ".utils.webhooks",
+    "WebhookEventType": ".utils.webhooks",
+    "WebhookVerifier": ".utils.webhooks",
+    "WebhookRouter": ".utils.webhook_router",
+    "AsyncWebhookRouter": ".utils.webhook_router",
+    "WebhookDeduplicator": ".utils.webhook_dedup",
+    "SQLiteDedupBackend": ".utils.webhook_dedup",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Guarda no módulo para as próximas consultas não passarem por aqui
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from .client import UpayClient
+    from .async_client import AsyncUpayClient
+    from .retry import RetryPolicy
+    from .hedging import HedgingPolicy
+    from .circuit_breaker import CircuitBreaker
+    from .rate_limit import RateLimiter, TokenBucket, FileTokenBucket
+    from .cache import ReadCache
+    from .codec import JSONCodec, StdlibCodec, OrjsonCodec
+    from .hooks import Hooks, RequestInfo, OpenTelemetryHooks
+    from .metrics import MetricsCollector, serve_metrics
+    from .replay import RecordingAdapter, ReplayAdapter
+    from .transport import Transport, RequestsTransport, HTTP2Transport
+    from .utils.errors import (
+        UpayError,
+        UpayAuthenticationError,
+        UpayValidationError,
+        UpayNotFoundError,
+        UpayRateLimitError,
+        UpayServerError,
+        UpayWebhookError,
+        UpayCircuitOpenError,
+    )
+    from .utils.webhooks import (
+        verify_webhook_signature,
+        extract_webhook_signature,
+        WebhookEventType,
+        WebhookVerifier,
+    )
+    from .utils.webhook_router import WebhookRouter, AsyncWebhookRouter
+    from .utils.webhook_dedup import WebhookDeduplicator, SQLiteDedupBackend
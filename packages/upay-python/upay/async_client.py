@@ -0,0 +1,189 @@
+"""
+Cliente assíncrono do SDK Upay
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+from .async_http import AsyncHttpClient
+from .cache import ReadCache
+from .codec import JSONCodec
+from .hooks import Hooks
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .hedging import HedgingPolicy
+from .circuit_breaker import CircuitBreaker
+from .resources.payment_links import AsyncPaymentLinksResource
+from .resources.transactions import AsyncTransactionsResource
+from .resources.products import AsyncProductsResource
+from .resources.clients import AsyncClientsResource
+from .resources.coupons import AsyncCouponsResource
+
+if TYPE_CHECKING:
+    from .metrics import MetricsCollector
+
+
+class AsyncUpayClient:
+    """
+    Cliente assíncrono (asyncio) para interagir com a API Upay
+    
+    Todas as chamadas compartilham um único pool de conexões, então um
+    mesmo event loop pode manter milhares de requisições em andamento
+    sem ocupar uma thread por chamada.
+    
+    Exemplo:
+        >>> import asyncio
+        >>> from upay import AsyncUpayClient
+        >>>
+        >>> async def main():
+        ...     async with AsyncUpayClient(api_key="sua_api_key_aqui") as upay:
+        ...         link = await upay.payment_links.create({
+        ...             "title": "Produto Premium",
+        ...             "amount": 10000,
+        ...         })
+        ...         transactions = await upay.transactions.list(page=1, limit=10)
+        >>>
+        >>> asyncio.run(main())
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        version: str = "v1",
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        codec: Optional[JSONCodec] = None,
+        models: bool = False,
+        cache: Optional[ReadCache] = None,
+        coupon_cache_ttl: Optional[float] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        metrics: Optional["MetricsCollector"] = None,
+        gzip_threshold: Optional[int] = None,
+        idempotency_keys: bool = True,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Inicializa o cliente assíncrono
+        
+        Args:
+            api_key: Sua API key da Upay (obrigatório)
+            base_url: URL base da API (padrão: https://upay-sistema-api.onrender.com)
+            version: Versão da API (padrão: v1)
+            timeout: Timeout das requisições em segundos (padrão: 30)
+            max_connections: Máximo de conexões simultâneas no pool (padrão: 100)
+            max_keepalive_connections: Máximo de conexões ociosas mantidas (padrão: 20)
+            keepalive_expiry: Segundos que uma conexão ociosa fica aberta (padrão: 5)
+            retry_policy: Política de retentativas para falhas transitórias (padrão:
+                até 3 tentativas, com backoff exponencial, só em métodos idempotentes)
+            rate_limiter: Limitador de requisições do lado do cliente, ex.:
+                TokenBucket(rate=10, burst=20) ou FileTokenBucket(...) para
+                dividir a cota entre processos do mesmo host (padrão: None)
+            coalesce_requests: Se True, GETs idênticos (mesma URL e parâmetros)
+                feitos ao mesmo tempo compartilham uma única requisição e o mesmo
+                resultado (padrão: False)
+            codec: Codec JSON usado para enviar e ler os corpos (JSONCodec).
+                Padrão: OrjsonCodec se o orjson estiver instalado, senão StdlibCodec
+            models: Se True, as listagens (list, iter_all, list_all), as
+                consultas (get, get_by_slug), os links de pagamento criados e as
+                validações de cupom retornam modelos tipados com __slots__
+                (upay.models) em vez de dicts; eles também aceitam acesso no
+                estilo dict (padrão: False)
+            cache: Cache de leitura (ReadCache) para payment_links.get,
+                payment_links.get_by_slug e products.get; não o compartilhe com
+                clientes de outra API key ou URL base (padrão: None, desativado)
+            coupon_cache_ttl: Se informado, memoriza os resultados de
+                coupons.validate() por esse tempo, em segundos (padrão: None)
+            hooks: Lista de Hooks (upay.hooks) chamados em cada tentativa de
+                requisição, com método, endpoint, status, bytes e tempos de
+                conexão/TTFB/total, ex.: [OpenTelemetryHooks()] (padrão: None)
+            metrics: MetricsCollector (upay.metrics) que agrega histogramas de
+                latência por endpoint e status, requisições em voo, retentativas
+                e erros por classe, exportáveis no formato do Prometheus
+                (padrão: None)
+            gzip_threshold: Compacta com gzip (Content-Encoding: gzip) os corpos
+                enviados com pelo menos esse número de bytes, ex.: 4096 para
+                links com muitos produtos em redes lentas (padrão: None, nunca).
+                As respostas são sempre pedidas com Accept-Encoding: gzip
+                (e br, se o pacote brotli estiver instalado)
+            idempotency_keys: Se True, transactions.create/process/capture/refund
+                e payment_links.create enviam uma chave de idempotência gerada
+                (UUID4) quando o chamador não informa idempotency_key. Com a
+                chave, essas chamadas são repetidas com segurança após falhas
+                de rede e 5xx; ela fica em result["idempotencyKey"] e no
+                atributo idempotency_key dos erros (padrão: True)
+            hedging_policy: HedgingPolicy (upay.hedging) para reduzir a latência
+                de cauda dos GETs: se a resposta passar do percentil configurado
+                das latências recentes do endpoint, uma segunda requisição é
+                enviada e vale a primeira que responder, com no máximo `budget`
+                requisições extras (padrão: None, desativado)
+            circuit_breaker: CircuitBreaker (upay.circuit_breaker) por grupo de
+                endpoints: se a taxa de erros ou de chamadas lentas passar do
+                limite, as chamadas do grupo falham na hora com
+                UpayCircuitOpenError até as chamadas de teste darem certo. As
+                mudanças de estado vão para os hooks (on_circuit_state_change)
+                e para o log "upay.circuit_breaker" (padrão: None)
+        
+        Raises:
+            ValueError: Se api_key não for fornecida
+            ImportError: Se o pacote httpx não estiver instalado
+        """
+        if not api_key:
+            raise ValueError("API Key é obrigatória")
+        
+        self._http = AsyncHttpClient(
+            api_key=api_key,
+            base_url=base_url or "https://upay-sistema-api.onrender.com",
+            version=version,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            codec=codec,
+            hooks=hooks,
+            metrics=metrics,
+            gzip_threshold=gzip_threshold,
+            idempotency_keys=idempotency_keys,
+            hedging_policy=hedging_policy,
+            circuit_breaker=circuit_breaker
+        )
+        
+        self.cache = cache
+        self.metrics = metrics
+        
+        # Inicializa recursos
+        self.payment_links = AsyncPaymentLinksResource(self._http, cache, models)
+        self.transactions = AsyncTransactionsResource(self._http, models)
+        self.products = AsyncProductsResource(self._http, cache, models)
+        self.clients = AsyncClientsResource(self._http, models)
+        self.coupons = AsyncCouponsResource(self._http, coupon_cache_ttl, models)
+    
+    def hedging_stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do hedging (hedging_policy)
+        
+        Returns:
+            Dicionário com requests, hedged, hedge_wins e budget_denied
+        """
+        return self._http.hedging_stats()
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Retorna os contadores do agrupamento de GETs (ver UpayClient.coalescing_stats)"""
+        return self._http.coalescing_stats()
+    
+    async def aclose(self) -> None:
+        """Fecha o pool de conexões do cliente"""
+        await self._http.aclose()
+    
+    async def __aenter__(self) -> "AsyncUpayClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
@@ -0,0 +1,451 @@
+"""
+Cliente HTTP assíncrono para requisições
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+from .codec import JSONCodec, default_codec
+from .compression import accept_encoding, compress_body
+from .idempotency import IDEMPOTENCY_HEADER, resolve_idempotency_key
+from .hooks import Hooks, RequestInfo, emit, template_endpoint
+from .http import build_url
+from .coalesce import AsyncSingleFlight
+from .hedging import HedgingPolicy
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .utils.errors import UpayCircuitOpenError, handle_api_error
+
+if TYPE_CHECKING:
+    from .metrics import MetricsCollector
+
+
+def _timing_trace(timings: Dict[str, float]):
+    """Callback da extensão "trace" do httpcore que anota o instante de cada etapa"""
+    async def trace(event: str, _info: Dict[str, Any]) -> None:
+        timings[event] = time.perf_counter()
+    return trace
+
+
+def _apply_timings(info: RequestInfo, timings: Dict[str, float], started: float) -> None:
+    """Calcula connect, TTFB e total a partir dos instantes anotados pelo trace"""
+    info.total_time = time.perf_counter() - started
+    for step in ("connection.connect_tcp", "connection.start_tls"):
+        if step + ".complete" in timings:
+            info.connect_time += timings[step + ".complete"] - timings[step + ".started"]
+    for protocol in ("http11", "http2"):
+        headers_at = timings.get(protocol + ".receive_response_headers.complete")
+        if headers_at is not None:
+            info.ttfb = headers_at - started
+            break
+
+
+class AsyncHttpClient:
+    """Cliente HTTP assíncrono (httpx) para fazer requisições à API"""
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        version: str = "v1",
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        codec: Optional[JSONCodec] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        metrics: Optional["MetricsCollector"] = None,
+        gzip_threshold: Optional[int] = None,
+        idempotency_keys: bool = True,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Inicializa o cliente HTTP assíncrono
+        
+        Args:
+            api_key: API key da Upay
+            base_url: URL base da API
+            version: Versão da API
+            timeout: Timeout das requisições em segundos
+            max_connections: Máximo de conexões simultâneas no pool
+            max_keepalive_connections: Máximo de conexões ociosas mantidas abertas
+            keepalive_expiry: Tempo (segundos) que uma conexão ociosa fica no pool
+            retry_policy: Política de retentativas (padrão: RetryPolicy())
+            rate_limiter: Limitador de requisições aplicado a cada envio (opcional)
+            coalesce_requests: Agrupa GETs idênticos simultâneos em uma requisição
+            codec: Codec JSON dos corpos (padrão: orjson se instalado, senão json)
+            hooks: Hooks chamados a cada tentativa (on_request, on_response...)
+            metrics: Coletor de métricas (histogramas de latência, retentativas...)
+            gzip_threshold: Compacta com gzip os corpos com pelo menos esse
+                número de bytes (padrão: None, nunca)
+            idempotency_keys: Gera uma chave de idempotência nas operações que
+                a aceitam quando o chamador não informa uma
+            hedging_policy: Política de hedging dos GETs (padrão: None, desativado)
+            circuit_breaker: Circuit breaker por grupo de endpoints (padrão: None)
+        
+        Raises:
+            ImportError: Se o pacote httpx não estiver instalado
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "O cliente assíncrono requer o pacote 'httpx'. "
+                "Instale com: pip install upay-python[async]"
+            )
+        
+        self._httpx = httpx
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.version = version
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.codec = codec or default_codec()
+        self.hooks = list(hooks or ())
+        self.metrics = metrics
+        if metrics is not None:
+            self.hooks.append(metrics)
+        self.gzip_threshold = gzip_threshold
+        self.idempotency_keys = idempotency_keys
+        self.hedging_policy = hedging_policy
+        self.circuit_breaker = circuit_breaker
+        if circuit_breaker is not None and self.hooks:
+            circuit_breaker.add_listener(self._emit_circuit_change)
+        
+        # Vai em cada requisição (e não no AsyncClient) para que os endpoints
+        # públicos possam ser chamados sem ele
+        self.auth_headers = {'Authorization': f'Bearer {api_key}'}
+        self.client = httpx.AsyncClient(
+            headers={
+                'Content-Type': 'application/json',
+                'Accept-Encoding': accept_encoding(),
+                'User-Agent': 'Upay-Python-SDK/1.0.0'
+            },
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+    
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Any:
+        """
+        Faz uma requisição HTTP assíncrona
+        
+        Args:
+            method: Método HTTP (GET, POST, PATCH, DELETE)
+            endpoint: Endpoint da API
+            data: Dados para enviar no body
+            params: Parâmetros de query
+            idempotent: Força a requisição como (não) idempotente para fins
+                de retentativa (padrão: definido pelo método, ou True se
+                houver idempotency_key)
+            idempotency_key: Enviada no header Idempotency-Key; anotada no
+                atributo idempotency_key dos erros levantados
+        
+        Returns:
+            Resposta da API parseada
+        
+        Raises:
+            UpayError: Se houver erro na requisição
+        """
+        url = build_url(self.base_url, self.version, endpoint, params)
+        
+        # GETs idênticos e simultâneos compartilham uma única requisição
+        if self.single_flight is not None and method.upper() == 'GET':
+            return await self.single_flight.do(
+                url,
+                lambda: self._send(method, endpoint, url, data, idempotent, idempotency_key)
+            )
+        
+        return await self._send(method, endpoint, url, data, idempotent, idempotency_key)
+    
+    async def request_public(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """Faz uma requisição a um endpoint público (ver HttpClient.request_public)"""
+        return await self._send(method, path, f"{self.base_url}{path}", data, idempotent, authenticated=False)
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        idempotent: Optional[bool],
+        idempotency_key: Optional[str] = None,
+        authenticated: bool = True
+    ) -> Any:
+        """Envia a requisição, repetindo falhas transitórias conforme a retry_policy"""
+        policy = self.retry_policy
+        attempt = 0
+        # Serializado (e compactado) uma única vez, mesmo com retentativas
+        payload, headers = compress_body(
+            self.codec.encode(data) if data is not None else None,
+            self.auth_headers if authenticated else {},
+            self.gzip_threshold
+        )
+        if idempotency_key is not None:
+            # Com a chave, a API executa a operação uma única vez
+            headers = dict(headers, **{IDEMPOTENCY_HEADER: idempotency_key})
+            if idempotent is None:
+                idempotent = True
+        
+        breaker = self.circuit_breaker
+        circuit_group = breaker.group_by(template_endpoint(endpoint)) if breaker is not None else None
+        probe = False
+        
+        hedge_endpoint = None
+        if self.hedging_policy is not None and policy.is_idempotent(method, idempotent):
+            hedge_endpoint = template_endpoint(endpoint)
+            if not self.hedging_policy.applies_to(method, hedge_endpoint):
+                hedge_endpoint = None
+        
+        while True:
+            attempt += 1
+            
+            # Com o circuito aberto, falha na hora em vez de esperar o timeout
+            if breaker is not None:
+                try:
+                    probe = breaker.before_call(circuit_group)
+                except UpayCircuitOpenError as error:
+                    error.idempotency_key = idempotency_key
+                    raise
+            
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            
+            info = timings = None
+            extensions = {}
+            if self.hooks:
+                info = RequestInfo(method, template_endpoint(endpoint), url, attempt, len(payload or b""))
+                emit(self.hooks, "on_request", info)
+                timings = {}
+                extensions["trace"] = _timing_trace(timings)
+            started = time.perf_counter()
+            # Se a tentativa terminou nos hooks (on_response, on_retry ou on_error)
+            closed = False
+            
+            try:
+                try:
+                    if hedge_endpoint is not None:
+                        response = await self._hedged_request(
+                            method, url, payload, headers, timings, hedge_endpoint
+                        )
+                    else:
+                        response = await self.client.request(
+                            method=method,
+                            url=url,
+                            content=payload,
+                            headers=headers,
+                            extensions=extensions
+                        )
+                except self._httpx.HTTPError as e:
+                    if breaker is not None:
+                        breaker.after_call(circuit_group, probe, True, time.perf_counter() - started)
+                    retry = policy.should_retry(method, attempt, idempotent=idempotent)
+                    delay = policy.compute_delay(attempt) if retry else 0.0
+                    error = e if retry else Exception(f"Erro na requisição: {str(e)}")
+                    if info is not None:
+                        _apply_timings(info, timings, started)
+                        if retry:
+                            emit(self.hooks, "on_retry", info, error, delay)
+                        else:
+                            emit(self.hooks, "on_error", info, error)
+                    closed = True
+                    if retry:
+                        await asyncio.sleep(delay)
+                        continue
+                    if idempotency_key is not None:
+                        error.idempotency_key = idempotency_key
+                    raise error
+                
+                if breaker is not None:
+                    breaker.after_call(
+                        circuit_group,
+                        probe,
+                        breaker.is_failure(response.status_code),
+                        time.perf_counter() - started
+                    )
+                if info is not None:
+                    _apply_timings(info, timings, started)
+                    info.status = response.status_code
+                    info.bytes_received = len(response.content)
+                    info.request_id = response.headers.get('X-Request-Id')
+                
+                # Parse da resposta
+                try:
+                    body = self.codec.decode(response.content)
+                except ValueError:
+                    body = response.text
+                
+                # Verifica se houve erro
+                if not response.is_success:
+                    error = handle_api_error(response, body)
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if policy.should_retry(method, attempt, response.status_code, idempotent, retry_after):
+                        delay = policy.compute_delay(attempt, retry_after)
+                        if info is not None:
+                            emit(self.hooks, "on_retry", info, error, delay)
+                        closed = True
+                        await asyncio.sleep(delay)
+                        continue
+                    if info is not None:
+                        emit(self.hooks, "on_error", info, error)
+                    closed = True
+                    if idempotency_key is not None:
+                        error.idempotency_key = idempotency_key
+                    raise error
+                
+                if info is not None:
+                    emit(self.hooks, "on_response", info)
+                return body
+            except BaseException as e:
+                # Erros inesperados (CancelledError, KeyboardInterrupt...) também
+                # fecham a tentativa nos hooks
+                if info is not None and not closed:
+                    _apply_timings(info, timings, started)
+                    emit(self.hooks, "on_error", info, e)
+                raise
+    
+    async def _hedged_request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[bytes],
+        headers: Dict[str, str],
+        timings: Optional[Dict[str, float]],
+        endpoint: str
+    ) -> Any:
+        """
+        Envia a requisição e, se ela passar do atraso da hedging_policy, uma
+        cópia; vale a primeira resposta e a outra é cancelada
+        
+        Um erro de rede ou uma resposta 5xx só vale se a outra requisição
+        também falhar (ver HttpClient._hedged_send).
+        
+        timings (dos hooks) recebe os instantes da requisição vencedora.
+        """
+        policy = self.hedging_policy
+        policy.on_request()
+        
+        async def send(trace_timings: Optional[Dict[str, float]], record: bool) -> Any:
+            extensions = {"trace": _timing_trace(trace_timings)} if trace_timings is not None else {}
+            started = time.perf_counter()
+            response = await self.client.request(
+                method=method,
+                url=url,
+                content=payload,
+                headers=headers,
+                extensions=extensions
+            )
+            # Só a primeira requisição entra no percentil (ver HttpClient._hedged_send)
+            if record:
+                policy.record(endpoint, time.perf_counter() - started)
+            return response
+        
+        primary = asyncio.ensure_future(send(timings, True))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=policy.hedge_delay(endpoint))
+            if done or not policy.try_hedge():
+                return await primary
+            
+            hedge_timings = {} if timings is not None else None
+            hedge = asyncio.ensure_future(send(hedge_timings, False))
+            pending = {primary, hedge}
+            error = failed = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        error = error or asyncio.CancelledError()
+                        continue
+                    if task.exception() is not None:
+                        # A outra requisição ainda pode responder
+                        error = error or task.exception()
+                        continue
+                    if task.result().status_code >= 500:
+                        failed = failed or task
+                        continue
+                    if task is hedge:
+                        policy.on_hedge_win()
+                        if timings is not None:
+                            timings.clear()
+                            timings.update(hedge_timings)
+                    return task.result()
+            if failed is not None:
+                if failed is hedge and timings is not None:
+                    timings.clear()
+                    timings.update(hedge_timings)
+                return failed.result()
+            raise error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    def idempotency_key(self, key: Optional[str] = None) -> Optional[str]:
+        """Chave de uma operação idempotente: a informada ou uma nova (se idempotency_keys)"""
+        return resolve_idempotency_key(key, self.idempotency_keys)
+    
+    def _emit_circuit_change(self, group: str, old_state: str, new_state: str) -> None:
+        """Repassa as mudanças de estado do circuit breaker aos hooks"""
+        emit(self.hooks, "on_circuit_state_change", group, old_state, new_state)
+    
+    def hedging_stats(self) -> Dict[str, int]:
+        """Retorna os contadores do hedging (vazio se desativado)"""
+        if self.hedging_policy is None:
+            return {}
+        return self.hedging_policy.stats()
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Retorna os contadores do agrupamento de GETs (vazio se desativado)"""
+        if self.single_flight is None:
+            return {}
+        return self.single_flight.stats()
+    
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Faz uma requisição GET"""
+        return await self.request('GET', endpoint, params=params)
+    
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Any:
+        """Faz uma requisição POST"""
+        return await self.request('POST', endpoint, data=data, idempotency_key=idempotency_key)
+    
+    async def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        """Faz uma requisição PATCH"""
+        return await self.request('PATCH', endpoint, data=data)
+    
+    async def delete(self, endpoint: str) -> Any:
+        """Faz uma requisição DELETE"""
+        return await self.request('DELETE', endpoint)
+    
+    async def aclose(self) -> None:
+        """Fecha o pool de conexões"""
+        await self.client.aclose()
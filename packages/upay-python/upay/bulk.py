@@ -0,0 +1,123 @@
+"""
+Execução de operações em lote com concorrência limitada
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+
+def split_update_item(item: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Separa o 'id' dos campos a atualizar em um item de bulk_update"""
+    data = {k: v for k, v in item.items() if k != "id"}
+    return item.get("id"), data
+
+
+def validate_update_item(item: Dict[str, Any], validate: Callable[[Dict[str, Any]], None]) -> None:
+    """Valida um item de bulk_update (id obrigatório + validação do update)"""
+    resource_id, data = split_update_item(item)
+    if not resource_id:
+        raise ValueError("ID é obrigatório")
+    validate(data)
+
+
+def _success(index: int, data: Any) -> Dict[str, Any]:
+    return {"index": index, "success": True, "data": data, "error": None}
+
+
+def _failure(index: int, error: Exception) -> Dict[str, Any]:
+    return {"index": index, "success": False, "data": None, "error": error}
+
+
+def _validate_all(
+    items: Sequence[Dict[str, Any]],
+    validate: Callable[[Dict[str, Any]], None],
+    results: List[Any]
+) -> List[int]:
+    """
+    Valida todos os itens antes de enviar; retorna os índices válidos
+    
+    Qualquer exceção da validação (ValueError, mas também TypeError de um
+    preço não numérico ou AttributeError de um item None) fica no resultado
+    do próprio item, sem interromper o lote.
+    """
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            validate(item)
+        except Exception as e:
+            results[index] = _failure(index, e)
+        else:
+            valid.append(index)
+    return valid
+
+
+def run_bulk(
+    items: Sequence[Dict[str, Any]],
+    validate: Callable[[Dict[str, Any]], None],
+    send: Callable[[Dict[str, Any]], Any],
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Valida e envia uma lista de itens com concorrência limitada
+    
+    Todos os itens são validados antes do primeiro envio. Itens inválidos não
+    são enviados, e uma falha em um item não interrompe os demais.
+    
+    Args:
+        items: Itens a enviar
+        validate: Função que levanta ValueError (ou outra exceção) se o item
+            for inválido
+        send: Função que envia um item e retorna a resposta da API
+        concurrency: Máximo de requisições simultâneas
+    
+    Returns:
+        Um resultado por item, na ordem de entrada, com:
+            - index: Posição do item na lista
+            - success: Se o item foi processado com sucesso
+            - data: Resposta da API (ou None)
+            - error: Exceção levantada (ou None)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser pelo menos 1")
+    
+    results: List[Any] = [None] * len(items)
+    valid = _validate_all(items, validate, results)
+    
+    if valid:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(valid))) as executor:
+            futures = {executor.submit(send, items[index]): index for index in valid}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = _success(index, future.result())
+                except Exception as e:
+                    results[index] = _failure(index, e)
+    
+    return results
+
+
+async def arun_bulk(
+    items: Sequence[Dict[str, Any]],
+    validate: Callable[[Dict[str, Any]], None],
+    send: Callable[[Dict[str, Any]], Awaitable[Any]],
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """Versão assíncrona de run_bulk"""
+    import asyncio
+    
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser pelo menos 1")
+    
+    results: List[Any] = [None] * len(items)
+    valid = _validate_all(items, validate, results)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(index: int) -> None:
+        async with semaphore:
+            try:
+                results[index] = _success(index, await send(items[index]))
+            except Exception as e:
+                results[index] = _failure(index, e)
+    
+    await asyncio.gather(*(run(index) for index in valid))
+    return results
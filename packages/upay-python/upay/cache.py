@@ -0,0 +1,198 @@
+"""
+Cache de leitura em memória (TTL + LRU) para endpoints GET
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+
+class ReadCache:
+    """
+    Cache de leitura com expiração por tempo e descarte LRU
+    
+    As entradas são separadas por recurso ("payment_links", "products"), cada
+    um com seu próprio TTL. Escritas feitas pelo mesmo cliente (update,
+    delete) invalidam as entradas do objeto alterado.
+    
+    Os valores em cache são compartilhados entre as chamadas; não os modifique.
+    As chaves não incluem a URL base nem a API key: não compartilhe um cache
+    entre clientes de contas ou ambientes diferentes.
+    
+    Para não guardar um valor que ficou velho durante a busca (um update()
+    concorrente), leia generation() antes de buscar e passe-o a store().
+    
+    Exemplo:
+        >>> from upay import UpayClient, ReadCache
+        >>>
+        >>> cache = ReadCache(maxsize=2000, ttl=30, ttl_by_resource={"products": 300})
+        >>> upay = UpayClient(api_key="sua_api_key", cache=cache)
+        >>> upay.payment_links.get_by_slug("promo")  # busca na API
+        >>> upay.payment_links.get_by_slug("promo")  # servido do cache
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 0, 'invalidations': 0, 'size': 1}
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        ttl_by_resource: Optional[Dict[str, float]] = None
+    ):
+        """
+        Inicializa o cache
+        
+        Args:
+            maxsize: Máximo de entradas; acima disso a menos usada é descartada
+            ttl: Tempo de vida padrão das entradas, em segundos
+            ttl_by_resource: TTL específico por recurso, ex.: {"products": 300}
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser pelo menos 1")
+        
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttl_by_resource = dict(ttl_by_resource or {})
+        
+        self._lock = threading.Lock()
+        # chave -> (expira_em, valor, tags)
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any, Tuple]]" = OrderedDict()
+        # tag -> chaves marcadas com ela
+        self._tags: Dict[Tuple[str, Hashable], Set[Tuple[str, Hashable]]] = {}
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "invalidations"), 0
+        )
+        # Cada invalidate() avança a geração; tag -> geração da última invalidação
+        self._generation = 0
+        self._invalidated: "OrderedDict[Tuple[str, Hashable], int]" = OrderedDict()
+        # Geração mais alta já descartada de _invalidated
+        self._forgotten = 0
+    
+    def lookup(self, resource: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca uma entrada
+        
+        Args:
+            resource: Nome do recurso
+            key: Chave dentro do recurso, ex.: ("id", "abc")
+        
+        Returns:
+            (encontrado, valor)
+        """
+        full_key = (resource, key)
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return False, None
+            
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(full_key)
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return False, None
+            
+            self._entries.move_to_end(full_key)
+            self._counters["hits"] += 1
+            return True, value
+    
+    def generation(self) -> int:
+        """
+        Retorna a geração atual, avançada a cada invalidate()
+        
+        Returns:
+            Valor a passar para store() depois da busca
+        """
+        with self._lock:
+            return self._generation
+    
+    def store(
+        self,
+        resource: str,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[Hashable] = (),
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Guarda uma entrada
+        
+        Args:
+            resource: Nome do recurso
+            key: Chave dentro do recurso
+            value: Valor a guardar
+            tags: Identificadores (ex.: ID do objeto) usados para invalidar a entrada
+            generation: Geração lida antes da busca; se alguma tag foi
+                invalidada depois dela, o valor está velho e não é guardado
+        """
+        full_key = (resource, key)
+        full_tags = tuple((resource, tag) for tag in tags if tag is not None)
+        expires_at = time.monotonic() + self.ttl_by_resource.get(resource, self.ttl)
+        
+        with self._lock:
+            if generation is not None and self._is_stale(full_tags, generation):
+                return
+            
+            if full_key in self._entries:
+                self._remove(full_key)
+            
+            self._entries[full_key] = (expires_at, value, full_tags)
+            for tag in full_tags:
+                self._tags.setdefault(tag, set()).add(full_key)
+            
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._counters["evictions"] += 1
+    
+    def invalidate(self, resource: str, tag: Hashable) -> None:
+        """
+        Remove todas as entradas de um objeto
+        
+        Args:
+            resource: Nome do recurso
+            tag: Identificador do objeto (normalmente o ID)
+        """
+        full_tag = (resource, tag)
+        with self._lock:
+            self._generation += 1
+            self._invalidated[full_tag] = self._generation
+            self._invalidated.move_to_end(full_tag)
+            if len(self._invalidated) > self.maxsize:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+            
+            for full_key in list(self._tags.get(full_tag, ())):
+                self._remove(full_key)
+                self._counters["invalidations"] += 1
+    
+    def clear(self) -> None:
+        """Remove todas as entradas"""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores de hits, misses, evictions, expirations, invalidations e o tamanho atual"""
+        with self._lock:
+            return dict(self._counters, size=len(self._entries))
+    
+    def _is_stale(self, full_tags: Tuple, generation: int) -> bool:
+        """Diz se o valor buscado na geração dada ficou velho (chamado com o lock adquirido)"""
+        if generation >= self._generation:
+            return False
+        # Sem o histórico dessa geração, não há como saber: não guarda
+        if generation < self._forgotten:
+            return True
+        return any(self._invalidated.get(tag, 0) > generation for tag in full_tags)
+    
+    def _remove(self, full_key: Tuple[str, Hashable]) -> None:
+        """Remove uma entrada e suas tags (chamado com o lock adquirido)"""
+        _, _, tags = self._entries.pop(full_key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(full_key)
+                if not keys:
+                    del self._tags[tag]
@@ -0,0 +1,287 @@
+"""
+Circuit breaker por grupo de endpoints
+
+Quando a API está fora do ar ou lenta, cada chamada ficaria presa até o
+timeout, esgotando as threads (ou tasks) de quem usa o SDK. O circuit
+breaker acompanha as últimas chamadas de cada grupo de endpoints
+(transactions, payment-links...) e, se a taxa de erros ou de chamadas
+lentas passar do limite, abre o circuito: as chamadas seguintes falham na
+hora com UpayCircuitOpenError. Depois de probe_interval segundos o circuito
+fica meio aberto e deixa passar chamadas de teste; se elas derem certo, o
+circuito fecha, senão volta a abrir.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from .utils.errors import UpayCircuitOpenError
+
+logger = logging.getLogger("upay.circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# (grupo, estado anterior, novo estado)
+StateListener = Callable[[str, str, str], None]
+
+
+def endpoint_group(endpoint: str) -> str:
+    """
+    Grupo padrão de um endpoint: o primeiro segmento do caminho
+    
+    Args:
+        endpoint: Endpoint da API (ex.: /transactions/{id}/refund)
+    
+    Returns:
+        Nome do grupo (ex.: "transactions")
+    """
+    return endpoint.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+class _Circuit:
+    """Estado do circuito de um grupo"""
+    
+    __slots__ = ("state", "outcomes", "failures", "slow", "since", "probes")
+    
+    def __init__(self, window: int):
+        self.state = CLOSED
+        # (falhou, lenta) das últimas chamadas, com os totais mantidos à parte
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self.failures = 0
+        self.slow = 0
+        # Instante da última mudança de estado
+        self.since = 0.0
+        self.probes = 0
+    
+    def reset(self) -> None:
+        self.outcomes.clear()
+        self.failures = self.slow = self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker (closed/open/half_open) por grupo de endpoints
+    
+    Contam como falha os erros de rede/timeout e as respostas com status em
+    failure_statuses; erros 4xx (validação, não encontrado...) não contam.
+    
+    Exemplo:
+        >>> from upay import UpayClient, CircuitBreaker, UpayCircuitOpenError
+        >>>
+        >>> upay = UpayClient(
+        ...     api_key="sua_api_key",
+        ...     circuit_breaker=CircuitBreaker(failure_rate=0.5, slow_call_duration=5.0)
+        ... )
+        >>> try:
+        ...     upay.transactions.get("tx_123")
+        ... except UpayCircuitOpenError as e:
+        ...     print(f"API indisponível, tente em {e.retry_after:.0f}s")
+    """
+    
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        probe_interval: float = 30.0,
+        half_open_calls: int = 1,
+        failure_statuses: Tuple[int, ...] = (500, 502, 503, 504),
+        group_by: Callable[[str], str] = endpoint_group,
+        on_state_change: Optional[StateListener] = None
+    ):
+        """
+        Inicializa o circuit breaker
+        
+        Args:
+            failure_rate: Fração de falhas na janela que abre o circuito
+            slow_call_duration: Segundos a partir dos quais uma chamada é lenta
+                (None não considera a latência)
+            slow_call_rate: Fração de chamadas lentas na janela que abre o circuito
+            window: Quantidade de chamadas recentes avaliadas por grupo
+            min_calls: Chamadas necessárias na janela antes de avaliar as taxas
+            probe_interval: Segundos com o circuito aberto antes das chamadas de teste
+            half_open_calls: Chamadas de teste simultâneas no estado half_open
+            failure_statuses: Status HTTP que contam como falha
+            group_by: Função endpoint (com placeholders) -> grupo
+            on_state_change: Função (grupo, estado anterior, novo estado)
+                chamada a cada mudança de estado
+        """
+        if not 0 < failure_rate <= 1 or not 0 < slow_call_rate <= 1:
+            raise ValueError("failure_rate e slow_call_rate devem estar entre 0 e 1")
+        if window < 1 or not 1 <= min_calls <= window:
+            raise ValueError("min_calls deve estar entre 1 e window")
+        if half_open_calls < 1:
+            raise ValueError("half_open_calls deve ser pelo menos 1")
+        
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.probe_interval = probe_interval
+        self.half_open_calls = half_open_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self.group_by = group_by
+        
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[StateListener] = []
+        if on_state_change is not None:
+            self._listeners.append(on_state_change)
+    
+    def add_listener(self, listener: StateListener) -> None:
+        """Registra mais uma função chamada a cada mudança de estado"""
+        self._listeners.append(listener)
+    
+    def _circuit(self, group: str) -> _Circuit:
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit(self.window)
+        return circuit
+    
+    def _transition(self, group: str, circuit: _Circuit, state: str, now: float) -> Tuple[str, str, str]:
+        """Muda o estado (com o lock adquirido) e retorna o evento a notificar"""
+        old = circuit.state
+        circuit.state = state
+        circuit.since = now
+        circuit.reset()
+        return group, old, state
+    
+    def _notify(self, event: Optional[Tuple[str, str, str]]) -> None:
+        """Registra no log e avisa os listeners, fora do lock"""
+        if event is None:
+            return
+        group, old, new = event
+        log = logger.warning if new == OPEN else logger.info
+        log("Circuito de '%s': %s -> %s", group, old, new)
+        for listener in self._listeners:
+            try:
+                listener(group, old, new)
+            except Exception:
+                logger.exception("Erro no listener do circuit breaker")
+    
+    def before_call(self, group: str) -> bool:
+        """
+        Autoriza uma chamada do grupo
+        
+        Args:
+            group: Grupo de endpoints
+        
+        Returns:
+            True se a chamada é de teste (estado half_open)
+        
+        Raises:
+            UpayCircuitOpenError: Se o circuito estiver aberto
+        """
+        event = None
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state == CLOSED:
+                return False
+            
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = circuit.since + self.probe_interval - now
+                if remaining > 0:
+                    raise UpayCircuitOpenError(group, remaining)
+                event = self._transition(group, circuit, HALF_OPEN, now)
+            
+            if circuit.probes >= self.half_open_calls:
+                if now - circuit.since < self.probe_interval:
+                    raise UpayCircuitOpenError(group, circuit.since + self.probe_interval - now)
+                # Chamadas de teste sem resultado (ex.: task cancelada): libera novas
+                circuit.probes = 0
+                circuit.since = now
+            circuit.probes += 1
+        
+        self._notify(event)
+        return True
+    
+    def after_call(self, group: str, probe: bool, failed: bool, duration: float) -> None:
+        """
+        Registra o resultado de uma chamada autorizada por before_call
+        
+        Args:
+            group: Grupo de endpoints
+            probe: Valor retornado por before_call
+            failed: Se a chamada falhou (rede, timeout ou status de falha)
+            duration: Segundos da chamada
+        """
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        event = None
+        with self._lock:
+            circuit = self._circuit(group)
+            now = time.monotonic()
+            
+            if probe:
+                if circuit.state == HALF_OPEN:
+                    if failed or slow:
+                        event = self._transition(group, circuit, OPEN, now)
+                    else:
+                        event = self._transition(group, circuit, CLOSED, now)
+            elif circuit.state == CLOSED:
+                if len(circuit.outcomes) == circuit.outcomes.maxlen:
+                    old_failed, old_slow = circuit.outcomes[0]
+                    circuit.failures -= old_failed
+                    circuit.slow -= old_slow
+                circuit.outcomes.append((failed, slow))
+                circuit.failures += failed
+                circuit.slow += slow
+                
+                calls = len(circuit.outcomes)
+                if calls >= self.min_calls and (
+                    circuit.failures >= self.failure_rate * calls
+                    or circuit.slow >= self.slow_call_rate * calls
+                ):
+                    event = self._transition(group, circuit, OPEN, now)
+        
+        self._notify(event)
+    
+    def is_failure(self, status: Optional[int]) -> bool:
+        """Indica se o status (None para erro de rede) conta como falha"""
+        return status is None or status in self.failure_statuses
+    
+    def state(self, group: str) -> str:
+        """Retorna o estado atual do circuito do grupo"""
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() - circuit.since >= self.probe_interval:
+                # Aberto, mas a próxima chamada já será de teste
+                return HALF_OPEN
+            return circuit.state
+    
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Retorna o estado de cada grupo
+        
+        Returns:
+            {grupo: {"state", "calls", "failure_rate", "slow_rate"}} com as
+            taxas da janela atual
+        """
+        with self._lock:
+            groups = list(self._circuits)
+        result = {}
+        for group in groups:
+            state = self.state(group)
+            with self._lock:
+                circuit = self._circuits[group]
+                calls = len(circuit.outcomes)
+                result[group] = {
+                    "state": state,
+                    "calls": calls,
+                    "failure_rate": circuit.failures / calls if calls else 0.0,
+                    "slow_rate": circuit.slow / calls if calls else 0.0,
+                }
+        return result
+    
+    def reset(self) -> None:
+        """Fecha todos os circuitos e descarta as janelas"""
+        with self._lock:
+            self._circuits.clear()
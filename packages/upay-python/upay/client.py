@@ -2,8 +2,17 @@
 Cliente principal do SDK Upay
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+from requests.adapters import BaseAdapter
 from .http import HttpClient
+from .cache import ReadCache
+from .codec import JSONCodec
+from .hooks import Hooks
+from .transport import Transport
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .hedging import HedgingPolicy
+from .circuit_breaker import CircuitBreaker
 from .resources.payment_links import PaymentLinksResource
 from .resources.transactions import TransactionsResource
 from .resources.products import ProductsResource
@@ -11,6 +20,9 @@ from .resources.clients import ClientsResource
 from .resources.coupons import CouponsResource
 from .utils.webhooks import verify_webhook_signature
 
+if TYPE_CHECKING:
+    from .metrics import MetricsCollector
+
 
 class UpayClient:
     """
@@ -36,7 +48,26 @@ class UpayClient:
         api_key: str,
         base_url: Optional[str] = None,
         version: str = "v1",
-        timeout: int = 30
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        codec: Optional[JSONCodec] = None,
+        models: bool = False,
+        cache: Optional[ReadCache] = None,
+        coupon_cache_ttl: Optional[float] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        metrics: Optional["MetricsCollector"] = None,
+        adapter: Optional[BaseAdapter] = None,
+        transport: Optional[Transport] = None,
+        gzip_threshold: Optional[int] = None,
+        idempotency_keys: bool = True,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ):
         """
         Inicializa o cliente Upay
@@ -46,9 +77,74 @@ class UpayClient:
             base_url: URL base da API (padrão: https://upay-sistema-api.onrender.com)
             version: Versão da API (padrão: v1)
             timeout: Timeout das requisições em segundos (padrão: 30)
+            pool_connections: Quantidade de pools (hosts) mantidos em cache (padrão: 10)
+            pool_maxsize: Máximo de conexões por host (padrão: 10). Ajuste para o
+                número de threads que compartilham o cliente
+            pool_block: Se True, espera por uma conexão livre quando o pool está
+                esgotado em vez de abrir uma conexão extra descartável (padrão: False)
+            keepalive_timeout: Segundos que uma conexão pode ficar ociosa antes de
+                ser descartada (padrão: None, sem limite)
+            retry_policy: Política de retentativas para falhas transitórias (padrão:
+                até 3 tentativas, com backoff exponencial, só em métodos idempotentes)
+            rate_limiter: Limitador de requisições do lado do cliente, ex.:
+                TokenBucket(rate=10, burst=20) ou FileTokenBucket(...) para
+                dividir a cota entre processos do mesmo host (padrão: None)
+            coalesce_requests: Se True, GETs idênticos (mesma URL e parâmetros)
+                feitos ao mesmo tempo compartilham uma única requisição e o mesmo
+                resultado (padrão: False)
+            codec: Codec JSON usado para enviar e ler os corpos (JSONCodec).
+                Padrão: OrjsonCodec se o orjson estiver instalado, senão StdlibCodec
+            models: Se True, as listagens (list, iter_all, list_all), as
+                consultas (get, get_by_slug), os links de pagamento criados e as
+                validações de cupom retornam modelos tipados com __slots__
+                (upay.models) em vez de dicts; eles também aceitam acesso no
+                estilo dict (padrão: False)
+            cache: Cache de leitura (ReadCache) para payment_links.get,
+                payment_links.get_by_slug e products.get; não o compartilhe com
+                clientes de outra API key ou URL base (padrão: None, desativado)
+            coupon_cache_ttl: Se informado, memoriza os resultados de
+                coupons.validate() por esse tempo, em segundos (padrão: None)
+            hooks: Lista de Hooks (upay.hooks) chamados em cada tentativa de
+                requisição, com método, endpoint, status, bytes e tempos de
+                conexão/TTFB/total, ex.: [OpenTelemetryHooks()] (padrão: None)
+            metrics: MetricsCollector (upay.metrics) que agrega histogramas de
+                latência por endpoint e status, requisições em voo, retentativas
+                e erros por classe, exportáveis no formato do Prometheus
+                (padrão: None)
+            adapter: Transport adapter do requests usado no lugar do pool padrão,
+                ex.: RecordingAdapter("trocas.jsonl.gz") para gravar as trocas com
+                a API e ReplayAdapter("trocas.jsonl.gz") para reproduzi-las sem
+                rede (upay.replay). As opções pool_* são ignoradas (padrão: None)
+            transport: Transporte das requisições (upay.transport). Padrão:
+                RequestsTransport (requests, HTTP/1.1, com as opções pool_*).
+                HTTP2Transport() multiplexa as chamadas simultâneas em poucas
+                conexões HTTP/2 (padrão: None)
+            gzip_threshold: Compacta com gzip (Content-Encoding: gzip) os corpos
+                enviados com pelo menos esse número de bytes, ex.: 4096 para
+                links com muitos produtos em redes lentas (padrão: None, nunca).
+                As respostas são sempre pedidas com Accept-Encoding: gzip
+                (e br, se o pacote brotli estiver instalado)
+            idempotency_keys: Se True, transactions.create/process/capture/refund
+                e payment_links.create enviam uma chave de idempotência gerada
+                (UUID4) quando o chamador não informa idempotency_key. Com a
+                chave, essas chamadas são repetidas com segurança após falhas
+                de rede e 5xx; ela fica em result["idempotencyKey"] e no
+                atributo idempotency_key dos erros (padrão: True)
+            hedging_policy: HedgingPolicy (upay.hedging) para reduzir a latência
+                de cauda dos GETs: se a resposta passar do percentil configurado
+                das latências recentes do endpoint, uma segunda requisição é
+                enviada e vale a primeira que responder, com no máximo `budget`
+                requisições extras (padrão: None, desativado)
+            circuit_breaker: CircuitBreaker (upay.circuit_breaker) por grupo de
+                endpoints: se a taxa de erros ou de chamadas lentas passar do
+                limite, as chamadas do grupo falham na hora com
+                UpayCircuitOpenError até as chamadas de teste darem certo. As
+                mudanças de estado vão para os hooks (on_circuit_state_change)
+                e para o log "upay.circuit_breaker" (padrão: None)
             
         Raises:
-            ValueError: Se api_key não for fornecida
+            ValueError: Se api_key não for fornecida, ou se adapter e
+                transport forem informados juntos
         """
         if not api_key:
             raise ValueError("API Key é obrigatória")
@@ -57,15 +153,77 @@ class UpayClient:
             api_key=api_key,
             base_url=base_url or "https://upay-sistema-api.onrender.com",
             version=version,
-            timeout=timeout
+            timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive_timeout=keepalive_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            codec=codec,
+            hooks=hooks,
+            metrics=metrics,
+            adapter=adapter,
+            transport=transport,
+            gzip_threshold=gzip_threshold,
+            idempotency_keys=idempotency_keys,
+            hedging_policy=hedging_policy,
+            circuit_breaker=circuit_breaker
         )
         
+        self.cache = cache
+        self.metrics = metrics
+        
         # Inicializa recursos
-        self.payment_links = PaymentLinksResource(self._http)
-        self.transactions = TransactionsResource(self._http)
-        self.products = ProductsResource(self._http)
-        self.clients = ClientsResource(self._http)
-        self.coupons = CouponsResource(self._http)
+        self.payment_links = PaymentLinksResource(self._http, cache, models)
+        self.transactions = TransactionsResource(self._http, models)
+        self.products = ProductsResource(self._http, cache, models)
+        self.clients = ClientsResource(self._http, models)
+        self.coupons = CouponsResource(self._http, coupon_cache_ttl, models)
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Retorna as estatísticas do pool de conexões do transporte
+        
+        Útil para dimensionar pool_maxsize: muitas new_connections ou
+        discarded_connections em relação a reused_connections indicam que o
+        pool é pequeno para a concorrência atual.
+        
+        Returns:
+            Dicionário com new_connections, reused_connections,
+            expired_connections e discarded_connections
+        """
+        return self._http.pool_stats()
+    
+    def hedging_stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do hedging (hedging_policy)
+        
+        Returns:
+            Dicionário com requests, hedged, hedge_wins e budget_denied
+        """
+        return self._http.hedging_stats()
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do agrupamento de GETs (coalesce_requests=True)
+        
+        Returns:
+            Dicionário com requests (requisições enviadas) e coalesced
+            (chamadas atendidas por uma requisição que já estava em voo)
+        """
+        return self._http.coalescing_stats()
+    
+    def close(self) -> None:
+        """Fecha as conexões do cliente"""
+        self._http.close()
+    
+    def __enter__(self) -> "UpayClient":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def verify_webhook_signature(
         self,
@@ -0,0 +1,121 @@
+"""
+Agrupamento (single-flight) de requisições GET idênticas e simultâneas
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call:
+    """Requisição em andamento compartilhada entre os chamadores"""
+    
+    __slots__ = ("event", "result", "error")
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Garante que só uma requisição por chave esteja em andamento
+    
+    Enquanto uma chamada para a chave está em voo, as demais threads esperam
+    por ela e recebem o mesmo resultado (ou a mesma exceção) em vez de
+    enviar outra requisição. O resultado é compartilhado; não o modifique.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._counters = {"requests": 0, "coalesced": 0}
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Executa fn() ou espera a execução já em andamento para a mesma chave
+        
+        Args:
+            key: Identificador da requisição (ex.: método + URL)
+            fn: Função que faz a requisição
+        
+        Returns:
+            Resultado de fn()
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._counters["requests"] += 1
+                leader = True
+        
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores
+        
+        Returns:
+            Dicionário com:
+                - requests: Requisições realmente enviadas
+                - coalesced: Chamadas atendidas por uma requisição já em voo
+        """
+        with self._lock:
+            return dict(self._counters)
+
+
+class AsyncSingleFlight:
+    """Versão para asyncio do SingleFlight (um event loop por instância)"""
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future"] = {}
+        self._counters = {"requests": 0, "coalesced": 0}
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Executa fn() ou aguarda a execução já em andamento para a mesma chave"""
+        import asyncio
+        
+        task = self._calls.get(key)
+        if task is not None:
+            self._counters["coalesced"] += 1
+            return await asyncio.shield(task)
+        
+        # A requisição roda numa task própria: se quem a iniciou for
+        # cancelado, os demais continuam esperando o mesmo resultado
+        task = asyncio.ensure_future(fn())
+        task.add_done_callback(lambda t: self._finish(key, t))
+        self._calls[key] = task
+        self._counters["requests"] += 1
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Hashable, task: "asyncio.Future") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Evita o aviso "exception was never retrieved" quando ninguém esperou
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores (ver SingleFlight.stats)"""
+        return dict(self._counters)
@@ -0,0 +1,101 @@
+"""
+Codificação JSON plugável (orjson quando instalado, senão a biblioteca padrão)
+"""
+
+import json
+import math
+from typing import Any, Union
+
+# Corpo a decodificar: bytes da resposta ou do webhook
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JSONCodec:
+    """
+    Interface de um codec JSON
+    
+    encode() produz os bytes enviados no corpo da requisição e decode()
+    recebe os bytes da resposta diretamente, sem montar uma string antes.
+    decode() deve levantar ValueError para um corpo que não é JSON.
+    
+    Os codecs embutidos aceitam chaves não-str (int, float, bool, None) como
+    o json padrão e gravam NaN e ±Infinity como null, que é o que o orjson faz.
+    """
+    
+    name = "base"
+    
+    def encode(self, obj: Any) -> bytes:
+        """Serializa um objeto em bytes UTF-8"""
+        raise NotImplementedError
+    
+    def decode(self, data: JSONInput) -> Any:
+        """Desserializa bytes (ou str) em objetos Python"""
+        raise NotImplementedError
+
+
+class StdlibCodec(JSONCodec):
+    """Codec usando o módulo json da biblioteca padrão"""
+    
+    name = "json"
+    
+    def encode(self, obj: Any) -> bytes:
+        try:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+        except ValueError:
+            # NaN/Infinity não são JSON válido; grava null como o orjson
+            text = json.dumps(_finite(obj), separators=(",", ":"), ensure_ascii=False)
+        return text.encode("utf-8")
+    
+    def decode(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec usando orjson (pip install upay-python[fast])
+    
+    Raises:
+        ImportError: Se o pacote orjson não estiver instalado
+    """
+    
+    name = "orjson"
+    
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+    
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            # Tipos que o orjson não serializa (ex.: int acima de 64 bits)
+            return _STDLIB.encode(obj)
+    
+    def decode(self, data: JSONInput) -> Any:
+        # orjson.JSONDecodeError é subclasse de ValueError
+        return self._orjson.loads(data)
+
+
+def _finite(obj: Any) -> Any:
+    """Copia obj trocando floats NaN/Infinity por None"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+_STDLIB = StdlibCodec()
+
+
+def default_codec() -> JSONCodec:
+    """Retorna o OrjsonCodec se o orjson estiver instalado, senão o StdlibCodec"""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibCodec()
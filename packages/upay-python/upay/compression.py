@@ -0,0 +1,45 @@
+"""
+Compressão dos corpos das requisições e respostas
+"""
+
+import gzip
+from importlib.util import find_spec
+from typing import Dict, Optional, Tuple
+
+# Nível do gzip dos corpos enviados: 6 reduz quase tanto quanto 9 com
+# bem menos CPU (ver benchmarks/bench_compression.py)
+GZIP_LEVEL = 6
+
+
+def accept_encoding() -> str:
+    """
+    Valor do header Accept-Encoding
+    
+    Returns:
+        "gzip, br" se houver um decodificador brotli instalado (requests e
+        httpx usam brotli ou brotlicffi), senão "gzip"
+    """
+    if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+        return "gzip, br"
+    return "gzip"
+
+
+def compress_body(
+    payload: Optional[bytes],
+    headers: Dict[str, str],
+    threshold: Optional[int]
+) -> Tuple[Optional[bytes], Dict[str, str]]:
+    """
+    Compacta o corpo com gzip se ele tiver pelo menos threshold bytes
+    
+    Args:
+        payload: Corpo serializado
+        headers: Headers da requisição
+        threshold: Tamanho mínimo para compactar (None desativa)
+    
+    Returns:
+        (corpo, headers), com Content-Encoding: gzip quando compactado
+    """
+    if threshold is None or payload is None or len(payload) < threshold:
+        return payload, headers
+    return gzip.compress(payload, GZIP_LEVEL), dict(headers, **{"Content-Encoding": "gzip"})
@@ -0,0 +1,171 @@
+"""
+Requisições "hedged" para reduzir a latência de cauda das leituras
+
+Se um GET não responde dentro de um atraso (por padrão o percentil 95 das
+latências recentes do mesmo endpoint), uma segunda requisição idêntica é
+enviada e vale a primeira resposta que chegar. Como só ~5% das chamadas
+passam desse atraso, o custo extra é pequeno, e ainda é limitado por um
+orçamento: no máximo `budget` requisições extras por requisição normal.
+O orçamento começa vazio, então as primeiras 1/budget requisições (20 com
+o padrão) nunca são hedged.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional
+
+
+class _LatencyWindow:
+    """Latências recentes de um endpoint, com o percentil recalculado aos poucos"""
+    
+    __slots__ = ("samples", "pending", "delay")
+    
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.pending = 0
+        self.delay: Optional[float] = None
+
+
+class HedgingPolicy:
+    """
+    Política de hedging dos GETs
+    
+    Exemplo:
+        >>> from upay import UpayClient, HedgingPolicy
+        >>>
+        >>> upay = UpayClient(
+        ...     api_key="sua_api_key",
+        ...     hedging_policy=HedgingPolicy(percentile=0.95, budget=0.05)
+        ... )
+    """
+    
+    # Recalcula o percentil a cada tantas amostras novas
+    RECOMPUTE_EVERY = 16
+    
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        delay: Optional[float] = None,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        budget: float = 0.05,
+        burst: int = 10,
+        window: int = 1000,
+        min_samples: int = 50,
+        endpoints: Optional[Iterable[str]] = None
+    ):
+        """
+        Inicializa a política
+        
+        Args:
+            percentile: Percentil das latências recentes do endpoint usado
+                como atraso antes da segunda requisição
+            delay: Atraso fixo em segundos (ignora percentile)
+            initial_delay: Atraso usado até o endpoint ter min_samples amostras
+            min_delay: Menor atraso aceito
+            budget: Fração máxima de requisições extras (0.05 = até 5% a mais)
+            burst: Máximo de requisições extras acumuladas no orçamento, que
+                começa vazio
+            window: Quantidade de latências recentes guardadas por endpoint
+            min_samples: Amostras necessárias para usar o percentil
+            endpoints: Endpoints (no formato de template, ex.:
+                "/payment-links/slug/{slug}") elegíveis; None libera todos os GETs
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile deve estar entre 0 e 1")
+        if budget < 0:
+            raise ValueError("budget não pode ser negativo")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window e min_samples devem ser pelo menos 1")
+        
+        self.percentile = percentile
+        self.delay = delay
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _LatencyWindow] = {}
+        self._tokens = 0.0
+        self._counters = {"requests": 0, "hedged": 0, "hedge_wins": 0, "budget_denied": 0}
+    
+    def applies_to(self, method: str, endpoint: str) -> bool:
+        """Indica se a requisição pode ser hedged (GETs dos endpoints elegíveis)"""
+        if method.upper() != "GET":
+            return False
+        return self.endpoints is None or endpoint in self.endpoints
+    
+    def hedge_delay(self, endpoint: str) -> float:
+        """
+        Retorna quanto esperar pela primeira resposta antes de enviar a segunda
+        
+        Args:
+            endpoint: Endpoint no formato de template
+        
+        Returns:
+            Atraso em segundos
+        """
+        if self.delay is not None:
+            return max(self.min_delay, self.delay)
+        
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None or len(window.samples) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            if window.delay is None or window.pending >= self.RECOMPUTE_EVERY:
+                ordered = sorted(window.samples)
+                window.delay = ordered[max(0, math.ceil(self.percentile * len(ordered)) - 1)]
+                window.pending = 0
+            return max(self.min_delay, window.delay)
+    
+    def record(self, endpoint: str, latency: float) -> None:
+        """Anota a latência de uma requisição concluída (só as primeiras, não as cópias)"""
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                window = self._windows[endpoint] = _LatencyWindow(self.window)
+            window.samples.append(latency)
+            window.pending += 1
+    
+    def on_request(self) -> None:
+        """Conta uma requisição elegível, que acrescenta `budget` fichas ao orçamento"""
+        with self._lock:
+            self._counters["requests"] += 1
+            self._tokens = min(float(self.burst), self._tokens + self.budget)
+    
+    def try_hedge(self) -> bool:
+        """
+        Consome uma ficha do orçamento para enviar a segunda requisição
+        
+        Returns:
+            False se o orçamento estiver esgotado
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self._counters["budget_denied"] += 1
+                return False
+            self._tokens -= 1
+            self._counters["hedged"] += 1
+            return True
+    
+    def on_hedge_win(self) -> None:
+        """Conta uma resposta vinda da segunda requisição"""
+        with self._lock:
+            self._counters["hedge_wins"] += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores
+        
+        Returns:
+            Dicionário com requests (GETs elegíveis), hedged (segundas
+            requisições enviadas), hedge_wins (vezes em que a segunda respondeu
+            antes) e budget_denied (hedges barrados pelo orçamento)
+        """
+        with self._lock:
+            return dict(self._counters)
@@ -0,0 +1,239 @@
+"""
+Hooks do ciclo de vida das requisições (observabilidade)
+
+Um hook recebe, a cada tentativa, um RequestInfo com o método, o endpoint
+com os IDs trocados por placeholders (/transactions/{id}), o status, os
+bytes enviados e recebidos e os tempos de conexão, TTFB e total.
+
+Cada tentativa dispara on_request e depois exatamente um destes:
+    - on_response: a resposta foi aceita (2xx/3xx)
+    - on_retry: a tentativa falhou e será repetida
+    - on_error: a tentativa falhou e o erro será lançado ao chamador
+
+Com um CircuitBreaker, on_circuit_state_change avisa quando o circuito de
+um grupo de endpoints muda de estado (closed, open, half_open).
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger("upay.hooks")
+
+# Segmentos fixos dos endpoints; os demais são IDs. "api" aparece nos
+# endpoints públicos, que não passam pela versão (ex.: /api/coupons/validate)
+_STATIC_SEGMENTS = frozenset({
+    "api",
+    "payment-links",
+    "slug",
+    "transactions",
+    "process",
+    "capture",
+    "cancel",
+    "refund",
+    "products",
+    "clients",
+    "coupons",
+    "validate",
+})
+
+
+def template_endpoint(endpoint: str) -> str:
+    """
+    Troca os IDs de um endpoint por placeholders
+    
+    Args:
+        endpoint: Endpoint da API (ex.: /transactions/abc123/capture)
+    
+    Returns:
+        Endpoint com baixa cardinalidade (ex.: /transactions/{id}/capture),
+        próprio para nomes de span e labels de métricas
+    """
+    segments = endpoint.split("?", 1)[0].split("/")
+    for i, segment in enumerate(segments):
+        if segment and segment not in _STATIC_SEGMENTS:
+            segments[i] = "{slug}" if segments[i - 1] == "slug" else "{id}"
+    return "/".join(segments)
+
+
+class RequestInfo:
+    """
+    Dados de uma tentativa de requisição
+    
+    Attributes:
+        method: Método HTTP
+        endpoint: Endpoint com placeholders (ex.: /transactions/{id})
+        url: URL completa
+        attempt: Número da tentativa (1 na primeira)
+        bytes_sent: Tamanho do body enviado
+        status: Status HTTP (None se a requisição falhou sem resposta)
+        bytes_received: Tamanho do body recebido
+        connect_time: Segundos abrindo a conexão (0 se reaproveitada)
+        ttfb: Segundos até o primeiro byte da resposta (inclui connect_time)
+        total_time: Segundos da tentativa inteira, com a leitura do body
+        request_id: Header X-Request-Id da resposta, se houver
+        context: Dicionário livre para os hooks guardarem estado da tentativa
+    """
+    
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "attempt",
+        "bytes_sent",
+        "status",
+        "bytes_received",
+        "connect_time",
+        "ttfb",
+        "total_time",
+        "request_id",
+        "context",
+    )
+    
+    def __init__(self, method: str, endpoint: str, url: str, attempt: int, bytes_sent: int):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.url = url
+        self.attempt = attempt
+        self.bytes_sent = bytes_sent
+        self.status: Optional[int] = None
+        self.bytes_received = 0
+        self.connect_time = 0.0
+        self.ttfb: Optional[float] = None
+        self.total_time = 0.0
+        self.request_id: Optional[str] = None
+        self.context: Dict[str, Any] = {}
+    
+    def __repr__(self) -> str:
+        return (
+            f"RequestInfo({self.method} {self.endpoint} attempt={self.attempt} "
+            f"status={self.status} total={self.total_time:.3f}s)"
+        )
+
+
+class Hooks:
+    """
+    Base dos hooks; sobrescreva só os métodos de interesse
+    
+    Os hooks rodam na thread (ou task) da requisição, então devem ser
+    rápidos. Exceções lançadas por eles são registradas no logger
+    "upay.hooks" e não interrompem a requisição.
+    
+    Exemplo:
+        >>> class SlowCalls(Hooks):
+        ...     def on_response(self, info):
+        ...         if info.total_time > 1:
+        ...             print(info.method, info.endpoint, info.total_time)
+        >>> upay = UpayClient(api_key="...", hooks=[SlowCalls()])
+    """
+    
+    def on_request(self, info: RequestInfo) -> None:
+        """Chamado antes de cada tentativa"""
+    
+    def on_response(self, info: RequestInfo) -> None:
+        """Chamado quando a resposta é aceita"""
+    
+    def on_error(self, info: RequestInfo, error: Exception) -> None:
+        """Chamado quando a tentativa falha e o erro será lançado"""
+    
+    def on_retry(self, info: RequestInfo, error: Exception, delay: float) -> None:
+        """Chamado quando a tentativa falha e será repetida após delay segundos"""
+    
+    def on_circuit_state_change(self, group: str, old_state: str, new_state: str) -> None:
+        """Chamado quando o circuito de um grupo de endpoints muda de estado"""
+
+
+def emit(hooks: Sequence[Hooks], event: str, *args: Any) -> None:
+    """Chama o evento em todos os hooks, sem deixar um hook quebrar a requisição"""
+    for hook in hooks:
+        try:
+            getattr(hook, event)(*args)
+        except Exception:
+            logger.exception("Hook %r falhou em %s", hook, event)
+
+
+class OpenTelemetryHooks(Hooks):
+    """
+    Cria um span OpenTelemetry (kind CLIENT) por tentativa de requisição
+    
+    Os spans ficam como filhos do span ativo no momento da chamada, então
+    uma chamada lenta aparece dentro do trace do seu serviço. Os atributos
+    seguem as convenções semânticas de HTTP (http.request.method,
+    url.template, http.response.status_code...), mais os tempos de
+    conexão e TTFB e o X-Request-Id da Upay.
+    
+    Exemplo:
+        >>> from upay.hooks import OpenTelemetryHooks
+        >>> upay = UpayClient(api_key="...", hooks=[OpenTelemetryHooks()])
+    """
+    
+    def __init__(self, tracer: Any = None):
+        """
+        Args:
+            tracer: Tracer do OpenTelemetry (padrão: trace.get_tracer("upay"))
+        
+        Raises:
+            ImportError: Se o pacote opentelemetry-api não estiver instalado
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryHooks requer o pacote 'opentelemetry-api'. "
+                "Instale com: pip install upay-python[otel]"
+            )
+        
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("upay")
+    
+    def on_request(self, info: RequestInfo) -> None:
+        info.context["otel_span"] = self.tracer.start_span(
+            f"{info.method} {info.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": info.method,
+                "url.full": info.url,
+                "url.template": info.endpoint,
+                "http.request.resend_count": info.attempt - 1,
+                "http.request.body.size": info.bytes_sent,
+            },
+        )
+    
+    def on_response(self, info: RequestInfo) -> None:
+        self._end(info)
+    
+    def on_error(self, info: RequestInfo, error: Exception) -> None:
+        self._end(info, error)
+    
+    def on_retry(self, info: RequestInfo, error: Exception, delay: float) -> None:
+        span = info.context.get("otel_span")
+        if span is not None:
+            span.set_attribute("upay.retry_delay", delay)
+        self._end(info, error)
+    
+    def _end(self, info: RequestInfo, error: Optional[Exception] = None) -> None:
+        span = info.context.pop("otel_span", None)
+        if span is None:
+            return
+        
+        if info.status is not None:
+            span.set_attribute("http.response.status_code", info.status)
+            span.set_attribute("http.response.body.size", info.bytes_received)
+        if info.ttfb is not None:
+            span.set_attribute("upay.ttfb", info.ttfb)
+        span.set_attribute("upay.connect_time", info.connect_time)
+        if info.request_id:
+            span.set_attribute("upay.request_id", info.request_id)
+        
+        if error is not None:
+            span.set_attribute("error.type", type(error).__name__)
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        span.end()
+
+
+__all__ = [
+    "Hooks",
+    "RequestInfo",
+    "OpenTelemetryHooks",
+    "template_endpoint",
+]
@@ -3,10 +3,56 @@ Cliente HTTP base para requisições
 """
 
 import json
-from typing import Any, Dict, Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 from urllib.parse import urlencode
-import requests
-from .utils.errors import handle_api_error
+from requests.adapters import BaseAdapter
+from .transport import RequestsTransport, Transport, TransportError, TransportResponse
+from .hooks import Hooks, RequestInfo, emit, template_endpoint
+from .codec import JSONCodec, default_codec
+from .compression import accept_encoding, compress_body
+from .idempotency import IDEMPOTENCY_HEADER, resolve_idempotency_key
+from .coalesce import SingleFlight
+from .hedging import HedgingPolicy
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .utils.errors import UpayCircuitOpenError, handle_api_error
+
+if TYPE_CHECKING:
+    from .metrics import MetricsCollector
+
+
+def build_url(
+    base_url: str,
+    version: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Monta a URL completa de um endpoint versionado da API
+    
+    Args:
+        base_url: URL base da API (sem barra final)
+        version: Versão da API
+        endpoint: Endpoint da API
+        params: Parâmetros de query (valores None são ignorados)
+    
+    Returns:
+        URL completa
+    """
+    url = f"{base_url}/api/{version}{endpoint}"
+    
+    # Adiciona query params
+    if params:
+        # Remove valores None
+        clean_params = {k: v for k, v in params.items() if v is not None}
+        if clean_params:
+            url += f"?{urlencode(clean_params)}"
+    
+    return url
 
 
 class HttpClient:
@@ -17,7 +63,23 @@ class HttpClient:
         api_key: str,
         base_url: str,
         version: str = "v1",
-        timeout: int = 30
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        codec: Optional[JSONCodec] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        metrics: Optional["MetricsCollector"] = None,
+        adapter: Optional[BaseAdapter] = None,
+        transport: Optional[Transport] = None,
+        gzip_threshold: Optional[int] = None,
+        idempotency_keys: bool = True,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ):
         """
         Inicializa o cliente HTTP
@@ -27,34 +89,101 @@ class HttpClient:
             base_url: URL base da API
             version: Versão da API
             timeout: Timeout das requisições em segundos
+            pool_connections: Quantidade de pools (hosts) mantidos em cache
+            pool_maxsize: Máximo de conexões mantidas por host
+            pool_block: Se True, espera uma conexão livre quando o pool esgota
+            keepalive_timeout: Segundos de ociosidade antes de descartar uma conexão
+            retry_policy: Política de retentativas (padrão: RetryPolicy())
+            rate_limiter: Limitador de requisições aplicado a cada envio (opcional)
+            coalesce_requests: Agrupa GETs idênticos simultâneos em uma requisição
+            codec: Codec JSON dos corpos (padrão: orjson se instalado, senão json)
+            hooks: Hooks chamados a cada tentativa (on_request, on_response...)
+            metrics: Coletor de métricas (histogramas de latência, retentativas...)
+            adapter: Transport adapter do requests usado pelo RequestsTransport
+                (padrão: PooledHTTPAdapter com as opções de pool acima)
+            transport: Transporte das requisições (padrão: RequestsTransport);
+                as opções de pool e o adapter valem só para o padrão
+            gzip_threshold: Compacta com gzip os corpos com pelo menos esse
+                número de bytes (padrão: None, nunca)
+            idempotency_keys: Gera uma chave de idempotência nas operações que
+                a aceitam quando o chamador não informa uma
+            hedging_policy: Política de hedging dos GETs (padrão: None, desativado)
+            circuit_breaker: Circuit breaker por grupo de endpoints (padrão: None)
+        
+        Raises:
+            ValueError: Se adapter e transport forem informados juntos
         """
+        if adapter is not None and transport is not None:
+            raise ValueError("Informe adapter ou transport, não os dois")
+        
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.version = version
         self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.codec = codec or default_codec()
+        self.hooks = list(hooks or ())
+        self.metrics = metrics
+        if metrics is not None:
+            self.hooks.append(metrics)
+        self.gzip_threshold = gzip_threshold
+        self.idempotency_keys = idempotency_keys
+        self.hedging_policy = hedging_policy
+        self.circuit_breaker = circuit_breaker
+        if circuit_breaker is not None and self.hooks:
+            circuit_breaker.add_listener(self._emit_circuit_change)
+        # As requisições hedged rodam em threads próprias (o executor só cria
+        # as threads quando recebe trabalho)
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        if hedging_policy is not None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=max(32, 2 * pool_maxsize),
+                thread_name_prefix="upay-hedge"
+            )
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'Bearer {api_key}',
+        self.transport = transport or RequestsTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive_timeout=keepalive_timeout,
+            adapter=adapter
+        )
+        
+        # Endpoints públicos (ex.: validação de cupons) vão sem o Authorization
+        self.public_headers = {
             'Content-Type': 'application/json',
+            'Accept-Encoding': accept_encoding(),
             'User-Agent': 'Upay-Python-SDK/1.0.0'
-        })
+        }
+        self.headers = dict(self.public_headers, Authorization=f'Bearer {api_key}')
     
     def request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        idempotency_key: Optional[str] = None
     ) -> Any:
         """
         Faz uma requisição HTTP
         
+        Falhas transitórias (rede, 429 e 5xx) são repetidas conforme a
+        retry_policy, apenas para métodos idempotentes por padrão.
+        
         Args:
             method: Método HTTP (GET, POST, PATCH, DELETE)
             endpoint: Endpoint da API
             data: Dados para enviar no body
             params: Parâmetros de query
+            idempotent: Força a requisição como (não) idempotente para fins
+                de retentativa (padrão: definido pelo método, ou True se
+                houver idempotency_key)
+            idempotency_key: Enviada no header Idempotency-Key; anotada no
+                atributo idempotency_key dos erros levantados
             
         Returns:
             Resposta da API parseada
@@ -62,45 +191,290 @@ class HttpClient:
         Raises:
             UpayError: Se houver erro na requisição
         """
-        url = f"{self.base_url}/api/{self.version}{endpoint}"
+        url = build_url(self.base_url, self.version, endpoint, params)
         
-        # Adiciona query params
-        if params:
-            # Remove valores None
-            clean_params = {k: v for k, v in params.items() if v is not None}
-            if clean_params:
-                url += f"?{urlencode(clean_params)}"
-        
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                timeout=self.timeout
+        # GETs idênticos e simultâneos compartilham uma única requisição
+        if self.single_flight is not None and method.upper() == 'GET':
+            return self.single_flight.do(
+                url,
+                lambda: self._send(method, endpoint, url, data, idempotent, idempotency_key)
             )
+        
+        return self._send(method, endpoint, url, data, idempotent, idempotency_key)
+    
+    def request_public(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """
+        Faz uma requisição a um endpoint público, fora de /api/{version} e
+        sem o header de autenticação
+        
+        Passa pelas mesmas retentativas, rate limiter, circuit breaker e
+        hooks de request().
+        
+        Args:
+            method: Método HTTP
+            path: Caminho a partir da URL base, ex.: "/api/coupons/validate"
+            data: Dados para enviar no body
+            idempotent: Força a requisição como (não) idempotente para fins
+                de retentativa (padrão: definido pelo método)
+        
+        Returns:
+            Resposta da API parseada
+        
+        Raises:
+            UpayError: Se houver erro na requisição
+        """
+        return self._send(method, path, f"{self.base_url}{path}", data, idempotent, authenticated=False)
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        idempotent: Optional[bool],
+        idempotency_key: Optional[str] = None,
+        authenticated: bool = True
+    ) -> Any:
+        """Envia a requisição, repetindo falhas transitórias conforme a retry_policy"""
+        policy = self.retry_policy
+        attempt = 0
+        # Serializado (e compactado) uma única vez, mesmo com retentativas
+        payload, headers = compress_body(
+            self.codec.encode(data) if data is not None else None,
+            self.headers if authenticated else self.public_headers,
+            self.gzip_threshold
+        )
+        if idempotency_key is not None:
+            # Com a chave, a API executa a operação uma única vez
+            headers = dict(headers, **{IDEMPOTENCY_HEADER: idempotency_key})
+            if idempotent is None:
+                idempotent = True
+        
+        breaker = self.circuit_breaker
+        circuit_group = breaker.group_by(template_endpoint(endpoint)) if breaker is not None else None
+        probe = False
+        
+        hedge_endpoint = None
+        if self.hedging_policy is not None and policy.is_idempotent(method, idempotent):
+            hedge_endpoint = template_endpoint(endpoint)
+            if not self.hedging_policy.applies_to(method, hedge_endpoint):
+                hedge_endpoint = None
+        
+        while True:
+            attempt += 1
             
-            # Parse da resposta
-            try:
-                body = response.json()
-            except ValueError:
-                body = response.text
+            # Com o circuito aberto, falha na hora em vez de esperar o timeout
+            if breaker is not None:
+                try:
+                    probe = breaker.before_call(circuit_group)
+                except UpayCircuitOpenError as error:
+                    error.idempotency_key = idempotency_key
+                    raise
             
-            # Verifica se houve erro
-            if not response.ok:
-                raise handle_api_error(response, body)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             
-            return body
+            info = None
+            if self.hooks:
+                info = RequestInfo(method, template_endpoint(endpoint), url, attempt, len(payload or b""))
+                emit(self.hooks, "on_request", info)
+            started = time.perf_counter()
+            # Se a tentativa terminou nos hooks (on_response, on_retry ou on_error)
+            closed = False
             
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Erro na requisição: {str(e)}")
+            try:
+                try:
+                    if hedge_endpoint is not None:
+                        response = self._hedged_send(method, url, payload, headers, hedge_endpoint)
+                    else:
+                        response = self.transport.send(method, url, payload, headers, self.timeout)
+                except TransportError as e:
+                    if breaker is not None:
+                        breaker.after_call(circuit_group, probe, True, time.perf_counter() - started)
+                    retry = policy.should_retry(method, attempt, idempotent=idempotent)
+                    delay = policy.compute_delay(attempt) if retry else 0.0
+                    error = e if retry else Exception(f"Erro na requisição: {str(e)}")
+                    if info is not None:
+                        info.total_time = time.perf_counter() - started
+                        if retry:
+                            emit(self.hooks, "on_retry", info, error, delay)
+                        else:
+                            emit(self.hooks, "on_error", info, error)
+                    closed = True
+                    if retry:
+                        time.sleep(delay)
+                        continue
+                    if idempotency_key is not None:
+                        error.idempotency_key = idempotency_key
+                    raise error
+                
+                if breaker is not None:
+                    breaker.after_call(
+                        circuit_group,
+                        probe,
+                        breaker.is_failure(response.status_code),
+                        time.perf_counter() - started
+                    )
+                if info is not None:
+                    self._record_response(info, response, started)
+                
+                # Parse da resposta
+                try:
+                    body = self.codec.decode(response.content)
+                except ValueError:
+                    body = response.text
+                
+                # Verifica se houve erro
+                if not response.ok:
+                    error = handle_api_error(response, body)
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if policy.should_retry(method, attempt, response.status_code, idempotent, retry_after):
+                        delay = policy.compute_delay(attempt, retry_after)
+                        if info is not None:
+                            emit(self.hooks, "on_retry", info, error, delay)
+                        closed = True
+                        time.sleep(delay)
+                        continue
+                    if info is not None:
+                        emit(self.hooks, "on_error", info, error)
+                    closed = True
+                    if idempotency_key is not None:
+                        error.idempotency_key = idempotency_key
+                    raise error
+                
+                if info is not None:
+                    emit(self.hooks, "on_response", info)
+                return body
+            except BaseException as e:
+                # Erros inesperados (bug em um Transport próprio, KeyboardInterrupt...)
+                # também fecham a tentativa nos hooks
+                if info is not None and not closed:
+                    info.total_time = time.perf_counter() - started
+                    emit(self.hooks, "on_error", info, e)
+                raise
+    
+    def _hedged_send(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[bytes],
+        headers: Dict[str, str],
+        endpoint: str
+    ) -> TransportResponse:
+        """
+        Envia a requisição e, se ela passar do atraso da hedging_policy, uma
+        cópia; vale a primeira resposta
+        
+        Um erro de rede ou uma resposta 5xx só vale se a outra requisição
+        também falhar; nesse caso volta a primeira resposta 5xx (ou o erro),
+        e a retry_policy decide se repete. 4xx vale como qualquer resposta.
+        
+        A requisição perdedora não é interrompida (o requests não permite),
+        só descartada: a conexão volta ao pool quando ela termina. As duas
+        rodam num pool de max(32, 2 * pool_maxsize) threads; além disso, as
+        requisições esperam numa fila por uma thread livre.
+        """
+        policy = self.hedging_policy
+        policy.on_request()
+        
+        def send(record: bool) -> TransportResponse:
+            started = time.perf_counter()
+            response = self.transport.send(method, url, payload, headers, self.timeout)
+            # Só a primeira requisição entra no percentil: a cópia sai depois
+            # do atraso e mediria a latência a partir de outro instante
+            if record:
+                policy.record(endpoint, time.perf_counter() - started)
+            return response
+        
+        primary = self._hedge_executor.submit(send, True)
+        try:
+            return primary.result(timeout=policy.hedge_delay(endpoint))
+        except FutureTimeout:
+            pass
+        if not policy.try_hedge():
+            return primary.result()
+        
+        hedge = self._hedge_executor.submit(send, False)
+        pending = {primary, hedge}
+        error = None
+        failed_response = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except TransportError as e:
+                    # A outra requisição ainda pode responder
+                    error = error or e
+                    continue
+                if response.status_code >= 500:
+                    failed_response = failed_response or response
+                    continue
+                if future is hedge:
+                    policy.on_hedge_win()
+                return response
+        if failed_response is not None:
+            return failed_response
+        raise error
+    
+    @staticmethod
+    def _record_response(info: RequestInfo, response: TransportResponse, started: float) -> None:
+        """Preenche status, tamanhos e tempos da tentativa a partir da resposta"""
+        info.status = response.status_code
+        info.bytes_received = len(response.content)
+        info.connect_time = response.connect_time
+        info.ttfb = response.ttfb
+        info.total_time = time.perf_counter() - started
+        info.request_id = response.headers.get('X-Request-Id')
+    
+    def idempotency_key(self, key: Optional[str] = None) -> Optional[str]:
+        """Chave de uma operação idempotente: a informada ou uma nova (se idempotency_keys)"""
+        return resolve_idempotency_key(key, self.idempotency_keys)
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Retorna os contadores do agrupamento de GETs (vazio se desativado)"""
+        if self.single_flight is None:
+            return {}
+        return self.single_flight.stats()
+    
+    def _emit_circuit_change(self, group: str, old_state: str, new_state: str) -> None:
+        """Repassa as mudanças de estado do circuit breaker aos hooks"""
+        emit(self.hooks, "on_circuit_state_change", group, old_state, new_state)
+    
+    def hedging_stats(self) -> Dict[str, int]:
+        """Retorna os contadores do hedging (vazio se desativado)"""
+        if self.hedging_policy is None:
+            return {}
+        return self.hedging_policy.stats()
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """Retorna as estatísticas de uso das conexões do transporte"""
+        return self.transport.stats()
+    
+    def close(self) -> None:
+        """Fecha as conexões do transporte"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self.transport.close()
     
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Faz uma requisição GET"""
         return self.request('GET', endpoint, params=params)
     
-    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Any:
+    def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Any:
         """Faz uma requisição POST"""
-        return self.request('POST', endpoint, data=data)
+        return self.request('POST', endpoint, data=data, idempotency_key=idempotency_key)
     
     def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Any:
         """Faz uma requisição PATCH"""
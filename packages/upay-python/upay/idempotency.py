@@ -0,0 +1,59 @@
+"""
+Chaves de idempotência das operações que criam ou movimentam cobranças
+
+Um POST repetido com a mesma chave no header Idempotency-Key é executado
+uma única vez pela API, que devolve o resultado da primeira execução. Com a
+chave, o cliente HTTP pode repetir essas chamadas após falhas de rede ou
+5xx sem risco de cobrança em dobro.
+"""
+
+import uuid
+from typing import Any, Optional
+from .models import Model
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Campo do resultado que recebe a chave usada
+RESULT_FIELD = "idempotencyKey"
+
+
+def new_idempotency_key() -> str:
+    """Gera uma chave aleatória (UUID4)"""
+    return str(uuid.uuid4())
+
+
+def resolve_idempotency_key(key: Optional[str], auto: bool) -> Optional[str]:
+    """
+    Escolhe a chave de uma chamada
+    
+    Args:
+        key: Chave informada pelo chamador
+        auto: Se deve gerar uma chave quando nenhuma for informada
+    
+    Returns:
+        A chave informada, uma nova (se auto) ou None
+    
+    Raises:
+        ValueError: Se a chave informada for vazia
+    """
+    if key is not None:
+        if not str(key).strip():
+            raise ValueError("idempotency_key não pode ser vazia")
+        return str(key)
+    return new_idempotency_key() if auto else None
+
+
+def attach_idempotency_key(result: Any, key: Optional[str]) -> Any:
+    """
+    Anota a chave usada no resultado (dict ou modelo) em result["idempotencyKey"]
+    
+    Args:
+        result: Resultado da chamada
+        key: Chave usada (None não anota nada)
+    
+    Returns:
+        O próprio resultado
+    """
+    if key is not None and isinstance(result, (dict, Model)):
+        result[RESULT_FIELD] = key
+    return result
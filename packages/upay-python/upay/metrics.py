@@ -0,0 +1,289 @@
+"""
+Métricas agregadas das requisições no formato do Prometheus
+
+O MetricsCollector é um Hooks: cada thread grava em contadores próprios
+(sem lock no caminho da requisição) e os valores são somados só na hora de
+exportar.
+"""
+
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from .hooks import Hooks, RequestInfo
+
+# Limites dos buckets de latência em escala logarítmica: 1 ms, 2 ms, ... ~32 s
+LATENCY_BUCKETS: Tuple[float, ...] = tuple(0.001 * 2 ** i for i in range(16))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Shard:
+    """Contadores gravados por uma única thread"""
+    
+    __slots__ = ("thread", "histograms", "in_flight", "retries", "errors")
+    
+    def __init__(self, thread: Optional[threading.Thread]):
+        self.thread = thread
+        # (method, endpoint, status) -> [contagem por bucket..., +Inf, soma]
+        self.histograms: Dict[Tuple[str, str, str], List[float]] = {}
+        self.in_flight: Dict[Tuple[str, str], int] = {}
+        self.retries: Dict[Tuple[str, str, str], int] = {}
+        self.errors: Dict[Tuple[str, str, str], int] = {}
+    
+    def merge_into(self, target: "_Shard") -> None:
+        for key, values in self.histograms.copy().items():
+            merged = target.histograms.get(key)
+            if merged is None:
+                target.histograms[key] = list(values)
+            else:
+                for i, value in enumerate(values):
+                    merged[i] += value
+        for name in ("in_flight", "retries", "errors"):
+            counters = getattr(target, name)
+            for key, value in getattr(self, name).copy().items():
+                counters[key] = counters.get(key, 0) + value
+
+
+class MetricsCollector(Hooks):
+    """
+    Histogramas de latência por endpoint e status, requisições em voo,
+    retentativas, erros por classe e estado dos circuitos (CircuitBreaker)
+    
+    Exemplo:
+        >>> metrics = MetricsCollector()
+        >>> upay = UpayClient(api_key="...", metrics=metrics)
+        >>> print(metrics.render())          # texto no formato do Prometheus
+        >>> serve_metrics(metrics, port=9464)  # ou um endpoint /metrics local
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS, namespace: str = "upay"):
+        """
+        Args:
+            buckets: Limites superiores (segundos) dos buckets de latência
+            namespace: Prefixo dos nomes das métricas
+        """
+        if not buckets or list(buckets) != sorted(buckets):
+            raise ValueError("buckets deve ser uma sequência crescente não vazia")
+        
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        # Soma das threads que já terminaram
+        self._retired = _Shard(None)
+        # Estado atual do circuito de cada grupo (mudanças são raras: usa o lock)
+        self._circuits: Dict[str, str] = {}
+    
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+    
+    def _observe(self, shard: _Shard, info: RequestInfo) -> None:
+        status = str(info.status) if info.status is not None else "none"
+        key = (info.method, info.endpoint, status)
+        values = shard.histograms.get(key)
+        if values is None:
+            values = shard.histograms[key] = [0] * (len(self.buckets) + 2)
+        values[bisect.bisect_left(self.buckets, info.total_time)] += 1
+        values[-1] += info.total_time
+        
+        flight_key = (info.method, info.endpoint)
+        shard.in_flight[flight_key] = shard.in_flight.get(flight_key, 0) - 1
+    
+    # Hooks
+    
+    def on_request(self, info: RequestInfo) -> None:
+        shard = self._shard()
+        key = (info.method, info.endpoint)
+        shard.in_flight[key] = shard.in_flight.get(key, 0) + 1
+    
+    def on_response(self, info: RequestInfo) -> None:
+        self._observe(self._shard(), info)
+    
+    def on_retry(self, info: RequestInfo, error: Exception, delay: float) -> None:
+        shard = self._shard()
+        self._observe(shard, info)
+        key = (info.method, info.endpoint, type(error).__name__)
+        shard.retries[key] = shard.retries.get(key, 0) + 1
+    
+    def on_error(self, info: RequestInfo, error: Exception) -> None:
+        shard = self._shard()
+        self._observe(shard, info)
+        key = (info.method, info.endpoint, type(error).__name__)
+        shard.errors[key] = shard.errors.get(key, 0) + 1
+    
+    def on_circuit_state_change(self, group: str, old_state: str, new_state: str) -> None:
+        with self._lock:
+            self._circuits[group] = new_state
+    
+    # Exportação
+    
+    def _merged(self) -> _Shard:
+        total = _Shard(None)
+        with self._lock:
+            # Threads encerradas não gravam mais: consolida e libera o shard
+            for shard in [s for s in self._shards if not s.thread.is_alive()]:
+                shard.merge_into(self._retired)
+                self._shards.remove(shard)
+            self._retired.merge_into(total)
+            for shard in self._shards:
+                shard.merge_into(total)
+        return total
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna os valores agregados de todas as threads
+        
+        Returns:
+            Dicionário com:
+                - latency: {(method, endpoint, status): {"buckets": {limite: contagem
+                  acumulada}, "count": n, "sum": segundos}}
+                - in_flight: {(method, endpoint): requisições em andamento}
+                - retries: {(method, endpoint, classe do erro): n}
+                - errors: {(method, endpoint, classe do erro): n}
+                - circuits: {grupo: estado do circuito}
+        """
+        merged = self._merged()
+        latency = {}
+        for key, values in merged.histograms.items():
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets + (float("inf"),), values):
+                cumulative += count
+                buckets[bound] = cumulative
+            latency[key] = {"buckets": buckets, "count": cumulative, "sum": values[-1]}
+        return {
+            "latency": latency,
+            "in_flight": merged.in_flight,
+            "retries": merged.retries,
+            "errors": merged.errors,
+            "circuits": dict(self._circuits),
+        }
+    
+    def render(self) -> str:
+        """
+        Exporta as métricas no formato texto do Prometheus (versão 0.0.4)
+        
+        Returns:
+            Texto pronto para ser servido em /metrics
+        """
+        data = self.snapshot()
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_request_duration_seconds Duração das tentativas de requisição à API Upay",
+            f"# TYPE {ns}_request_duration_seconds histogram",
+        ]
+        for (method, endpoint, status), hist in sorted(data["latency"].items()):
+            labels = _labels(method=method, endpoint=endpoint, status=status)
+            for bound, count in hist["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(round(bound, 6))
+                lines.append(f'{ns}_request_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{ns}_request_duration_seconds_sum{{{labels}}} {hist['sum']!r}")
+            lines.append(f"{ns}_request_duration_seconds_count{{{labels}}} {hist['count']}")
+        
+        lines += [
+            f"# HELP {ns}_requests_in_flight Requisições em andamento",
+            f"# TYPE {ns}_requests_in_flight gauge",
+        ]
+        for (method, endpoint), value in sorted(data["in_flight"].items()):
+            lines.append(f"{ns}_requests_in_flight{{{_labels(method=method, endpoint=endpoint)}}} {value}")
+        
+        for name, help_text in (
+            ("retries", "Tentativas repetidas, por classe do erro"),
+            ("errors", "Erros lançados ao chamador, por classe do erro"),
+        ):
+            lines += [f"# HELP {ns}_{name}_total {help_text}", f"# TYPE {ns}_{name}_total counter"]
+            for (method, endpoint, error), value in sorted(data[name].items()):
+                labels = _labels(method=method, endpoint=endpoint, error=error)
+                lines.append(f"{ns}_{name}_total{{{labels}}} {value}")
+        
+        lines += [
+            f"# HELP {ns}_circuit_state Estado do circuito de cada grupo de endpoints (1 no estado atual)",
+            f"# TYPE {ns}_circuit_state gauge",
+        ]
+        for group, current in sorted(data["circuits"].items()):
+            for state in ("closed", "open", "half_open"):
+                value = 1 if state == current else 0
+                lines.append(f"{ns}_circuit_state{{{_labels(group=group, state=state)}}} {value}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def reset(self) -> None:
+        """Zera todas as métricas"""
+        with self._lock:
+            self._shards = []
+            self._retired = _Shard(None)
+            self._local = threading.local()
+            self._circuits = {}
+
+
+def _labels(**labels: str) -> str:
+    """Formata os labels escapando \\, aspas e quebras de linha"""
+    return ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+
+
+def make_metrics_handler(collector: MetricsCollector) -> type:
+    """
+    Cria um handler do http.server que responde GET /metrics
+    
+    Args:
+        collector: Coletor cujas métricas serão expostas
+    
+    Returns:
+        Subclasse de BaseHTTPRequestHandler
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = collector.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return MetricsHandler
+
+
+def serve_metrics(
+    collector: MetricsCollector,
+    port: int = 9464,
+    host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Sobe um servidor HTTP local (thread daemon) com as métricas em /metrics
+    
+    Args:
+        collector: Coletor cujas métricas serão expostas
+        port: Porta (0 escolhe uma livre)
+        host: Endereço de escuta (padrão: só local)
+    
+    Returns:
+        O servidor; chame shutdown() para pará-lo
+    """
+    server = ThreadingHTTPServer((host, port), make_metrics_handler(collector))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="upay-metrics", daemon=True).start()
+    return server
+
+
+__all__ = [
+    "MetricsCollector",
+    "LATENCY_BUCKETS",
+    "make_metrics_handler",
+    "serve_metrics",
+]
@@ -0,0 +1,342 @@
+"""
+Modelos tipados (opcionais) para as respostas da API
+
+Ative com UpayClient(..., models=True). Os modelos usam __slots__, então
+ocupam bem menos memória que um dict por objeto, e continuam aceitando
+acesso no estilo dict (model["amountCents"], model.get("status")) para
+não quebrar código existente. Campos aninhados (client, paymentLink,
+products, metadata) ficam guardados como JSON compacto e só são
+decodificados no primeiro acesso.
+"""
+
+import sys
+from abc import ABCMeta
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Type
+from .codec import default_codec
+
+# Campos aninhados são guardados como bytes
+_codec = default_codec()
+_decode = _codec.decode
+
+
+def _encode(value: Any) -> bytes:
+    # A cópia descarta a sobra do buffer de saída (o orjson reserva 1 KiB)
+    return bytes(memoryview(_codec.encode(value)))
+
+
+class _ModelMeta(ABCMeta):
+    """Gera os __slots__ e as propriedades dos campos aninhados a partir de _fields"""
+    
+    def __new__(mcls, name, bases, namespace):
+        fields = namespace.get("_fields")
+        if fields is not None:
+            nested = namespace.get("_nested", {})
+            interned = namespace.get("_interned", ())
+            slots = []
+            slot_of = {}
+            for key, attr in fields.items():
+                if attr in nested:
+                    slot = "_" + attr
+                    namespace[attr] = _lazy_field(slot, nested[attr])
+                else:
+                    slot = attr
+                slots.append(slot)
+                slot_of[key] = slot
+            
+            namespace["__slots__"] = tuple(slots)
+            namespace["_slot_of"] = slot_of
+            namespace["_attrs"] = frozenset(fields.values())
+            namespace["_interned_slots"] = frozenset(interned)
+        return super().__new__(mcls, name, bases, namespace)
+
+
+def _lazy_field(slot: str, convert: Callable[[Any], Any]) -> property:
+    """Propriedade que decodifica e converte o valor do slot no primeiro acesso"""
+    def getter(self):
+        try:
+            value = object.__getattribute__(self, slot)
+        except AttributeError:
+            return None
+        converted = convert(_decode(value) if isinstance(value, bytes) else value)
+        if converted is not value:
+            object.__setattr__(self, slot, converted)
+        return converted
+    
+    def setter(self, value):
+        object.__setattr__(self, slot, value)
+    
+    return property(getter, setter)
+
+
+class Model(Mapping, metaclass=_ModelMeta):
+    """
+    Base dos modelos
+    
+    Subclasses declaram _fields ({chave da API: atributo}) e, opcionalmente,
+    _nested ({atributo: conversor}) e _interned (atributos com poucos valores
+    distintos, como status, cujas strings são compartilhadas). Campos ausentes na resposta valem None
+    como atributo e não aparecem no acesso estilo dict. Chaves que a API
+    retornar e não estiverem em _fields são preservadas.
+    """
+    
+    __slots__ = ("_extra",)
+    
+    _slot_of: Dict[str, str] = {}
+    _attrs: frozenset = frozenset()
+    _interned_slots: frozenset = frozenset()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        Cria o modelo a partir da resposta da API
+        
+        Args:
+            data: Objeto retornado pela API
+        """
+        obj = cls.__new__(cls)
+        slot_of = cls._slot_of
+        interned = cls._interned_slots
+        extra = None
+        for key, value in data.items():
+            slot = slot_of.get(key)
+            if slot is not None:
+                if slot[0] == "_":
+                    # Aninhado: guardado como JSON até o primeiro acesso
+                    if isinstance(value, (dict, list)):
+                        value = _encode(value)
+                elif slot in interned and type(value) is str:
+                    value = sys.intern(value)
+                object.__setattr__(obj, slot, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        obj._extra = extra
+        return obj
+    
+    def __getattr__(self, name: str) -> Any:
+        # Só é chamado quando o slot não foi preenchido
+        if name in type(self)._attrs:
+            return None
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def __getitem__(self, key: str) -> Any:
+        slot = self._slot_of.get(key)
+        if slot is None:
+            if self._extra is not None and key in self._extra:
+                return self._extra[key]
+            raise KeyError(key)
+        
+        try:
+            value = object.__getattribute__(self, slot)
+        except AttributeError:
+            raise KeyError(key) from None
+        # Campos aninhados passam pela propriedade (conversão preguiçosa)
+        return getattr(self, slot[1:]) if slot[0] == "_" else value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        slot = self._slot_of.get(key)
+        if slot is not None:
+            object.__setattr__(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in self._slot_of.items():
+            try:
+                object.__getattribute__(self, slot)
+            except AttributeError:
+                continue
+            yield key
+        if self._extra is not None:
+            yield from self._extra
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o modelo (e os aninhados) de volta em dicts"""
+        return {key: _to_plain(value) for key, value in self.items()}
+    
+    def __reduce__(self):
+        # O pickle padrão de __slots__ preencheria os campos ausentes com None
+        return (type(self).from_dict, (self.to_dict(),))
+    
+    def __repr__(self) -> str:
+        shown = ", ".join(f"{key}={self[key]!r}" for key in list(self)[:4])
+        return f"{type(self).__name__}({shown})"
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _plain(value: Any) -> Any:
+    """Conversor de um campo aninhado que continua dict/list (ex.: metadata)"""
+    return value
+
+
+def _one(model: Callable[[], Type[Model]]) -> Callable[[Any], Any]:
+    """Conversor de um objeto aninhado (a classe é resolvida no primeiro uso)"""
+    def convert(value):
+        return model().from_dict(value) if isinstance(value, dict) else value
+    return convert
+
+
+def _many(model: Callable[[], Type[Model]]) -> Callable[[Any], Any]:
+    """Conversor de uma lista de objetos aninhados"""
+    def convert(value):
+        if isinstance(value, list) and any(isinstance(item, dict) for item in value):
+            cls = model()
+            return [cls.from_dict(item) if isinstance(item, dict) else item for item in value]
+        return value
+    return convert
+
+
+class Client(Model):
+    """Cliente"""
+    
+    _fields = {
+        "id": "id",
+        "name": "name",
+        "email": "email",
+        "document": "document",
+        "phone": "phone",
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+    }
+
+
+class Product(Model):
+    """Produto"""
+    
+    _fields = {
+        "id": "id",
+        "name": "name",
+        "description": "description",
+        "price": "price",
+        "stockQuantity": "stock_quantity",
+        "stockEnabled": "stock_enabled",
+        "imageUrl": "image_url",
+        "sku": "sku",
+        "category": "category",
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+    }
+    _interned = ("category",)
+
+
+class PaymentLinkProduct(Model):
+    """Produto incluído em um link de pagamento"""
+    
+    _fields = {
+        "productId": "product_id",
+        "quantity": "quantity",
+        "product": "product",
+    }
+    _nested = {"product": _one(lambda: Product)}
+
+
+class PaymentLink(Model):
+    """Link de pagamento"""
+    
+    _fields = {
+        "id": "id",
+        "slug": "slug",
+        "title": "title",
+        "description": "description",
+        "amount": "amount",
+        "currency": "currency",
+        "status": "status",
+        "expiresAt": "expires_at",
+        "redirectUrl": "redirect_url",
+        "settings": "settings",
+        "products": "products",
+        "metaPixelCode": "meta_pixel_code",
+        "stockQuantity": "stock_quantity",
+        "stockEnabled": "stock_enabled",
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+    }
+    _nested = {
+        "settings": _plain,
+        "products": _many(lambda: PaymentLinkProduct),
+    }
+    _interned = ("currency", "status")
+
+
+class Transaction(Model):
+    """Transação"""
+    
+    _fields = {
+        "id": "id",
+        "displayId": "display_id",
+        "product": "product",
+        "amountCents": "amount_cents",
+        "status": "status",
+        "paymentMethod": "payment_method",
+        "clientId": "client_id",
+        "client": "client",
+        "paymentLinkId": "payment_link_id",
+        "paymentLink": "payment_link",
+        "couponCode": "coupon_code",
+        "metadata": "metadata",
+        "pixQrCode": "pix_qr_code",
+        "pixCopyPaste": "pix_copy_paste",
+        "boletoBarcode": "boleto_barcode",
+        "boletoUrl": "boleto_url",
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+        "paidAt": "paid_at",
+    }
+    _nested = {
+        "client": _one(lambda: Client),
+        "payment_link": _one(lambda: PaymentLink),
+        "metadata": _plain,
+    }
+    _interned = ("product", "status", "payment_method")
+
+
+class CouponValidation(Model):
+    """Resultado da validação de um cupom"""
+    
+    _fields = {
+        "code": "code",
+        "valid": "valid",
+        "discountCents": "discount_cents",
+        "discountPercentage": "discount_percentage",
+        "finalAmountCents": "final_amount_cents",
+        "message": "message",
+    }
+
+
+def wrap(model: Optional[Type[Model]], value: Any) -> Any:
+    """Converte uma resposta no modelo, se os modelos estiverem ativos"""
+    if model is None or not isinstance(value, dict):
+        return value
+    return model.from_dict(value)
+
+
+def wrap_page(model: Optional[Type[Model]], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte os itens de uma resposta { data, pagination } no modelo"""
+    if model is not None:
+        result["data"] = [wrap(model, item) for item in result["data"]]
+    return result
+
+
+__all__ = [
+    "Model",
+    "Client",
+    "Product",
+    "PaymentLinkProduct",
+    "PaymentLink",
+    "Transaction",
+    "CouponValidation",
+]
@@ -0,0 +1,298 @@
+"""
+Iteração automática sobre listagens paginadas
+"""
+
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+# (page, cursor) da próxima requisição
+PagePosition = Tuple[Optional[int], Optional[str]]
+
+
+def next_page_position(
+    result: Dict[str, Any],
+    page: Optional[int],
+    limit: Optional[int]
+) -> Optional[PagePosition]:
+    """
+    Descobre a próxima página a partir da resposta de um list()
+    
+    Usa o cursor (pagination.nextCursor) quando a API o retorna; caso
+    contrário avança por número de página usando totalPages, total, hasMore
+    ou, em último caso, se a página veio cheia.
+    
+    Args:
+        result: Resposta de list() no formato { data, pagination }
+        page: Página que foi requisitada
+        limit: Limite que foi requisitado
+    
+    Returns:
+        (page, cursor) da próxima requisição ou None se acabou
+    """
+    items = result.get("data") or []
+    pagination = result.get("pagination") or {}
+    
+    if not items:
+        return None
+    
+    if "nextCursor" in pagination:
+        cursor = pagination.get("nextCursor")
+        return (None, cursor) if cursor else None
+    
+    if pagination.get("hasMore") is False:
+        return None
+    
+    current = pagination.get("page") or page or 1
+    size = pagination.get("limit") or limit or len(items)
+    total_pages = pagination.get("totalPages")
+    total = pagination.get("total")
+    
+    if total_pages is not None:
+        has_more = current < total_pages
+    elif total:
+        has_more = current * size < total
+    elif pagination.get("hasMore"):
+        has_more = True
+    else:
+        has_more = len(items) >= size
+    
+    return (current + 1, None) if has_more else None
+
+
+def total_page_count(result: Dict[str, Any], limit: Optional[int]) -> Optional[int]:
+    """
+    Calcula o total de páginas a partir da resposta da primeira página
+    
+    Args:
+        result: Resposta de list() no formato { data, pagination }
+        limit: Limite que foi requisitado
+    
+    Returns:
+        Total de páginas ou None se a API não informou total/totalPages
+    """
+    pagination = result.get("pagination") or {}
+    
+    if pagination.get("totalPages") is not None:
+        return int(pagination["totalPages"])
+    
+    total = pagination.get("total")
+    size = pagination.get("limit") or limit
+    if not total or not size:
+        return None
+    return math.ceil(total / size)
+
+
+def iterate_pages(
+    fetch_page: Callable[[Optional[int], Optional[str]], Dict[str, Any]],
+    limit: Optional[int],
+    prefetch: bool = False,
+    first_page: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Percorre todas as páginas de uma listagem
+    
+    Args:
+        fetch_page: Função (page, cursor) -> resposta de list()
+        limit: Limite de itens por página
+        prefetch: Se True, busca a próxima página em segundo plano enquanto a
+            atual é processada (no máximo duas páginas ficam em memória)
+        first_page: Resposta da página 1, se já tiver sido buscada
+    
+    Yields:
+        Respostas de list(), uma por página
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        position: Optional[PagePosition] = (1, None)
+        result = first_page if first_page is not None else fetch_page(*position)
+        while True:
+            position = next_page_position(result, position[0], limit)
+            
+            future = None
+            if executor is not None and position is not None:
+                future = executor.submit(fetch_page, *position)
+            
+            yield result
+            
+            if position is None:
+                return
+            result = future.result() if future is not None else fetch_page(*position)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iterate_items(
+    fetch_page: Callable[[Optional[int], Optional[str]], Dict[str, Any]],
+    limit: Optional[int],
+    prefetch: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """Percorre todos os itens de uma listagem (ver iterate_pages)"""
+    for result in iterate_pages(fetch_page, limit, prefetch):
+        yield from result.get("data") or []
+
+
+def collect_items_concurrently(
+    fetch_page: Callable[[Optional[int], Optional[str]], Dict[str, Any]],
+    limit: Optional[int],
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """Junta, em ordem, os itens de todas as páginas (ver iterate_pages_concurrently)"""
+    items = []
+    for result in iterate_pages_concurrently(fetch_page, limit, concurrency):
+        items.extend(result.get("data") or [])
+    return items
+
+
+async def aiterate_pages(
+    fetch_page: Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]],
+    limit: Optional[int],
+    prefetch: bool = False,
+    first_page: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Versão assíncrona de iterate_pages (o prefetch usa uma task)"""
+    import asyncio
+    
+    position: Optional[PagePosition] = (1, None)
+    result = first_page if first_page is not None else await fetch_page(*position)
+    task = None
+    try:
+        while True:
+            position = next_page_position(result, position[0], limit)
+            
+            if prefetch and position is not None:
+                task = asyncio.ensure_future(fetch_page(*position))
+            
+            yield result
+            
+            if position is None:
+                return
+            if task is not None:
+                result, task = await task, None
+            else:
+                result = await fetch_page(*position)
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+async def aiterate_items(
+    fetch_page: Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]],
+    limit: Optional[int],
+    prefetch: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """Versão assíncrona de iterate_items"""
+    async for result in aiterate_pages(fetch_page, limit, prefetch):
+        for item in result.get("data") or []:
+            yield item
+
+
+async def acollect_items_concurrently(
+    fetch_page: Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]],
+    limit: Optional[int],
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """Versão assíncrona de collect_items_concurrently"""
+    items = []
+    async for result in aiterate_pages_concurrently(fetch_page, limit, concurrency):
+        items.extend(result.get("data") or [])
+    return items
+
+
+def iterate_pages_concurrently(
+    fetch_page: Callable[[Optional[int], Optional[str]], Dict[str, Any]],
+    limit: Optional[int],
+    concurrency: int = 8
+) -> Iterator[Dict[str, Any]]:
+    """
+    Percorre uma listagem paginada por número de página buscando várias
+    páginas em paralelo
+    
+    Busca a página 1, calcula o total de páginas pelo pagination e mantém até
+    `concurrency` páginas em andamento. As páginas são entregues em ordem e no
+    máximo `concurrency` respostas ficam em memória. Sem total na resposta, a
+    iteração continua sequencial. Falhas transitórias de cada página são
+    repetidas pelo cliente HTTP (RetryPolicy); um erro que persista interrompe
+    a iteração.
+    
+    Args:
+        fetch_page: Função (page, cursor) -> resposta de list()
+        limit: Limite de itens por página
+        concurrency: Máximo de páginas buscadas ao mesmo tempo
+    
+    Yields:
+        Respostas de list(), uma por página, em ordem
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser pelo menos 1")
+    
+    first = fetch_page(1, None)
+    total_pages = total_page_count(first, limit)
+    
+    if total_pages is None:
+        yield from iterate_pages(fetch_page, limit, first_page=first)
+        return
+    
+    yield first
+    
+    pages = iter(range(2, total_pages + 1))
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()
+    try:
+        for page in pages:
+            pending.append(executor.submit(fetch_page, page, None))
+            if len(pending) >= concurrency:
+                break
+        
+        while pending:
+            result = pending.popleft().result()
+            page = next(pages, None)
+            if page is not None:
+                pending.append(executor.submit(fetch_page, page, None))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiterate_pages_concurrently(
+    fetch_page: Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]],
+    limit: Optional[int],
+    concurrency: int = 8
+) -> AsyncIterator[Dict[str, Any]]:
+    """Versão assíncrona de iterate_pages_concurrently"""
+    import asyncio
+    
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser pelo menos 1")
+    
+    first = await fetch_page(1, None)
+    total_pages = total_page_count(first, limit)
+    
+    if total_pages is None:
+        async for result in aiterate_pages(fetch_page, limit, first_page=first):
+            yield result
+        return
+    
+    yield first
+    
+    pages = iter(range(2, total_pages + 1))
+    pending = deque()
+    try:
+        for page in pages:
+            pending.append(asyncio.ensure_future(fetch_page(page, None)))
+            if len(pending) >= concurrency:
+                break
+        
+        while pending:
+            result = await pending.popleft()
+            page = next(pages, None)
+            if page is not None:
+                pending.append(asyncio.ensure_future(fetch_page(page, None)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
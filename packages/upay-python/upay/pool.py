@@ -0,0 +1,172 @@
+"""
+Pool de conexões configurável para o cliente HTTP
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Tempo gasto abrindo conexões (TCP + TLS) na requisição atual, por thread
+_connect_timer = threading.local()
+
+
+def reset_connect_time() -> None:
+    """Zera o tempo de conexão acumulado pela thread atual"""
+    _connect_timer.seconds = 0.0
+
+
+def connect_time() -> float:
+    """
+    Retorna o tempo (segundos) gasto abrindo conexões na thread atual desde
+    o último reset_connect_time(); 0 quando a conexão foi reaproveitada
+    """
+    return getattr(_connect_timer, "seconds", 0.0)
+
+
+class PoolStats:
+    """Contadores de uso do pool de conexões (thread-safe)"""
+    
+    FIELDS = (
+        "new_connections",
+        "reused_connections",
+        "expired_connections",
+        "discarded_connections",
+    )
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(self.FIELDS, 0)
+    
+    def increment(self, field: str) -> None:
+        """Incrementa um contador"""
+        with self._lock:
+            self._counters[field] += 1
+    
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Retorna uma cópia dos contadores
+        
+        Returns:
+            Dicionário com:
+                - new_connections: Conexões abertas (novo handshake TCP/TLS)
+                - reused_connections: Requisições que reaproveitaram uma conexão
+                - expired_connections: Conexões fechadas por ficarem ociosas demais
+                - discarded_connections: Conexões descartadas com o pool cheio
+        """
+        with self._lock:
+            return dict(self._counters)
+    
+    def reset(self) -> None:
+        """Zera todos os contadores"""
+        with self._lock:
+            self._counters = dict.fromkeys(self.FIELDS, 0)
+
+
+class _TimedConnectionMixin:
+    """Mede o tempo de connect() (handshake TCP e TLS) de uma conexão urllib3"""
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timer.seconds = connect_time() + time.perf_counter() - started
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnectionPool.ConnectionCls):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnectionPool.ConnectionCls):
+    pass
+
+
+class _TrackedPoolMixin:
+    """Registra estatísticas e expira conexões ociosas de um pool urllib3"""
+    
+    stats: PoolStats
+    keepalive_timeout: Optional[float] = None
+    
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        
+        last_used = getattr(conn, "_upay_last_used", None)
+        if (
+            self.keepalive_timeout is not None
+            and last_used is not None
+            and conn.sock is not None
+            and time.monotonic() - last_used > self.keepalive_timeout
+        ):
+            # O servidor provavelmente já fechou a conexão; abre outra
+            conn.close()
+            self.stats.increment("expired_connections")
+        
+        if conn.sock is not None:
+            self.stats.increment("reused_connections")
+        else:
+            self.stats.increment("new_connections")
+        
+        return conn
+    
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._upay_last_used = time.monotonic()
+            if not self.block and self.pool is not None and self.pool.full():
+                self.stats.increment("discarded_connections")
+        super()._put_conn(conn)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Adapter do requests com pool configurável, expiração de conexões
+    ociosas (keep-alive) e estatísticas de reaproveitamento
+    """
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        stats: Optional[PoolStats] = None,
+        **kwargs
+    ):
+        """
+        Inicializa o adapter
+        
+        Args:
+            pool_connections: Quantidade de pools (hosts) mantidos em cache
+            pool_maxsize: Máximo de conexões mantidas por host
+            pool_block: Se True, espera uma conexão livre quando o pool está
+                esgotado; se False, abre uma conexão extra e a descarta depois
+            keepalive_timeout: Segundos que uma conexão pode ficar ociosa antes
+                de ser descartada (None = sem limite)
+            stats: Contadores compartilhados (opcional)
+        """
+        self.stats = stats or PoolStats()
+        self.keepalive_timeout = keepalive_timeout
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            **kwargs
+        )
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        
+        attrs = {"stats": self.stats, "keepalive_timeout": self.keepalive_timeout}
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type(
+                "TrackedHTTPConnectionPool",
+                (_TrackedPoolMixin, HTTPConnectionPool),
+                dict(attrs, ConnectionCls=_TimedHTTPConnection)
+            ),
+            "https": type(
+                "TrackedHTTPSConnectionPool",
+                (_TrackedPoolMixin, HTTPSConnectionPool),
+                dict(attrs, ConnectionCls=_TimedHTTPSConnection)
+            ),
+        }
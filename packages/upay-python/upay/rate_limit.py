@@ -0,0 +1,173 @@
+"""
+Limitador de requisições (token bucket) do lado do cliente
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RateLimiter:
+    """
+    Token bucket base
+    
+    O bucket guarda até `burst` fichas e recebe `rate` fichas por segundo.
+    Cada requisição reserva uma ficha; se o saldo ficar negativo, a chamada
+    espera o tempo necessário para a ficha ser reposta. Subclasses definem
+    apenas onde o estado (fichas, instante da última reposição) é guardado.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Inicializa o limitador
+        
+        Args:
+            rate: Requisições por segundo permitidas
+            burst: Quantidade de requisições que podem sair de uma vez
+        """
+        if rate <= 0:
+            raise ValueError("rate deve ser maior que zero")
+        if burst < 1:
+            raise ValueError("burst deve ser pelo menos 1")
+        
+        self.rate = float(rate)
+        self.burst = burst
+    
+    def _refill(self, tokens: float, last: float, now: float) -> float:
+        """Repõe as fichas acumuladas desde a última reposição"""
+        return min(float(self.burst), tokens + (now - last) * self.rate)
+    
+    def _take(self, tokens: float, last: float, now: float) -> Tuple[float, float]:
+        """Consome uma ficha e retorna (novo saldo, espera em segundos)"""
+        tokens = self._refill(tokens, last, now) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, wait
+    
+    def reserve(self) -> float:
+        """
+        Reserva uma ficha
+        
+        Returns:
+            Segundos que o chamador deve esperar antes de enviar a requisição
+        """
+        raise NotImplementedError
+    
+    def acquire(self) -> None:
+        """Bloqueia a thread até a requisição poder ser enviada"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Aguarda (sem bloquear o event loop) até a requisição poder ser enviada"""
+        wait = self.reserve()
+        if wait > 0:
+            import asyncio
+            await asyncio.sleep(wait)
+
+
+class TokenBucket(RateLimiter):
+    """
+    Token bucket em memória, compartilhado entre as threads do processo
+    
+    Exemplo:
+        >>> from upay import UpayClient, TokenBucket
+        >>>
+        >>> upay = UpayClient(api_key="sua_api_key", rate_limiter=TokenBucket(rate=10, burst=20))
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        super().__init__(rate, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+    
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._take(self._tokens, self._last, now)
+            self._last = now
+            return wait
+
+
+class FileTokenBucket(RateLimiter):
+    """
+    Token bucket guardado em um arquivo com lock, compartilhado por todos os
+    processos do host que usarem o mesmo caminho (ex.: workers do gunicorn)
+    
+    O estado ocupa 16 bytes e é lido/escrito sob um lock exclusivo do
+    sistema operacional, então o limite vale para o host inteiro.
+    
+    Exemplo:
+        >>> from upay import UpayClient, FileTokenBucket
+        >>>
+        >>> limiter = FileTokenBucket("/tmp/upay-rate-limit", rate=25, burst=50)
+        >>> upay = UpayClient(api_key="sua_api_key", rate_limiter=limiter)
+    """
+    
+    _STATE = struct.Struct("dd")
+    
+    def __init__(self, path: str, rate: float, burst: int = 1):
+        """
+        Inicializa o limitador
+        
+        Args:
+            path: Caminho do arquivo de estado (criado se não existir)
+            rate: Requisições por segundo permitidas no host
+            burst: Quantidade de requisições que podem sair de uma vez
+        """
+        super().__init__(rate, burst)
+        self.path = path
+        # O lock do SO é por processo; este serializa as threads locais
+        self._lock = threading.Lock()
+    
+    def _lock_file(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, self._STATE.size)
+    
+    def _unlock_file(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.lockf(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, self._STATE.size)
+    
+    def reserve(self) -> float:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                self._lock_file(fd)
+                try:
+                    now = time.monotonic()
+                    raw = self._read(fd)
+                    tokens, last = float(self.burst), now
+                    if len(raw) == self._STATE.size:
+                        stored_tokens, stored_last = self._STATE.unpack(raw)
+                        # Estado de antes de um reboot (relógio monotônico reiniciado) é ignorado
+                        if stored_last <= now:
+                            tokens, last = stored_tokens, stored_last
+                    
+                    tokens, wait = self._take(tokens, last, now)
+                    
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    os.write(fd, self._STATE.pack(tokens, now))
+                    return wait
+                finally:
+                    self._unlock_file(fd)
+            finally:
+                os.close(fd)
+    
+    def _read(self, fd: int) -> bytes:
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, self._STATE.size)
@@ -0,0 +1,222 @@
+"""
+Gravação e reprodução de trocas HTTP (record/replay)
+
+RecordingAdapter grava cada requisição/resposta feita pelo cliente, com os
+tempos, em um arquivo JSON Lines compactado com gzip. ReplayAdapter lê esse
+arquivo e responde às mesmas requisições sem rede, no ritmo gravado ou o
+mais rápido possível. Os dois são transport adapters do requests e entram
+no cliente pelo parâmetro adapter.
+
+Exemplo:
+    >>> # Em produção (ou staging): grava
+    >>> upay = UpayClient(api_key="...", adapter=RecordingAdapter("incidente.jsonl.gz"))
+    >>> # No notebook, sem rede: reproduz no ritmo gravado
+    >>> upay = UpayClient(api_key="x", adapter=ReplayAdapter("incidente.jsonl.gz"))
+"""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+from requests.adapters import BaseAdapter
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from .pool import PooledHTTPAdapter, PoolStats
+from .utils.errors import UpayError
+
+FORMAT_VERSION = 1
+
+# O corpo é gravado já decodificado; estes headers deixariam de valer
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "set-cookie"})
+
+
+def _target(url: str) -> str:
+    """Caminho + query da URL (o host é ignorado na reprodução)"""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def _dump_body(entry: Dict[str, Any], field: str, body: Optional[bytes]) -> None:
+    if not body:
+        return
+    try:
+        entry[field] = body.decode("utf-8")
+    except UnicodeDecodeError:
+        entry[field + "_b64"] = base64.b64encode(body).decode("ascii")
+
+
+def _load_body(entry: Dict[str, Any], field: str) -> bytes:
+    if field in entry:
+        return entry[field].encode("utf-8")
+    if field + "_b64" in entry:
+        return base64.b64decode(entry[field + "_b64"])
+    return b""
+
+
+def read_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lê as trocas de um arquivo gravado pelo RecordingAdapter
+    
+    Args:
+        path: Caminho do arquivo (.jsonl.gz)
+    
+    Returns:
+        Iterador de dicts com method, url, status, headers, body, elapsed
+        (segundos até os headers), duration (segundos da troca inteira) e
+        offset (segundos desde o início da gravação)
+    
+    Raises:
+        ValueError: Se o arquivo for de uma versão de formato desconhecida
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            entry = json.loads(line)
+            if "format" in entry:
+                if entry["format"] != FORMAT_VERSION:
+                    raise ValueError(f"Formato de gravação não suportado: {entry['format']}")
+                continue
+            yield entry
+
+
+class RecordingAdapter(PooledHTTPAdapter):
+    """
+    Adapter com pool (PooledHTTPAdapter) que grava cada troca em arquivo
+    
+    O header Authorization nunca é gravado. Cada troca é escrita e enviada
+    ao disco na hora, então a gravação pode ser interrompida a qualquer
+    momento sem perder o que já foi registrado.
+    """
+    
+    def __init__(self, path: str, **kwargs):
+        """
+        Args:
+            path: Arquivo de saída (.jsonl.gz); gravações existentes são
+                sobrescritas
+            **kwargs: Opções do PooledHTTPAdapter (pool_maxsize, ...)
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"format": FORMAT_VERSION, "created": time.time()})
+    
+    def _write(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        # O adapter retorna ao receber os headers; o corpo ainda não foi lido
+        elapsed = time.perf_counter() - started
+        if not kwargs.get("stream"):
+            # Lê o corpo aqui para que a duração inclua a transferência
+            response.content
+        duration = time.perf_counter() - started
+        
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        entry = {
+            "offset": round(started - self._started, 6),
+            "method": request.method,
+            "url": _target(request.url),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            },
+            "elapsed": round(elapsed, 6),
+            "duration": round(duration, 6),
+        }
+        _dump_body(entry, "request_body", body)
+        if not kwargs.get("stream"):
+            _dump_body(entry, "body", response.content)
+        self._write(entry)
+        return response
+    
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        super().close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Adapter que responde com as trocas gravadas, sem acessar a rede
+    
+    Cada requisição é casada pelo método e pelo caminho + query (o host e
+    o corpo são ignorados); requisições iguais recebem as respostas na
+    ordem em que foram gravadas.
+    """
+    
+    def __init__(self, path: str, speed: Optional[float] = 1.0, loop: bool = False):
+        """
+        Args:
+            path: Arquivo gravado pelo RecordingAdapter
+            speed: 1.0 reproduz no ritmo gravado, 2.0 no dobro da velocidade;
+                None ou 0 responde imediatamente
+            loop: Se True, volta ao início das respostas de uma requisição
+                quando elas acabam (útil para rodar um perfil várias vezes)
+        """
+        super().__init__()
+        if speed is not None and speed < 0:
+            raise ValueError("speed não pode ser negativo")
+        
+        self.speed = speed
+        self.loop = loop
+        self.stats = PoolStats()
+        self.entries: List[Dict[str, Any]] = list(read_recording(path))
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        for entry in self.entries:
+            self._queues.setdefault((entry["method"], entry["url"]), deque()).append(entry)
+    
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True, cert=None, proxies=None) -> Response:
+        key = (request.method, _target(request.url))
+        with self._lock:
+            queue = self._queues.get(key)
+            entry = queue.popleft() if queue else None
+            if entry is not None and self.loop:
+                queue.append(entry)
+        
+        if entry is None:
+            raise UpayError(
+                f"Nenhuma resposta gravada para {key[0]} {key[1]}",
+                code="REPLAY_MISS"
+            )
+        
+        if self.speed:
+            time.sleep(entry["duration"] / self.speed)
+        
+        response = Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = _load_body(entry, "body")
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(seconds=entry["elapsed"] / self.speed if self.speed else 0)
+        return response
+    
+    def close(self) -> None:
+        pass
+
+
+__all__ = [
+    "RecordingAdapter",
+    "ReplayAdapter",
+    "read_recording",
+]
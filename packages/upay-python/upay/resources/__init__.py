@@ -2,11 +2,11 @@
 Recursos do SDK Upay
 """
 
-from .payment_links import PaymentLinksResource
-from .transactions import TransactionsResource
-from .products import ProductsResource
-from .clients import ClientsResource
-from .coupons import CouponsResource
+from .payment_links import PaymentLinksResource, AsyncPaymentLinksResource
+from .transactions import TransactionsResource, AsyncTransactionsResource
+from .products import ProductsResource, AsyncProductsResource
+from .clients import ClientsResource, AsyncClientsResource
+from .coupons import CouponsResource, AsyncCouponsResource
 
 __all__ = [
     'PaymentLinksResource',
@@ -14,4 +14,9 @@ __all__ = [
     'ProductsResource',
     'ClientsResource',
     'CouponsResource',
+    'AsyncPaymentLinksResource',
+    'AsyncTransactionsResource',
+    'AsyncProductsResource',
+    'AsyncClientsResource',
+    'AsyncCouponsResource',
 ]
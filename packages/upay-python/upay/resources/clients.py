@@ -3,15 +3,75 @@ Recurso de Clientes
 """
 
 import re
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, AsyncIterator, Awaitable, Callable, List
 from ..http import HttpClient
+from ..models import Client, wrap, wrap_page
+from ..bulk import run_bulk, arun_bulk, split_update_item, validate_update_item
+from ..pagination import (
+    iterate_items,
+    aiterate_items,
+    collect_items_concurrently,
+    acollect_items_concurrently,
+)
+
+if TYPE_CHECKING:
+    # Só para as anotações: o cliente síncrono não carrega asyncio/httpx
+    from ..async_http import AsyncHttpClient
+
+
+def _is_valid_email(email: str) -> bool:
+    """Valida formato de email"""
+    pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
+    return bool(re.match(pattern, email))
+
+
+def _validate_create_data(data: Dict[str, Any]) -> None:
+    """Valida os dados de criação de um cliente"""
+    # Validação básica
+    if not data.get("name") or len(str(data["name"]).strip()) == 0:
+        raise ValueError("Nome do cliente é obrigatório")
+    
+    if not data.get("email") or not _is_valid_email(data["email"]):
+        raise ValueError("Email inválido")
+
+
+def _validate_update_data(data: Dict[str, Any]) -> None:
+    """Valida os dados de atualização de um cliente"""
+    if data.get("email") and not _is_valid_email(data["email"]):
+        raise ValueError("Email inválido")
+
+
+def _list_params(
+    page: Optional[int],
+    limit: Optional[int],
+    cursor: Optional[str],
+    order_by: Optional[str],
+    order_direction: Optional[str]
+) -> Dict[str, Any]:
+    """Monta os parâmetros de query da listagem"""
+    return {
+        "page": page,
+        "limit": limit,
+        "cursor": cursor,
+        "orderBy": order_by,
+        "orderDirection": order_direction,
+    }
+
+
+def _map_list_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Mapear resposta: { message, clients, pagination } -> { data, pagination }"""
+    return {
+        "data": response.get("clients") or response.get("data") or [],
+        "pagination": response.get("pagination") or {"total": 0, "page": 1, "limit": 10}
+    }
 
 
 class ClientsResource:
     """Recurso para gerenciar Clientes"""
     
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, models: bool = False):
         self.http = http
+        self.model = Client if models else None
     
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -27,15 +87,58 @@ class ClientsResource:
         Returns:
             Cliente criado
         """
-        # Validação básica
-        if not data.get("name") or len(str(data["name"]).strip()) == 0:
-            raise ValueError("Nome do cliente é obrigatório")
-        
-        if not data.get("email") or not self._is_valid_email(data["email"]):
-            raise ValueError("Email inválido")
+        _validate_create_data(data)
         
         return self.http.post("/clients", data)
     
+    def bulk_create(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Cria vários clientes com concorrência limitada
+        
+        Todos os itens passam pela mesma validação de create() antes do
+        primeiro envio; itens inválidos não são enviados e uma falha não
+        interrompe os demais.
+        
+        Args:
+            items: Lista de dados, no mesmo formato de create()
+            concurrency: Máximo de requisições simultâneas (padrão: 8)
+        
+        Returns:
+            Um resultado por item, na ordem de entrada, com index, success,
+            data (resposta da API) e error (exceção levantada)
+        
+        Exemplo:
+            >>> results = upay.clients.bulk_create([{"name": "Maria", "email": "maria@example.com"}, ...], concurrency=16)
+            >>> failed = [r for r in results if not r["success"]]
+        """
+        return run_bulk(items, _validate_create_data, self.create, concurrency)
+    
+    def bulk_update(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Atualiza vários clientes com concorrência limitada
+        
+        Args:
+            items: Lista de dicionários com 'id' e os campos a atualizar
+            concurrency: Máximo de requisições simultâneas (padrão: 8)
+        
+        Returns:
+            Um resultado por item, no mesmo formato de bulk_create()
+        """
+        return run_bulk(
+            items,
+            lambda item: validate_update_item(item, _validate_update_data),
+            lambda item: self.update(*split_update_item(item)),
+            concurrency
+        )
+    
     def list(
         self,
         page: Optional[int] = None,
@@ -57,21 +160,85 @@ class ClientsResource:
         Returns:
             Dicionário com 'data' (lista) e 'pagination'
         """
-        params = {
-            "page": page,
-            "limit": limit,
-            "cursor": cursor,
-            "orderBy": order_by,
-            "orderDirection": order_direction,
-        }
+        params = _list_params(page, limit, cursor, order_by, order_direction)
         
         response = self.http.get("/clients", params)
         
-        # Mapear resposta: { message, clients, pagination } -> { data, pagination }
-        return {
-            "data": response.get("clients") or response.get("data") or [],
-            "pagination": response.get("pagination") or {"total": 0, "page": 1, "limit": 10}
-        }
+        return wrap_page(self.model, _map_list_response(response))
+    
+    def iter_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        prefetch: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre todos os clientes, seguindo cursor ou página automaticamente
+        
+        Os itens são entregues um a um e só uma página fica em memória
+        (duas com prefetch).
+        
+        Args:
+            limit: Itens por página (padrão: 100)
+            order_by: Campo para ordenação
+            order_direction: Direção da ordenação (ASC ou DESC)
+            prefetch: Busca a próxima página em segundo plano enquanto a atual é processada
+        
+        Yields:
+            Cada cliente
+        
+        Exemplo:
+            >>> for item in upay.clients.iter_all(limit=200, prefetch=True):
+            ...     print(item["id"])
+        """
+        fetch_page = self._page_fetcher(limit, order_by, order_direction)
+        return iterate_items(fetch_page, limit, prefetch)
+    
+    def list_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca todos os clientes baixando várias páginas em paralelo
+        
+        Busca a página 1, calcula o total de páginas a partir de
+        pagination.total e baixa as demais com até `concurrency` requisições
+        simultâneas. Páginas com erro transitório são repetidas. Se a API não
+        informar o total, as páginas são buscadas em sequência.
+        
+        Args:
+            limit: Itens por página (padrão: 100)
+            order_by: Campo para ordenação
+            order_direction: Direção da ordenação (ASC ou DESC)
+            concurrency: Máximo de páginas buscadas ao mesmo tempo (padrão: 8)
+        
+        Returns:
+            Lista com todos os clientes, na ordem das páginas
+        """
+        fetch_page = self._page_fetcher(limit, order_by, order_direction)
+        return collect_items_concurrently(fetch_page, limit, concurrency)
+    
+    def _page_fetcher(
+        self,
+        limit: int,
+        order_by: Optional[str],
+        order_direction: Optional[str]
+    ) -> Callable[[Optional[int], Optional[str]], Dict[str, Any]]:
+        """Cria a função (page, cursor) -> list() usada pela paginação automática"""
+        def fetch_page(page, cursor):
+            return self.list(
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                order_by=order_by,
+                order_direction=order_direction,
+            )
+        
+        return fetch_page
     
     def get(self, client_id: str) -> Dict[str, Any]:
         """
@@ -86,7 +253,7 @@ class ClientsResource:
         if not client_id:
             raise ValueError("ID é obrigatório")
         
-        return self.http.get(f"/clients/{client_id}")
+        return wrap(self.model, self.http.get(f"/clients/{client_id}"))
     
     def update(self, client_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -102,12 +269,116 @@ class ClientsResource:
         if not client_id:
             raise ValueError("ID é obrigatório")
         
-        if data.get("email") and not self._is_valid_email(data["email"]):
-            raise ValueError("Email inválido")
+        _validate_update_data(data)
         
         return self.http.patch(f"/clients/{client_id}", data)
     
     def _is_valid_email(self, email: str) -> bool:
         """Valida formato de email"""
-        pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-        return bool(re.match(pattern, email))
+        return _is_valid_email(email)
+
+
+class AsyncClientsResource:
+    """Versão assíncrona do recurso de Clientes"""
+    
+    def __init__(self, http: "AsyncHttpClient", models: bool = False):
+        self.http = http
+        self.model = Client if models else None
+    
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cria um novo cliente (ver ClientsResource.create)"""
+        _validate_create_data(data)
+        
+        return await self.http.post("/clients", data)
+    
+    async def bulk_create(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Cria vários clientes com concorrência limitada (ver ClientsResource.bulk_create)"""
+        return await arun_bulk(items, _validate_create_data, self.create, concurrency)
+    
+    async def bulk_update(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Atualiza vários clientes com concorrência limitada (ver ClientsResource.bulk_update)"""
+        return await arun_bulk(
+            items,
+            lambda item: validate_update_item(item, _validate_update_data),
+            lambda item: self.update(*split_update_item(item)),
+            concurrency
+        )
+    
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Lista clientes (ver ClientsResource.list)"""
+        params = _list_params(page, limit, cursor, order_by, order_direction)
+        
+        response = await self.http.get("/clients", params)
+        
+        return wrap_page(self.model, _map_list_response(response))
+    
+    def iter_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Percorre todos os clientes com `async for` (ver ClientsResource.iter_all)"""
+        fetch_page = self._page_fetcher(limit, order_by, order_direction)
+        return aiterate_items(fetch_page, limit, prefetch)
+    
+    async def list_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Busca todos os clientes com páginas em paralelo (ver ClientsResource.list_all)"""
+        fetch_page = self._page_fetcher(limit, order_by, order_direction)
+        return await acollect_items_concurrently(fetch_page, limit, concurrency)
+    
+    def _page_fetcher(
+        self,
+        limit: int,
+        order_by: Optional[str],
+        order_direction: Optional[str]
+    ) -> Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]]:
+        """Cria a função (page, cursor) -> list() usada pela paginação automática"""
+        async def fetch_page(page, cursor):
+            return await self.list(
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                order_by=order_by,
+                order_direction=order_direction,
+            )
+        
+        return fetch_page
+    
+    async def get(self, client_id: str) -> Dict[str, Any]:
+        """Obtém um cliente por ID"""
+        if not client_id:
+            raise ValueError("ID é obrigatório")
+        
+        return wrap(self.model, await self.http.get(f"/clients/{client_id}"))
+    
+    async def update(self, client_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Atualiza um cliente"""
+        if not client_id:
+            raise ValueError("ID é obrigatório")
+        
+        _validate_update_data(data)
+        
+        return await self.http.patch(f"/clients/{client_id}", data)
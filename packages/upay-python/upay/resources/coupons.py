@@ -2,16 +2,84 @@
 Recurso de Cupons
 """
 
-from typing import Optional, Dict, Any, List
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Hashable
 from ..http import HttpClient
+from ..models import CouponValidation, wrap
+from ..cache import ReadCache
+
+if TYPE_CHECKING:
+    # Só para as anotações: o cliente síncrono não carrega asyncio/httpx
+    from ..async_http import AsyncHttpClient
+
+
+def _prepare_validation_data(
+    code: str,
+    amount_cents: int,
+    product_ids: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Valida os argumentos e monta o body da validação de cupom"""
+    if not code or len(code.strip()) == 0:
+        raise ValueError("Código do cupom é obrigatório")
+    
+    if not amount_cents or amount_cents < 100:
+        raise ValueError("Valor mínimo é R$ 1,00 (100 centavos)")
+    
+    # Prepara dados - productIds deve ser array (mesmo que vazio)
+    return {
+        "code": code.strip(),
+        "amountCents": amount_cents,
+        "productIds": product_ids if product_ids else [],
+    }
+
+
+def _map_validation_result(result: Dict[str, Any], amount_cents: int) -> Dict[str, Any]:
+    """Normalizar resposta para o formato esperado"""
+    return {
+        "valid": result.get("valid", False),
+        "discountCents": result.get("discountAmount", 0),
+        "discountPercentage": result.get("coupon", {}).get("discountPercentage"),
+        "finalAmountCents": result.get("finalAmount", amount_cents),
+        "message": result.get("error") or result.get("message"),
+    }
+
+
+def _memo_key(data: Dict[str, Any]) -> Hashable:
+    """Chave do memo: (code, amountCents, productIds)"""
+    return (data["code"], data["amountCents"], tuple(sorted(data["productIds"])))
+
+
+def _failed_validation(code: str, amount_cents: int, error: Exception) -> Dict[str, Any]:
+    """Resultado de validate_many para um código cuja validação falhou"""
+    return {
+        "code": code,
+        "valid": False,
+        "discountCents": 0,
+        "discountPercentage": None,
+        "finalAmountCents": amount_cents,
+        "message": str(error),
+    }
 
 
 class CouponsResource:
     """Recurso para validar cupons"""
     
-    def __init__(self, http: HttpClient):
+    def __init__(
+        self,
+        http: HttpClient,
+        cache_ttl: Optional[float] = None,
+        models: bool = False
+    ):
+        """
+        Args:
+            http: Cliente HTTP
+            cache_ttl: Se informado, guarda os resultados de validate() por
+                esse tempo (segundos), por (code, amountCents, productIds)
+            models: Se True, retorna CouponValidation em vez de dicts
+        """
         self.http = http
+        self.cache = ReadCache(ttl=cache_ttl) if cache_ttl else None
+        self.model = CouponValidation if models else None
     
     def validate(
         self,
@@ -38,47 +106,120 @@ class CouponsResource:
                 - finalAmountCents: Valor final após desconto
                 - message: Mensagem de erro ou sucesso
         """
-        if not code or len(code.strip()) == 0:
-            raise ValueError("Código do cupom é obrigatório")
-        
-        if not amount_cents or amount_cents < 100:
-            raise ValueError("Valor mínimo é R$ 1,00 (100 centavos)")
-        
-        # Endpoint público em /api/coupons/validate (sem /v1)
-        base_url = self.http.base_url
-        url = f"{base_url}/api/coupons/validate"
-        
-        # Faz requisição sem autenticação
-        try:
-            # Prepara dados - productIds deve ser array (mesmo que vazio)
-            data = {
-                "code": code.strip(),
-                "amountCents": amount_cents,
-                "productIds": product_ids if product_ids else [],
-            }
-            
-            response = requests.post(
-                url,
-                json=data,
-                headers={
-                    "Content-Type": "application/json",
-                },
-                timeout=self.http.timeout
-            )
-            
-            if not response.ok:
-                error = response.json() if response.headers.get("content-type", "").startswith("application/json") else {"message": "Erro ao validar cupom"}
-                raise Exception(error.get("message") or f"HTTP {response.status_code}")
-            
-            result = response.json()
-            
-            # Normalizar resposta para o formato esperado
-            return {
-                "valid": result.get("valid", False),
-                "discountCents": result.get("discountAmount", 0),
-                "discountPercentage": result.get("coupon", {}).get("discountPercentage"),
-                "finalAmountCents": result.get("finalAmount", amount_cents),
-                "message": result.get("error") or result.get("message"),
-            }
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Erro na requisição: {str(e)}")
+        data = _prepare_validation_data(code, amount_cents, product_ids)
+        
+        if self.cache is not None:
+            found, cached = self.cache.lookup("coupons", _memo_key(data))
+            if found:
+                return cached
+        
+        # Endpoint público em /api/coupons/validate (sem /v1), sem autenticação;
+        # a validação não altera nada, então pode ser repetida após falhas
+        response = self.http.request_public("POST", "/api/coupons/validate", data, idempotent=True)
+        
+        result = wrap(self.model, _map_validation_result(response, amount_cents))
+        
+        if self.cache is not None:
+            self.cache.store("coupons", _memo_key(data), result)
+        
+        return result
+    
+    def validate_many(
+        self,
+        codes: List[str],
+        amount_cents: int,
+        product_ids: Optional[List[str]] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Valida vários cupons ao mesmo tempo
+        
+        As validações rodam em paralelo, então o tempo total é o de uma
+        única ida e volta à API. Um código que falhe (inválido, expirado,
+        erro de rede) vem com valid=False e a mensagem do erro, sem
+        interromper os demais.
+        
+        Args:
+            codes: Códigos dos cupons
+            amount_cents: Valor em centavos (min 100)
+            product_ids: Lista de IDs de produtos (opcional)
+            concurrency: Máximo de validações simultâneas (padrão: 8)
+        
+        Returns:
+            Um resultado por código, na mesma ordem, no formato de validate()
+            acrescido de 'code'
+        
+        Exemplo:
+            >>> results = upay.coupons.validate_many(["PROMO10", "FRETE"], 10000)
+            >>> best = max(results, key=lambda r: r["discountCents"] if r["valid"] else -1)
+        """
+        def validate_one(code: str) -> Dict[str, Any]:
+            try:
+                return wrap(self.model, dict(self.validate(code, amount_cents, product_ids), code=code))
+            except Exception as e:
+                return wrap(self.model, _failed_validation(code, amount_cents, e))
+        
+        if not codes:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(codes)))) as executor:
+            return list(executor.map(validate_one, codes))
+
+
+class AsyncCouponsResource:
+    """Versão assíncrona do recurso de Cupons"""
+    
+    def __init__(
+        self,
+        http: "AsyncHttpClient",
+        cache_ttl: Optional[float] = None,
+        models: bool = False
+    ):
+        self.http = http
+        self.cache = ReadCache(ttl=cache_ttl) if cache_ttl else None
+        self.model = CouponValidation if models else None
+    
+    async def validate(
+        self,
+        code: str,
+        amount_cents: int,
+        product_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Valida um cupom de desconto (ver CouponsResource.validate)"""
+        data = _prepare_validation_data(code, amount_cents, product_ids)
+        
+        if self.cache is not None:
+            found, cached = self.cache.lookup("coupons", _memo_key(data))
+            if found:
+                return cached
+        
+        # Endpoint público em /api/coupons/validate (sem /v1), sem autenticação
+        response = await self.http.request_public("POST", "/api/coupons/validate", data, idempotent=True)
+        
+        result = wrap(self.model, _map_validation_result(response, amount_cents))
+        
+        if self.cache is not None:
+            self.cache.store("coupons", _memo_key(data), result)
+        
+        return result
+    
+    async def validate_many(
+        self,
+        codes: List[str],
+        amount_cents: int,
+        product_ids: Optional[List[str]] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Valida vários cupons ao mesmo tempo (ver CouponsResource.validate_many)"""
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def validate_one(code: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return wrap(self.model, dict(await self.validate(code, amount_cents, product_ids), code=code))
+                except Exception as e:
+                    return wrap(self.model, _failed_validation(code, amount_cents, e))
+        
+        return list(await asyncio.gather(*(validate_one(code) for code in codes)))
@@ -2,17 +2,128 @@
 Recurso de Payment Links
 """
 
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, AsyncIterator, Awaitable, Callable, List
 from ..http import HttpClient
+from ..models import Model, PaymentLink, wrap, wrap_page
+from ..idempotency import attach_idempotency_key
+from ..cache import ReadCache
+from ..pagination import (
+    iterate_items,
+    aiterate_items,
+    collect_items_concurrently,
+    acollect_items_concurrently,
+)
+
+if TYPE_CHECKING:
+    # Só para as anotações: o cliente síncrono não carrega asyncio/httpx
+    from ..async_http import AsyncHttpClient
+
+
+def _prepare_create_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Valida e prepara os dados de criação de um link de pagamento"""
+    # Validação básica
+    if not data.get("title") or len(data["title"].strip()) < 3:
+        raise ValueError("Título deve ter pelo menos 3 caracteres")
+    
+    if not data.get("amount") and not data.get("products"):
+        raise ValueError("É necessário fornecer amount ou products")
+    
+    if data.get("amount") and data.get("amount", 0) < 100:
+        raise ValueError("Valor mínimo é R$ 1,00 (100 centavos)")
+    
+    # Prepara dados para envio
+    request_data = {
+        "title": data["title"],
+        "description": data.get("description"),
+        "amount": data.get("amount"),
+        "products": data.get("products"),
+        "currency": data.get("currency", "BRL"),
+        "expiresAt": data.get("expiresAt"),
+        "redirectUrl": data.get("redirectUrl"),
+        "settings": data.get("settings"),
+        "status": data.get("status", "ACTIVE"),
+        "metaPixelCode": data.get("metaPixelCode"),
+        "stockQuantity": data.get("stockQuantity"),
+        "stockEnabled": data.get("stockEnabled"),
+    }
+    
+    # Remove valores None
+    return {k: v for k, v in request_data.items() if v is not None}
+
+
+def _prepare_update_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Seleciona os campos atualizáveis de um link de pagamento"""
+    update_data = {}
+    if "title" in data:
+        update_data["title"] = data["title"]
+    if "description" in data:
+        update_data["description"] = data["description"]
+    if "amount" in data:
+        update_data["amount"] = data["amount"]
+    if "status" in data:
+        update_data["status"] = data["status"]
+    if "expiresAt" in data:
+        update_data["expiresAt"] = data["expiresAt"]
+    if "redirectUrl" in data:
+        update_data["redirectUrl"] = data["redirectUrl"]
+    if "settings" in data:
+        update_data["settings"] = data["settings"]
+    return update_data
+
+
+def _extract_link_id(response: Any) -> Optional[str]:
+    """Extrai o ID do link de uma resposta (usado como tag de invalidação do cache)"""
+    if not isinstance(response, (dict, Model)):
+        return None
+    link = response.get("paymentLink") or response.get("data") or response
+    return link.get("id") if isinstance(link, (dict, Model)) else None
+
+
+def _list_params(
+    page: Optional[int],
+    limit: Optional[int],
+    cursor: Optional[str],
+    order_by: Optional[str],
+    order_direction: Optional[str],
+    status: Optional[str]
+) -> Dict[str, Any]:
+    """Monta os parâmetros de query da listagem"""
+    return {
+        "page": page,
+        "limit": limit,
+        "cursor": cursor,
+        "orderBy": order_by,
+        "orderDirection": order_direction,
+        "status": status,
+    }
+
+
+def _map_list_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Mapear resposta: { message, paymentLinks, pagination } -> { data, pagination }"""
+    return {
+        "data": response.get("paymentLinks") or response.get("data") or [],
+        "pagination": response.get("pagination") or {"total": 0, "page": 1, "limit": 10}
+    }
 
 
 class PaymentLinksResource:
     """Recurso para gerenciar Payment Links"""
     
-    def __init__(self, http: HttpClient):
+    def __init__(
+        self,
+        http: HttpClient,
+        cache: Optional[ReadCache] = None,
+        models: bool = False
+    ):
         self.http = http
+        self.cache = cache
+        self.model = PaymentLink if models else None
     
-    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def create(
+        self,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Cria um novo link de pagamento
         
@@ -27,43 +138,20 @@ class PaymentLinksResource:
                 - settings: Configurações de pagamento
                 - status: Status (ACTIVE ou INACTIVE)
                 - products: Lista de produtos
-                
+            idempotency_key: Chave de idempotência (padrão: gerada
+                automaticamente); repetir a chamada com a mesma chave não
+                cria um segundo link
+        
         Returns:
-            Link de pagamento criado
+            Link de pagamento criado, com a chave usada em "idempotencyKey"
         """
-        # Validação básica
-        if not data.get("title") or len(data["title"].strip()) < 3:
-            raise ValueError("Título deve ter pelo menos 3 caracteres")
-        
-        if not data.get("amount") and not data.get("products"):
-            raise ValueError("É necessário fornecer amount ou products")
-        
-        if data.get("amount") and data.get("amount", 0) < 100:
-            raise ValueError("Valor mínimo é R$ 1,00 (100 centavos)")
+        request_data = _prepare_create_data(data)
         
-        # Prepara dados para envio
-        request_data = {
-            "title": data["title"],
-            "description": data.get("description"),
-            "amount": data.get("amount"),
-            "products": data.get("products"),
-            "currency": data.get("currency", "BRL"),
-            "expiresAt": data.get("expiresAt"),
-            "redirectUrl": data.get("redirectUrl"),
-            "settings": data.get("settings"),
-            "status": data.get("status", "ACTIVE"),
-            "metaPixelCode": data.get("metaPixelCode"),
-            "stockQuantity": data.get("stockQuantity"),
-            "stockEnabled": data.get("stockEnabled"),
-        }
-        
-        # Remove valores None
-        request_data = {k: v for k, v in request_data.items() if v is not None}
-        
-        response = self.http.post("/payment-links", request_data)
+        key = self.http.idempotency_key(idempotency_key)
+        response = self.http.post("/payment-links", request_data, key)
         
         # Mapear resposta: { message, data } -> retornar data
-        return response.get("data") or response
+        return attach_idempotency_key(wrap(self.model, response.get("data") or response), key)
     
     def list(
         self,
@@ -88,22 +176,91 @@ class PaymentLinksResource:
         Returns:
             Dicionário com 'data' (lista) e 'pagination'
         """
-        params = {
-            "page": page,
-            "limit": limit,
-            "cursor": cursor,
-            "orderBy": order_by,
-            "orderDirection": order_direction,
-            "status": status,
-        }
+        params = _list_params(page, limit, cursor, order_by, order_direction, status)
         
         response = self.http.get("/payment-links", params)
         
-        # Mapear resposta: { message, paymentLinks, pagination } -> { data, pagination }
-        return {
-            "data": response.get("paymentLinks") or response.get("data") or [],
-            "pagination": response.get("pagination") or {"total": 0, "page": 1, "limit": 10}
-        }
+        return wrap_page(self.model, _map_list_response(response))
+    
+    def iter_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        prefetch: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre todos os links de pagamento, seguindo cursor ou página automaticamente
+        
+        Os itens são entregues um a um e só uma página fica em memória
+        (duas com prefetch).
+        
+        Args:
+            limit: Itens por página (padrão: 100)
+            order_by: Campo para ordenação
+            order_direction: Direção da ordenação (ASC ou DESC)
+            status: Filtrar por status
+            prefetch: Busca a próxima página em segundo plano enquanto a atual é processada
+        
+        Yields:
+            Cada link de pagamento
+        
+        Exemplo:
+            >>> for item in upay.payment_links.iter_all(limit=200, prefetch=True):
+            ...     print(item["id"])
+        """
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status)
+        return iterate_items(fetch_page, limit, prefetch)
+    
+    def list_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca todos os links de pagamento baixando várias páginas em paralelo
+        
+        Busca a página 1, calcula o total de páginas a partir de
+        pagination.total e baixa as demais com até `concurrency` requisições
+        simultâneas. Páginas com erro transitório são repetidas. Se a API não
+        informar o total, as páginas são buscadas em sequência.
+        
+        Args:
+            limit: Itens por página (padrão: 100)
+            order_by: Campo para ordenação
+            order_direction: Direção da ordenação (ASC ou DESC)
+            status: Filtrar por status
+            concurrency: Máximo de páginas buscadas ao mesmo tempo (padrão: 8)
+        
+        Returns:
+            Lista com todos os links de pagamento, na ordem das páginas
+        """
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status)
+        return collect_items_concurrently(fetch_page, limit, concurrency)
+    
+    def _page_fetcher(
+        self,
+        limit: int,
+        order_by: Optional[str],
+        order_direction: Optional[str],
+        status: Optional[str]
+    ) -> Callable[[Optional[int], Optional[str]], Dict[str, Any]]:
+        """Cria a função (page, cursor) -> list() usada pela paginação automática"""
+        def fetch_page(page, cursor):
+            return self.list(
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                order_by=order_by,
+                order_direction=order_direction,
+                status=status,
+            )
+        
+        return fetch_page
     
     def get(self, link_id: str) -> Dict[str, Any]:
         """
@@ -118,10 +275,24 @@ class PaymentLinksResource:
         if not link_id:
             raise ValueError("ID é obrigatório")
         
+        if self.cache is not None:
+            found, cached = self.cache.lookup("payment_links", ("id", link_id))
+            if found:
+                return cached
+            generation = self.cache.generation()
+        
         response = self.http.get(f"/payment-links/{link_id}")
         
         # Mapear resposta: { message, paymentLink } -> retornar paymentLink
-        return response.get("paymentLink") or response.get("data") or response
+        link = wrap(self.model, response.get("paymentLink") or response.get("data") or response)
+        
+        if self.cache is not None:
+            self.cache.store(
+                "payment_links", ("id", link_id), link,
+                tags=(link_id,), generation=generation
+            )
+        
+        return link
     
     def get_by_slug(self, slug: str) -> Dict[str, Any]:
         """
@@ -136,7 +307,24 @@ class PaymentLinksResource:
         if not slug:
             raise ValueError("Slug é obrigatório")
         
-        return self.http.get(f"/payment-links/slug/{slug}")
+        if self.cache is not None:
+            found, cached = self.cache.lookup("payment_links", ("slug", slug))
+            if found:
+                return cached
+            generation = self.cache.generation()
+        
+        response = self.http.get(f"/payment-links/slug/{slug}")
+        
+        # Mapear resposta: { message, paymentLink } -> retornar paymentLink
+        link = wrap(self.model, response.get("paymentLink") or response.get("data") or response)
+        
+        if self.cache is not None:
+            self.cache.store(
+                "payment_links", ("slug", slug), link,
+                tags=(_extract_link_id(link),), generation=generation
+            )
+        
+        return link
     
     def update(self, link_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -153,23 +341,14 @@ class PaymentLinksResource:
             raise ValueError("ID é obrigatório")
         
         # Prepara dados para envio
-        update_data = {}
-        if "title" in data:
-            update_data["title"] = data["title"]
-        if "description" in data:
-            update_data["description"] = data["description"]
-        if "amount" in data:
-            update_data["amount"] = data["amount"]
-        if "status" in data:
-            update_data["status"] = data["status"]
-        if "expiresAt" in data:
-            update_data["expiresAt"] = data["expiresAt"]
-        if "redirectUrl" in data:
-            update_data["redirectUrl"] = data["redirectUrl"]
-        if "settings" in data:
-            update_data["settings"] = data["settings"]
-        
-        return self.http.patch(f"/payment-links/{link_id}", update_data)
+        update_data = _prepare_update_data(data)
+        
+        response = self.http.patch(f"/payment-links/{link_id}", update_data)
+        
+        if self.cache is not None:
+            self.cache.invalidate("payment_links", link_id)
+        
+        return response
     
     def delete(self, link_id: str) -> None:
         """
@@ -182,6 +361,9 @@ class PaymentLinksResource:
             raise ValueError("ID é obrigatório")
         
         self.http.delete(f"/payment-links/{link_id}")
+        
+        if self.cache is not None:
+            self.cache.invalidate("payment_links", link_id)
     
     def get_checkout_url(self, slug: str, base_url: Optional[str] = None) -> str:
         """
@@ -196,3 +378,166 @@ class PaymentLinksResource:
         """
         checkout_base = base_url or "https://checkout.upaybr.com"
         return f"{checkout_base}/{slug}"
+
+
+class AsyncPaymentLinksResource:
+    """Versão assíncrona do recurso de Payment Links"""
+    
+    def __init__(
+        self,
+        http: "AsyncHttpClient",
+        cache: Optional[ReadCache] = None,
+        models: bool = False
+    ):
+        self.http = http
+        self.cache = cache
+        self.model = PaymentLink if models else None
+    
+    async def create(
+        self,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Cria um novo link de pagamento (ver PaymentLinksResource.create)"""
+        request_data = _prepare_create_data(data)
+        
+        key = self.http.idempotency_key(idempotency_key)
+        response = await self.http.post("/payment-links", request_data, key)
+        
+        return attach_idempotency_key(wrap(self.model, response.get("data") or response), key)
+    
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Lista links de pagamento (ver PaymentLinksResource.list)"""
+        params = _list_params(page, limit, cursor, order_by, order_direction, status)
+        
+        response = await self.http.get("/payment-links", params)
+        
+        return wrap_page(self.model, _map_list_response(response))
+    
+    def iter_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Percorre todos os links de pagamento com `async for` (ver PaymentLinksResource.iter_all)"""
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status)
+        return aiterate_items(fetch_page, limit, prefetch)
+    
+    async def list_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Busca todos os links de pagamento com páginas em paralelo (ver PaymentLinksResource.list_all)"""
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status)
+        return await acollect_items_concurrently(fetch_page, limit, concurrency)
+    
+    def _page_fetcher(
+        self,
+        limit: int,
+        order_by: Optional[str],
+        order_direction: Optional[str],
+        status: Optional[str]
+    ) -> Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]]:
+        """Cria a função (page, cursor) -> list() usada pela paginação automática"""
+        async def fetch_page(page, cursor):
+            return await self.list(
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                order_by=order_by,
+                order_direction=order_direction,
+                status=status,
+            )
+        
+        return fetch_page
+    
+    async def get(self, link_id: str) -> Dict[str, Any]:
+        """Obtém um link de pagamento por ID"""
+        if not link_id:
+            raise ValueError("ID é obrigatório")
+        
+        if self.cache is not None:
+            found, cached = self.cache.lookup("payment_links", ("id", link_id))
+            if found:
+                return cached
+            generation = self.cache.generation()
+        
+        response = await self.http.get(f"/payment-links/{link_id}")
+        
+        link = wrap(self.model, response.get("paymentLink") or response.get("data") or response)
+        
+        if self.cache is not None:
+            self.cache.store(
+                "payment_links", ("id", link_id), link,
+                tags=(link_id,), generation=generation
+            )
+        
+        return link
+    
+    async def get_by_slug(self, slug: str) -> Dict[str, Any]:
+        """Obtém um link de pagamento por slug"""
+        if not slug:
+            raise ValueError("Slug é obrigatório")
+        
+        if self.cache is not None:
+            found, cached = self.cache.lookup("payment_links", ("slug", slug))
+            if found:
+                return cached
+            generation = self.cache.generation()
+        
+        response = await self.http.get(f"/payment-links/slug/{slug}")
+        
+        # Mapear resposta: { message, paymentLink } -> retornar paymentLink
+        link = wrap(self.model, response.get("paymentLink") or response.get("data") or response)
+        
+        if self.cache is not None:
+            self.cache.store(
+                "payment_links", ("slug", slug), link,
+                tags=(_extract_link_id(link),), generation=generation
+            )
+        
+        return link
+    
+    async def update(self, link_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Atualiza um link de pagamento"""
+        if not link_id:
+            raise ValueError("ID é obrigatório")
+        
+        update_data = _prepare_update_data(data)
+        
+        response = await self.http.patch(f"/payment-links/{link_id}", update_data)
+        
+        if self.cache is not None:
+            self.cache.invalidate("payment_links", link_id)
+        
+        return response
+    
+    async def delete(self, link_id: str) -> None:
+        """Deleta um link de pagamento"""
+        if not link_id:
+            raise ValueError("ID é obrigatório")
+        
+        await self.http.delete(f"/payment-links/{link_id}")
+        
+        if self.cache is not None:
+            self.cache.invalidate("payment_links", link_id)
+    
+    def get_checkout_url(self, slug: str, base_url: Optional[str] = None) -> str:
+        """Obtém a URL pública do checkout (não faz requisição)"""
+        checkout_base = base_url or "https://checkout.upaybr.com"
+        return f"{checkout_base}/{slug}"
@@ -2,17 +2,87 @@
 Recurso de Transações
 """
 
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, AsyncIterator, Awaitable, Callable, List
 from ..http import HttpClient
+from ..models import Transaction, wrap, wrap_page
+from ..idempotency import attach_idempotency_key
+from ..bulk import run_bulk, arun_bulk
+from ..pagination import (
+    iterate_items,
+    aiterate_items,
+    collect_items_concurrently,
+    acollect_items_concurrently,
+)
+
+if TYPE_CHECKING:
+    # Só para as anotações: o cliente síncrono não carrega asyncio/httpx
+    from ..async_http import AsyncHttpClient
+
+
+def _validate_create_data(data: Dict[str, Any]) -> None:
+    """Valida os dados de criação de uma transação"""
+    # Validação básica
+    if not data.get("product") or len(str(data["product"]).strip()) == 0:
+        raise ValueError("Produto é obrigatório")
+    
+    if not data.get("amountCents") or data.get("amountCents", 0) < 100:
+        raise ValueError("Valor mínimo é R$ 1,00 (100 centavos)")
+    
+    if data.get("client") and not data["client"].get("email"):
+        raise ValueError("Email do cliente é obrigatório")
+
+
+def _list_params(
+    page: Optional[int],
+    limit: Optional[int],
+    cursor: Optional[str],
+    order_by: Optional[str],
+    order_direction: Optional[str],
+    status: Optional[str],
+    payment_method: Optional[str],
+    client_id: Optional[str]
+) -> Dict[str, Any]:
+    """Monta os parâmetros de query da listagem"""
+    return {
+        "page": page,
+        "limit": limit,
+        "cursor": cursor,
+        "orderBy": order_by,
+        "orderDirection": order_direction,
+        "status": status,
+        "method": payment_method,
+        "clientId": client_id,
+    }
+
+
+def _map_list_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Mapear resposta: { message, transactions, pagination } -> { data, pagination }"""
+    return {
+        "data": response.get("transactions") or response.get("data") or [],
+        "pagination": response.get("pagination") or {"total": 0, "page": 1, "limit": 10}
+    }
+
+
+def _refund_data(amount_cents: Optional[int]) -> Dict[str, Any]:
+    """Monta o body do estorno"""
+    data = {}
+    if amount_cents is not None:
+        data["amountCents"] = amount_cents
+    return data
 
 
 class TransactionsResource:
     """Recurso para gerenciar Transações"""
     
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, models: bool = False):
         self.http = http
+        self.model = Transaction if models else None
     
-    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def create(
+        self,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Cria uma nova transação
         
@@ -26,21 +96,43 @@ class TransactionsResource:
                 - paymentLinkId: ID do link de pagamento
                 - metadata: Metadados adicionais
                 - couponCode: Código do cupom
+            idempotency_key: Chave de idempotência (padrão: gerada
+                automaticamente); repetir a chamada com a mesma chave não
+                duplica a operação
                 
         Returns:
-            Transação criada
+            Transação criada, com a chave usada em "idempotencyKey"
         """
-        # Validação básica
-        if not data.get("product") or len(str(data["product"]).strip()) == 0:
-            raise ValueError("Produto é obrigatório")
+        _validate_create_data(data)
         
-        if not data.get("amountCents") or data.get("amountCents", 0) < 100:
-            raise ValueError("Valor mínimo é R$ 1,00 (100 centavos)")
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(self.http.post("/transactions", data, key), key)
+    
+    def bulk_create(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Cria várias transações com concorrência limitada
         
-        if data.get("client") and not data["client"].get("email"):
-            raise ValueError("Email do cliente é obrigatório")
+        Todos os itens passam pela mesma validação de create() antes do
+        primeiro envio; itens inválidos não são enviados e uma falha não
+        interrompe os demais.
         
-        return self.http.post("/transactions", data)
+        Args:
+            items: Lista de dados, no mesmo formato de create()
+            concurrency: Máximo de requisições simultâneas (padrão: 8)
+        
+        Returns:
+            Um resultado por item, na ordem de entrada, com index, success,
+            data (resposta da API) e error (exceção levantada)
+        
+        Exemplo:
+            >>> results = upay.transactions.bulk_create([{"product": "Plano Mensal", "amountCents": 4990}, ...], concurrency=16)
+            >>> failed = [r for r in results if not r["success"]]
+        """
+        return run_bulk(items, _validate_create_data, self.create, concurrency)
     
     def list(
         self,
@@ -69,24 +161,106 @@ class TransactionsResource:
         Returns:
             Dicionário com 'data' (lista) e 'pagination'
         """
-        params = {
-            "page": page,
-            "limit": limit,
-            "cursor": cursor,
-            "orderBy": order_by,
-            "orderDirection": order_direction,
-            "status": status,
-            "method": payment_method,
-            "clientId": client_id,
-        }
+        params = _list_params(
+            page, limit, cursor, order_by, order_direction,
+            status, payment_method, client_id
+        )
         
         response = self.http.get("/transactions", params)
         
-        # Mapear resposta: { message, transactions, pagination } -> { data, pagination }
-        return {
-            "data": response.get("transactions") or response.get("data") or [],
-            "pagination": response.get("pagination") or {"total": 0, "page": 1, "limit": 10}
-        }
+        return wrap_page(self.model, _map_list_response(response))
+    
+    def iter_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        client_id: Optional[str] = None,
+        prefetch: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre todas as transações, seguindo cursor ou página automaticamente
+        
+        Os itens são entregues um a um e só uma página fica em memória
+        (duas com prefetch).
+        
+        Args:
+            limit: Itens por página (padrão: 100)
+            order_by: Campo para ordenação
+            order_direction: Direção da ordenação (ASC ou DESC)
+            status: Filtrar por status
+            payment_method: Filtrar por método de pagamento
+            client_id: Filtrar por cliente
+            prefetch: Busca a próxima página em segundo plano enquanto a atual é processada
+        
+        Yields:
+            Cada transação
+        
+        Exemplo:
+            >>> for item in upay.transactions.iter_all(limit=200, prefetch=True):
+            ...     print(item["id"])
+        """
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status, payment_method, client_id)
+        return iterate_items(fetch_page, limit, prefetch)
+    
+    def list_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        client_id: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca todas as transações baixando várias páginas em paralelo
+        
+        Busca a página 1, calcula o total de páginas a partir de
+        pagination.total e baixa as demais com até `concurrency` requisições
+        simultâneas. Páginas com erro transitório são repetidas. Se a API não
+        informar o total, as páginas são buscadas em sequência.
+        
+        Args:
+            limit: Itens por página (padrão: 100)
+            order_by: Campo para ordenação
+            order_direction: Direção da ordenação (ASC ou DESC)
+            status: Filtrar por status
+            payment_method: Filtrar por método de pagamento
+            client_id: Filtrar por cliente
+            concurrency: Máximo de páginas buscadas ao mesmo tempo (padrão: 8)
+        
+        Returns:
+            Lista com todas as transações, na ordem das páginas
+        """
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status, payment_method, client_id)
+        return collect_items_concurrently(fetch_page, limit, concurrency)
+    
+    def _page_fetcher(
+        self,
+        limit: int,
+        order_by: Optional[str],
+        order_direction: Optional[str],
+        status: Optional[str],
+        payment_method: Optional[str],
+        client_id: Optional[str]
+    ) -> Callable[[Optional[int], Optional[str]], Dict[str, Any]]:
+        """Cria a função (page, cursor) -> list() usada pela paginação automática"""
+        def fetch_page(page, cursor):
+            return self.list(
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                order_by=order_by,
+                order_direction=order_direction,
+                status=status,
+                payment_method=payment_method,
+                client_id=client_id,
+            )
+        
+        return fetch_page
     
     def get(self, transaction_id: str) -> Dict[str, Any]:
         """
@@ -101,12 +275,13 @@ class TransactionsResource:
         if not transaction_id:
             raise ValueError("ID é obrigatório")
         
-        return self.http.get(f"/transactions/{transaction_id}")
+        return wrap(self.model, self.http.get(f"/transactions/{transaction_id}"))
     
     def process(
         self,
         transaction_id: str,
-        payment_data: Optional[Dict[str, Any]] = None
+        payment_data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Processa o pagamento de uma transação
@@ -114,29 +289,47 @@ class TransactionsResource:
         Args:
             transaction_id: ID da transação
             payment_data: Dados do pagamento (cardData, installments)
+            idempotency_key: Chave de idempotência (padrão: gerada
+                automaticamente); repetir a chamada com a mesma chave não
+                duplica a operação
             
         Returns:
-            Transação processada
+            Transação processada, com a chave usada em "idempotencyKey"
         """
         if not transaction_id:
             raise ValueError("ID é obrigatório")
         
-        return self.http.post(f"/transactions/{transaction_id}/process", payment_data)
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(
+            self.http.post(f"/transactions/{transaction_id}/process", payment_data, key),
+            key
+        )
     
-    def capture(self, transaction_id: str) -> Dict[str, Any]:
+    def capture(
+        self,
+        transaction_id: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Captura uma transação autorizada (Pagar.me)
         
         Args:
             transaction_id: ID da transação
+            idempotency_key: Chave de idempotência (padrão: gerada
+                automaticamente); repetir a chamada com a mesma chave não
+                duplica a operação
             
         Returns:
-            Transação capturada
+            Transação capturada, com a chave usada em "idempotencyKey"
         """
         if not transaction_id:
             raise ValueError("ID é obrigatório")
         
-        return self.http.post(f"/transactions/{transaction_id}/capture")
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(
+            self.http.post(f"/transactions/{transaction_id}/capture", None, key),
+            key
+        )
     
     def cancel(self, transaction_id: str) -> Dict[str, Any]:
         """
@@ -156,7 +349,8 @@ class TransactionsResource:
     def refund(
         self,
         transaction_id: str,
-        amount_cents: Optional[int] = None
+        amount_cents: Optional[int] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Estorna uma transação paga
@@ -164,15 +358,187 @@ class TransactionsResource:
         Args:
             transaction_id: ID da transação
             amount_cents: Valor a estornar em centavos (opcional, estorna tudo se não informado)
+            idempotency_key: Chave de idempotência (padrão: gerada
+                automaticamente); repetir a chamada com a mesma chave não
+                duplica a operação
             
         Returns:
-            Transação estornada
+            Transação estornada, com a chave usada em "idempotencyKey"
         """
         if not transaction_id:
             raise ValueError("ID é obrigatório")
         
-        data = {}
-        if amount_cents is not None:
-            data["amountCents"] = amount_cents
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(
+            self.http.post(
+                f"/transactions/{transaction_id}/refund",
+                _refund_data(amount_cents),
+                key
+            ),
+            key
+        )
+
+
+class AsyncTransactionsResource:
+    """Versão assíncrona do recurso de Transações"""
+    
+    def __init__(self, http: "AsyncHttpClient", models: bool = False):
+        self.http = http
+        self.model = Transaction if models else None
+    
+    async def create(
+        self,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Cria uma nova transação (ver TransactionsResource.create)"""
+        _validate_create_data(data)
+        
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(await self.http.post("/transactions", data, key), key)
+    
+    async def bulk_create(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Cria várias transações com concorrência limitada (ver TransactionsResource.bulk_create)"""
+        return await arun_bulk(items, _validate_create_data, self.create, concurrency)
+    
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        client_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Lista transações (ver TransactionsResource.list)"""
+        params = _list_params(
+            page, limit, cursor, order_by, order_direction,
+            status, payment_method, client_id
+        )
+        
+        response = await self.http.get("/transactions", params)
+        
+        return wrap_page(self.model, _map_list_response(response))
+    
+    def iter_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        client_id: Optional[str] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Percorre todas as transações com `async for` (ver TransactionsResource.iter_all)"""
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status, payment_method, client_id)
+        return aiterate_items(fetch_page, limit, prefetch)
+    
+    async def list_all(
+        self,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        client_id: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Busca todas as transações com páginas em paralelo (ver TransactionsResource.list_all)"""
+        fetch_page = self._page_fetcher(limit, order_by, order_direction, status, payment_method, client_id)
+        return await acollect_items_concurrently(fetch_page, limit, concurrency)
+    
+    def _page_fetcher(
+        self,
+        limit: int,
+        order_by: Optional[str],
+        order_direction: Optional[str],
+        status: Optional[str],
+        payment_method: Optional[str],
+        client_id: Optional[str]
+    ) -> Callable[[Optional[int], Optional[str]], Awaitable[Dict[str, Any]]]:
+        """Cria a função (page, cursor) -> list() usada pela paginação automática"""
+        async def fetch_page(page, cursor):
+            return await self.list(
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                order_by=order_by,
+                order_direction=order_direction,
+                status=status,
+                payment_method=payment_method,
+                client_id=client_id,
+            )
+        
+        return fetch_page
+    
+    async def get(self, transaction_id: str) -> Dict[str, Any]:
+        """Obtém uma transação por ID"""
+        if not transaction_id:
+            raise ValueError("ID é obrigatório")
+        
+        return wrap(self.model, await self.http.get(f"/transactions/{transaction_id}"))
+    
+    async def process(
+        self,
+        transaction_id: str,
+        payment_data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Processa o pagamento de uma transação"""
+        if not transaction_id:
+            raise ValueError("ID é obrigatório")
+        
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(
+            await self.http.post(f"/transactions/{transaction_id}/process", payment_data, key),
+            key
+        )
+    
+    async def capture(
+        self,
+        transaction_id: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Captura uma transação autorizada (Pagar.me)"""
+        if not transaction_id:
+            raise ValueError("ID é obrigatório")
+        
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(
+            await self.http.post(f"/transactions/{transaction_id}/capture", None, key),
+            key
+        )
+    
+    async def cancel(self, transaction_id: str) -> Dict[str, Any]:
+        """Cancela uma transação pendente"""
+        if not transaction_id:
+            raise ValueError("ID é obrigatório")
+        
+        return await self.http.post(f"/transactions/{transaction_id}/cancel")
+    
+    async def refund(
+        self,
+        transaction_id: str,
+        amount_cents: Optional[int] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Estorna uma transação paga"""
+        if not transaction_id:
+            raise ValueError("ID é obrigatório")
         
-        return self.http.post(f"/transactions/{transaction_id}/refund", data)
+        key = self.http.idempotency_key(idempotency_key)
+        return attach_idempotency_key(
+            await self.http.post(
+                f"/transactions/{transaction_id}/refund",
+                _refund_data(amount_cents),
+                key
+            ),
+            key
+        )
@@ -0,0 +1,155 @@
+"""
+Política de retentativas com backoff exponencial
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Converte o header Retry-After em segundos
+    
+    Args:
+        value: Valor do header (segundos ou data HTTP)
+    
+    Returns:
+        Segundos a esperar ou None se o header for ausente/inválido
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Política de retentativas do cliente HTTP
+    
+    Usa backoff exponencial com "full jitter" (espera aleatória entre 0 e
+    base * 2^(tentativa-1)), o que evita que vários clientes voltem a chamar a
+    API ao mesmo tempo. Quando a resposta traz Retry-After, o valor do header
+    é respeitado.
+    
+    Exemplo:
+        >>> from upay import UpayClient, RetryPolicy
+        >>>
+        >>> upay = UpayClient(
+        ...     api_key="sua_api_key",
+        ...     retry_policy=RetryPolicy(max_attempts=5, backoff_base=0.2)
+        ... )
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_network_errors: bool = True,
+        retry_non_idempotent: bool = False,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0
+    ):
+        """
+        Inicializa a política
+        
+        Args:
+            max_attempts: Total de tentativas, incluindo a primeira (1 desativa retentativas)
+            backoff_base: Espera base em segundos
+            backoff_max: Espera máxima em segundos
+            retry_statuses: Status HTTP que disparam retentativa
+            retry_network_errors: Se erros de rede/timeout disparam retentativa
+            retry_non_idempotent: Se POST/PATCH também podem ser repetidos
+            respect_retry_after: Se o header Retry-After deve ser respeitado
+            max_retry_after: Maior Retry-After aceito; acima disso não há retentativa
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts deve ser pelo menos 1")
+        
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_network_errors = retry_network_errors
+        self.retry_non_idempotent = retry_non_idempotent
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+    
+    def is_idempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """Indica se a requisição pode ser repetida com segurança"""
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in IDEMPOTENT_METHODS or self.retry_non_idempotent
+    
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        idempotent: Optional[bool] = None,
+        retry_after: Optional[float] = None
+    ) -> bool:
+        """
+        Decide se uma tentativa que falhou deve ser repetida
+        
+        Args:
+            method: Método HTTP
+            attempt: Número da tentativa que falhou (começa em 1)
+            status: Status HTTP da resposta (None para erro de rede)
+            idempotent: Força a requisição como (não) idempotente
+            retry_after: Valor do Retry-After em segundos, se houver
+        
+        Returns:
+            True se deve tentar novamente
+        """
+        if attempt >= self.max_attempts:
+            return False
+        
+        if not self.is_idempotent(method, idempotent):
+            return False
+        
+        if status is None:
+            return self.retry_network_errors
+        
+        if status not in self.retry_statuses:
+            return False
+        
+        if self.respect_retry_after and retry_after is not None and retry_after > self.max_retry_after:
+            return False
+        
+        return True
+    
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calcula a espera antes da próxima tentativa
+        
+        Args:
+            attempt: Número da tentativa que falhou (começa em 1)
+            retry_after: Valor do Retry-After em segundos, se houver
+        
+        Returns:
+            Segundos a esperar
+        """
+        if self.respect_retry_after and retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
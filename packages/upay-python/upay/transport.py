@@ -0,0 +1,305 @@
+"""
+Camada de transporte do cliente HTTP síncrono
+
+O HttpClient monta a requisição (URL, headers, corpo já serializado) e a
+entrega a um Transport, que só precisa enviá-la e devolver um
+TransportResponse. RequestsTransport (padrão) usa requests com o pool do
+PooledHTTPAdapter; HTTP2Transport usa httpx com HTTP/2, multiplexando as
+requisições simultâneas em poucas conexões.
+"""
+
+import importlib.util
+import json
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+import requests
+from requests.adapters import BaseAdapter
+from .pool import PooledHTTPAdapter, connect_time, reset_connect_time
+
+
+class TransportError(Exception):
+    """Falha de rede (conexão, timeout, TLS...) sem resposta HTTP"""
+
+
+class TransportResponse:
+    """
+    Resposta devolvida por um Transport
+    
+    Attributes:
+        status_code: Status HTTP
+        reason: Texto do status (ex.: "Not Found")
+        headers: Headers da resposta (busca sem diferenciar maiúsculas)
+        content: Corpo em bytes (já descompactado)
+        ttfb: Segundos até a chegada dos headers
+        connect_time: Segundos abrindo conexão (0 se reaproveitada)
+        http_version: Versão do protocolo usada (ex.: "HTTP/1.1", "HTTP/2")
+    """
+    
+    __slots__ = ("status_code", "reason", "headers", "content", "ttfb", "connect_time", "http_version")
+    
+    def __init__(
+        self,
+        status_code: int,
+        reason: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        ttfb: float = 0.0,
+        connect_time: float = 0.0,
+        http_version: str = "HTTP/1.1"
+    ):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.ttfb = ttfb
+        self.connect_time = connect_time
+        self.http_version = http_version
+    
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+    
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class Transport:
+    """
+    Interface dos transportes
+    
+    Implementações devem ser thread-safe: o mesmo transporte atende todas as
+    threads que compartilham o cliente.
+    """
+    
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> TransportResponse:
+        """
+        Envia uma requisição
+        
+        Args:
+            method: Método HTTP
+            url: URL completa
+            body: Corpo já serializado (ou None)
+            headers: Headers da requisição
+            timeout: Timeout em segundos
+        
+        Returns:
+            A resposta, qualquer que seja o status
+        
+        Raises:
+            TransportError: Se não houve resposta (falha de rede, timeout...)
+        """
+        raise NotImplementedError
+    
+    def stats(self) -> Dict[str, int]:
+        """Retorna contadores de uso das conexões (ver PoolStats)"""
+        return {}
+    
+    def close(self) -> None:
+        """Fecha as conexões abertas"""
+
+
+class RequestsTransport(Transport):
+    """Transporte HTTP/1.1 com requests e o pool configurável (padrão)"""
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keepalive_timeout: Optional[float] = None,
+        adapter: Optional[BaseAdapter] = None
+    ):
+        """
+        Args:
+            pool_connections: Quantidade de pools (hosts) mantidos em cache
+            pool_maxsize: Máximo de conexões mantidas por host
+            pool_block: Se True, espera uma conexão livre quando o pool esgota
+            keepalive_timeout: Segundos de ociosidade antes de descartar uma conexão
+            adapter: Transport adapter do requests no lugar do PooledHTTPAdapter
+                (ex.: RecordingAdapter/ReplayAdapter); as opções acima são ignoradas
+        """
+        self.adapter = adapter or PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive_timeout=keepalive_timeout
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+    
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> TransportResponse:
+        reset_connect_time()
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                data=body,
+                headers=headers,
+                timeout=timeout
+            )
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e)) from e
+        
+        return TransportResponse(
+            response.status_code,
+            response.reason,
+            response.headers,
+            response.content,
+            # elapsed vai do envio até a chegada dos headers da resposta
+            response.elapsed.total_seconds(),
+            connect_time()
+        )
+    
+    def stats(self) -> Dict[str, int]:
+        stats = getattr(self.adapter, "stats", None)
+        return stats.as_dict() if stats is not None else {}
+    
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    Transporte HTTP/2 com httpx
+    
+    Requisições simultâneas de várias threads viram streams de uma mesma
+    conexão por host, em vez de uma conexão (e um handshake TLS) cada. Se o
+    servidor não negociar HTTP/2 via ALPN, o httpx usa HTTP/1.1.
+    """
+    
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        **client_kwargs
+    ):
+        """
+        Args:
+            max_connections: Máximo de conexões abertas
+            max_keepalive_connections: Máximo de conexões ociosas mantidas
+            keepalive_expiry: Segundos que uma conexão ociosa fica aberta
+            **client_kwargs: Opções extras do httpx.Client (ex.: proxy, verify)
+        
+        Raises:
+            ImportError: Se httpx ou h2 não estiverem instalados
+        """
+        message = (
+            "O transporte HTTP/2 requer os pacotes 'httpx' e 'h2'. "
+            "Instale com: pip install upay-python[http2]"
+        )
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(message)
+        # O h2 é carregado pelo próprio httpx; aqui só é preciso saber se existe
+        if importlib.util.find_spec("h2") is None:
+            raise ImportError(message)
+        
+        self._httpx = httpx
+        client_kwargs.setdefault("http2", True)
+        self.client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            **client_kwargs
+        )
+        self._lock = threading.Lock()
+        self._counters = {"new_connections": 0, "requests": 0}
+    
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> TransportResponse:
+        timings: Dict[str, float] = {}
+        
+        def trace(event: str, _info: Dict[str, Any]) -> None:
+            timings[event] = time.perf_counter()
+        
+        started = time.perf_counter()
+        try:
+            response = self.client.request(
+                method,
+                url,
+                content=body,
+                headers=headers,
+                timeout=timeout,
+                extensions={"trace": trace}
+            )
+        except self._httpx.HTTPError as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+        
+        connecting = 0.0
+        for step in ("connection.connect_tcp", "connection.start_tls"):
+            if step + ".complete" in timings:
+                connecting += timings[step + ".complete"] - timings[step + ".started"]
+        headers_at = (
+            timings.get("http2.receive_response_headers.complete")
+            or timings.get("http11.receive_response_headers.complete")
+            or time.perf_counter()
+        )
+        
+        with self._lock:
+            self._counters["requests"] += 1
+            if "connection.connect_tcp.complete" in timings:
+                self._counters["new_connections"] += 1
+        
+        return TransportResponse(
+            response.status_code,
+            response.reason_phrase,
+            response.headers,
+            response.content,
+            headers_at - started,
+            connecting,
+            response.http_version
+        )
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores
+        
+        Returns:
+            Dicionário com new_connections (conexões abertas) e
+            reused_connections (requisições feitas em conexões já abertas)
+        """
+        with self._lock:
+            new = self._counters["new_connections"]
+            return {"new_connections": new, "reused_connections": self._counters["requests"] - new}
+    
+    def close(self) -> None:
+        self.client.close()
+
+
+__all__ = [
+    "Transport",
+    "TransportError",
+    "TransportResponse",
+    "RequestsTransport",
+    "HTTP2Transport",
+]
@@ -1,27 +1,66 @@
 """
 Utilitários do SDK Upay
+
+Importados sob demanda (PEP 562), como em upay/__init__.py.
 """
 
-from .errors import (
-    UpayError,
-    UpayAuthenticationError,
-    UpayValidationError,
-    UpayNotFoundError,
-    UpayRateLimitError,
-    UpayServerError,
-    handle_api_error
-)
-from .webhooks import verify_webhook_signature, extract_webhook_signature, WebhookEventType
-
-__all__ = [
-    'UpayError',
-    'UpayAuthenticationError',
-    'UpayValidationError',
-    'UpayNotFoundError',
-    'UpayRateLimitError',
-    'UpayServerError',
-    'handle_api_error',
-    'verify_webhook_signature',
-    'extract_webhook_signature',
-    'WebhookEventType',
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Nome público -> módulo que o define
+_EXPORTS = {
+    'UpayError': '.errors',
+    'UpayAuthenticationError': '.errors',
+    'UpayValidationError': '.errors',
+    'UpayNotFoundError': '.errors',
+    'UpayRateLimitError': '.errors',
+    'UpayServerError': '.errors',
+    'UpayWebhookError': '.errors',
+    'UpayCircuitOpenError': '.errors',
+    'handle_api_error': '.errors',
+    'verify_webhook_signature': '.webhooks',
+    'extract_webhook_signature': '.webhooks',
+    'WebhookEventType': '.webhooks',
+    'WebhookVerifier': '.webhooks',
+    'WebhookRouter': '.webhook_router',
+    'AsyncWebhookRouter': '.webhook_router',
+    'WebhookDeduplicator': '.webhook_dedup',
+    'SQLiteDedupBackend': '.webhook_dedup',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from .errors import (
+        UpayError,
+        UpayAuthenticationError,
+        UpayValidationError,
+        UpayNotFoundError,
+        UpayRateLimitError,
+        UpayServerError,
+        UpayWebhookError,
+        UpayCircuitOpenError,
+        handle_api_error,
+    )
+    from .webhooks import (
+        verify_webhook_signature,
+        extract_webhook_signature,
+        WebhookEventType,
+        WebhookVerifier,
+    )
+    from .webhook_router import WebhookRouter, AsyncWebhookRouter
+    from .webhook_dedup import WebhookDeduplicator, SQLiteDedupBackend
@@ -3,10 +3,18 @@ Classes de erro customizadas para o SDK
 """
 
 from typing import Any, Optional
+from ..retry import parse_retry_after
 
 
 class UpayError(Exception):
-    """Erro base do SDK Upay"""
+    """
+    Erro base do SDK Upay
+    
+    Em operações com chave de idempotência, idempotency_key traz a chave
+    usada: repetir a chamada com ela não duplica a operação.
+    """
+    
+    idempotency_key: Optional[str] = None
     
     def __init__(
         self,
@@ -47,8 +55,13 @@ class UpayNotFoundError(UpayError):
 class UpayRateLimitError(UpayError):
     """Erro de limite de requisições"""
     
-    def __init__(self, message: str = "Limite de requisições excedido. Tente novamente mais tarde."):
+    def __init__(
+        self,
+        message: str = "Limite de requisições excedido. Tente novamente mais tarde.",
+        retry_after: Optional[float] = None
+    ):
         super().__init__(message, "RATE_LIMIT_ERROR", 429)
+        self.retry_after = retry_after
 
 
 class UpayServerError(UpayError):
@@ -58,19 +71,53 @@ class UpayServerError(UpayError):
         super().__init__(message, "SERVER_ERROR", 500)
 
 
+class UpayWebhookError(UpayError):
+    """
+    Webhook rejeitado
+    
+    O status é o código HTTP que o endpoint deve responder: 401 para assinatura
+    inválida, 400 para corpo inválido e 503 quando a fila de processamento
+    está cheia (a Upay reenvia a entrega depois).
+    """
+    
+    def __init__(self, message: str, code: str = "WEBHOOK_ERROR", status: int = 400):
+        super().__init__(message, code, status)
+
+
+class UpayCircuitOpenError(UpayError):
+    """
+    Chamada recusada sem ir à rede porque o circuit breaker do grupo de
+    endpoints está aberto (a API está falhando ou lenta)
+    
+    Attributes:
+        group: Grupo de endpoints (ex.: "transactions")
+        retry_after: Segundos até o circuito aceitar uma chamada de teste
+    """
+    
+    def __init__(self, group: str, retry_after: float):
+        super().__init__(
+            f"Circuito de '{group}' aberto: chamadas suspensas por {retry_after:.1f}s",
+            "CIRCUIT_OPEN",
+            503
+        )
+        self.group = group
+        self.retry_after = retry_after
+
+
 def handle_api_error(response, body: Optional[Any] = None) -> UpayError:
     """
     Converte erros HTTP em erros do SDK
     
     Args:
-        response: Objeto Response do requests
+        response: Objeto Response do requests (ou httpx)
         body: Corpo da resposta parseado
         
     Returns:
         Erro apropriado do SDK
     """
     status = response.status_code
-    message = body.get("message") if isinstance(body, dict) else f"HTTP {status}: {response.reason}"
+    reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+    message = body.get("message") if isinstance(body, dict) else f"HTTP {status}: {reason}"
     code = body.get("code") if isinstance(body, dict) else None
     
     if status == 401:
@@ -82,7 +129,8 @@ def handle_api_error(response, body: Optional[Any] = None) -> UpayError:
         resource_id = body.get("id") if isinstance(body, dict) else None
         return UpayNotFoundError("Recurso", resource_id)
     elif status == 429:
-        return UpayRateLimitError(message)
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return UpayRateLimitError(message, retry_after)
     elif status in [500, 502, 503]:
         return UpayServerError(message)
     else:
@@ -0,0 +1,363 @@
+"""
+Deduplicação de webhooks reentregues
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger("upay.webhooks")
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom com memória fixa
+    
+    Responde "talvez visto" ou "com certeza não visto". Acima de `capacity`
+    itens a taxa de falso positivo sobe; o WebhookDeduplicator reconstrói o
+    filtro a partir do backend quando isso acontece. Usa cerca de 1.2 bytes
+    por item para error_rate=0.01.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        """
+        Inicializa o filtro
+        
+        Args:
+            capacity: Quantidade de itens prevista
+            error_rate: Taxa de falso positivo desejada (0 < error_rate < 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity deve ser pelo menos 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate deve estar entre 0 e 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._array = bytearray((self._bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
+    
+    def __contains__(self, item: str) -> bool:
+        array = self._array
+        return all(array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def add(self, item: str) -> None:
+        """Adiciona um item"""
+        for pos in self._positions(item):
+            self._array[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def clear(self) -> None:
+        """Remove todos os itens"""
+        self._array = bytearray(len(self._array))
+        self.count = 0
+
+
+class DedupBackend:
+    """
+    Armazenamento persistente de IDs de eventos já processados
+    
+    Subclasses guardam o ID com o instante (time.time()) em que ele expira.
+    """
+    
+    def contains(self, event_id: str) -> bool:
+        """Retorna True se o ID foi registrado e ainda não expirou"""
+        raise NotImplementedError
+    
+    def add(self, event_id: str, expires_at: float) -> None:
+        """Registra um ID até expires_at (epoch em segundos)"""
+        raise NotImplementedError
+    
+    def remove(self, event_id: str) -> None:
+        """Remove um ID registrado"""
+        raise NotImplementedError
+    
+    def iter_ids(self) -> Iterable[str]:
+        """
+        Percorre os IDs ainda não expirados (usado para montar o filtro de Bloom)
+        
+        Pode ser chamado em outra thread enquanto contains/add são usados.
+        """
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """Libera os recursos do backend"""
+
+
+class SQLiteDedupBackend(DedupBackend):
+    """
+    Backend em um arquivo SQLite, preservado entre reinícios do processo
+    
+    Os IDs expirados são removidos periodicamente, então o arquivo fica
+    limitado ao volume de eventos dentro do TTL.
+    """
+    
+    def __init__(self, path: str, purge_every: int = 1000, batch_size: int = 10_000):
+        """
+        Inicializa o backend
+        
+        Args:
+            path: Caminho do arquivo (criado se não existir)
+            purge_every: A cada quantos registros os expirados são removidos
+            batch_size: Quantos IDs iter_ids lê do arquivo de cada vez
+        """
+        # Importado aqui: o LRU e o filtro de Bloom não precisam do sqlite3
+        import sqlite3
+        
+        self.path = path
+        self.purge_every = purge_every
+        self.batch_size = batch_size
+        self._writes = 0
+        # A conexão é compartilhada entre threads (ex.: a reconstrução do
+        # filtro de Bloom); cada operação a usa sozinha
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS webhook_events "
+            "(id TEXT PRIMARY KEY, expires_at REAL NOT NULL) WITHOUT ROWID"
+        )
+    
+    def contains(self, event_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM webhook_events WHERE id = ? AND expires_at > ?",
+                (event_id, time.time())
+            ).fetchone()
+        return row is not None
+    
+    def add(self, event_id: str, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO webhook_events (id, expires_at) VALUES (?, ?)",
+                (event_id, expires_at)
+            )
+            self._writes += 1
+            if self._writes % self.purge_every == 0:
+                self._conn.execute("DELETE FROM webhook_events WHERE expires_at <= ?", (time.time(),))
+    
+    def remove(self, event_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM webhook_events WHERE id = ?", (event_id,))
+    
+    def iter_ids(self) -> Iterator[str]:
+        # Lê em lotes (fetchmany) para não carregar a tabela inteira na
+        # memória; entre um lote e outro, contains/add podem usar a conexão
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id FROM webhook_events WHERE expires_at > ?", (time.time(),)
+            )
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield row[0]
+        finally:
+            cursor.close()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class WebhookDeduplicator:
+    """
+    Descarta webhooks reentregues com base no ID do evento
+    
+    Os IDs recentes ficam em um LRU em memória com TTL e tamanho máximo, então
+    a consulta é O(1) e a memória não cresce com o volume. Com um backend
+    persistente (ex.: SQLiteDedupBackend), IDs que saíram do LRU ou de antes de
+    um reinício também são reconhecidos; nesse caso, o filtro de Bloom evita
+    consultar o backend para IDs que com certeza são novos. O filtro é montado
+    a partir do backend na criação e, quando enche, reconstruído em segundo
+    plano (descartando os IDs expirados) e trocado pelo atual, sem bloquear
+    as chamadas a seen().
+    
+    Exemplo:
+        >>> from upay import WebhookDeduplicator, SQLiteDedupBackend, WebhookRouter
+        >>>
+        >>> dedup = WebhookDeduplicator(
+        ...     maxsize=100_000,
+        ...     ttl=3 * 24 * 3600,
+        ...     backend=SQLiteDedupBackend("/var/lib/app/webhooks.db"),
+        ...     bloom_capacity=5_000_000,
+        ... )
+        >>> router = WebhookRouter("seu_webhook_secret", dedup=dedup)
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 100_000,
+        ttl: float = 24 * 3600,
+        backend: Optional[DedupBackend] = None,
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: float = 0.01
+    ):
+        """
+        Inicializa o deduplicador
+        
+        Args:
+            maxsize: Máximo de IDs mantidos em memória
+            ttl: Por quanto tempo (segundos) um ID é considerado duplicado
+            backend: Armazenamento persistente opcional
+            bloom_capacity: Se informado, usa um filtro de Bloom com essa
+                capacidade na frente do backend (exige backend); dimensione
+                para o volume de eventos dentro do TTL
+            bloom_error_rate: Taxa de falso positivo do filtro de Bloom
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser pelo menos 1")
+        if ttl <= 0:
+            raise ValueError("ttl deve ser maior que zero")
+        if bloom_capacity and backend is None:
+            raise ValueError("bloom_capacity exige um backend persistente")
+        
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend
+        self.bloom = BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None
+        
+        self._lock = threading.Lock()
+        # ID -> instante (monotônico) em que expira
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._counters = dict.fromkeys(("unique", "duplicates", "backend_lookups"), 0)
+        # IDs registrados durante uma reconstrução do filtro (None fora dela)
+        self._pending: Optional[List[str]] = None
+        self._rebuild_thread: Optional[threading.Thread] = None
+        
+        if self.bloom is not None:
+            self.rebuild_bloom()
+    
+    def seen(self, event_id: str) -> bool:
+        """
+        Registra um ID e informa se ele já tinha sido visto dentro do TTL
+        
+        Args:
+            event_id: ID do evento
+        
+        Returns:
+            True se for uma reentrega (o evento deve ser descartado)
+        """
+        event_id = str(event_id)
+        now = time.monotonic()
+        rebuild = False
+        
+        with self._lock:
+            expires_at = self._recent.get(event_id)
+            if expires_at is not None:
+                if expires_at > now:
+                    self._recent.move_to_end(event_id)
+                    self._counters["duplicates"] += 1
+                    return True
+                del self._recent[event_id]
+            
+            if self.backend is not None and (self.bloom is None or event_id in self.bloom):
+                self._counters["backend_lookups"] += 1
+                if self.backend.contains(event_id):
+                    self._remember(event_id, now)
+                    self._counters["duplicates"] += 1
+                    return True
+            
+            self._remember(event_id, now)
+            if self.backend is not None:
+                self.backend.add(event_id, time.time() + self.ttl)
+            if self.bloom is not None:
+                self.bloom.add(event_id)
+                if self._pending is not None:
+                    self._pending.append(event_id)
+                elif self.bloom.count >= self._bloom_rebuild_at:
+                    self._pending = []
+                    rebuild = True
+            self._counters["unique"] += 1
+        
+        if rebuild:
+            self._rebuild_thread = threading.Thread(
+                target=self._fill_bloom, name="upay-bloom-rebuild", daemon=True
+            )
+            self._rebuild_thread.start()
+        return False
+    
+    def forget(self, event_id: str) -> None:
+        """
+        Esquece um ID, para que uma nova entrega dele seja processada
+        
+        Args:
+            event_id: ID do evento
+        """
+        event_id = str(event_id)
+        with self._lock:
+            self._recent.pop(event_id, None)
+            if self.backend is not None:
+                self.backend.remove(event_id)
+    
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores unique, duplicates, backend_lookups e o tamanho do LRU"""
+        with self._lock:
+            return dict(self._counters, size=len(self._recent))
+    
+    def close(self) -> None:
+        """Espera a reconstrução do filtro em andamento e fecha o backend, se houver"""
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.join()
+        if self.backend is not None:
+            self.backend.close()
+    
+    def rebuild_bloom(self) -> None:
+        """
+        Remonta o filtro de Bloom com os IDs não expirados do backend
+        
+        Chamado automaticamente (em segundo plano) quando o filtro enche.
+        Enquanto o novo filtro é montado, o atual continua respondendo.
+        Não faz nada se já houver uma reconstrução em andamento.
+        """
+        with self._lock:
+            if self._pending is not None:
+                return
+            self._pending = []
+        self._fill_bloom()
+    
+    def _fill_bloom(self) -> None:
+        """Monta um filtro novo fora do lock e o troca pelo atual"""
+        try:
+            bloom = BloomFilter(self.bloom.capacity, self.bloom.error_rate)
+            for event_id in self.backend.iter_ids():
+                bloom.add(event_id)
+        except Exception:
+            logger.exception("Erro ao reconstruir o filtro de Bloom")
+            with self._lock:
+                self._pending = None
+                # Tenta de novo depois de mais `capacity` IDs
+                self._bloom_rebuild_at = self.bloom.count + self.bloom.capacity
+            return
+        
+        with self._lock:
+            # IDs registrados durante a leitura do backend
+            for event_id in self._pending:
+                bloom.add(event_id)
+            self._pending = None
+            self.bloom = bloom
+            # Se quase todos os IDs ainda valem, adia a próxima reconstrução
+            self._bloom_rebuild_at = max(bloom.capacity, 2 * bloom.count)
+    
+    def _remember(self, event_id: str, now: float) -> None:
+        """Guarda o ID no LRU (chamado com o lock adquirido)"""
+        self._recent[event_id] = now + self.ttl
+        self._recent.move_to_end(event_id)
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
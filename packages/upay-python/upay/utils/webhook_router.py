@@ -0,0 +1,409 @@
+"""
+Roteamento de webhooks verificados para handlers por tipo de evento
+"""
+
+import inspect
+import logging
+import queue
+import threading
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Union
+from ..codec import default_codec
+from .errors import UpayWebhookError
+from .webhooks import WebhookEventType, WebhookPayload, WebhookVerifier
+
+if TYPE_CHECKING:
+    # Só para as anotações: quem não usa dedup não carrega o módulo (nem o
+    # sqlite3), e o WebhookRouter síncrono não carrega asyncio
+    import asyncio
+    from .webhook_dedup import WebhookDeduplicator
+
+logger = logging.getLogger("upay.webhooks")
+
+
+# Handler de um evento: recebe o evento já parseado
+WebhookHandler = Callable[[Dict[str, Any]], Any]
+
+
+def _event_type_key(event_type: Union[WebhookEventType, str]) -> str:
+    # Membros de Enum não têm o mesmo hash da string, então a chave é o valor
+    return event_type.value if isinstance(event_type, Enum) else str(event_type)
+
+
+class _BaseWebhookRouter:
+    """Registro de handlers, verificação e parse comuns aos dois roteadores"""
+    
+    def __init__(
+        self,
+        secrets: Union[WebhookVerifier, str, Sequence[str]],
+        queue_size: int,
+        error_handler: Optional[Callable[[Dict[str, Any], Exception], Any]],
+        dedup: Optional["WebhookDeduplicator"]
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size deve ser pelo menos 1")
+        
+        self.verifier = secrets if isinstance(secrets, WebhookVerifier) else WebhookVerifier(secrets)
+        self.queue_size = queue_size
+        self.error_handler = error_handler
+        self.dedup = dedup
+        self.codec = default_codec()
+        self._handlers: Dict[str, List[WebhookHandler]] = {}
+    
+    def add_handler(self, event_type: Union[WebhookEventType, str], handler: WebhookHandler) -> None:
+        """
+        Registra um handler para um tipo de evento
+        
+        Args:
+            event_type: Tipo do evento (WebhookEventType) ou "*" para todos
+            handler: Função chamada com o evento parseado
+        """
+        self._handlers.setdefault(_event_type_key(event_type), []).append(handler)
+    
+    def on(self, event_type: Union[WebhookEventType, str]) -> Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Decorator equivalente a add_handler
+        
+        Exemplo:
+            >>> @router.on(WebhookEventType.TRANSACTION_PAID)
+            ... def liberar_pedido(event):
+            ...     ...
+        """
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(event_type, handler)
+            return handler
+        return decorator
+    
+    def parse(self, payload: WebhookPayload, signature: Optional[str]) -> Dict[str, Any]:
+        """
+        Verifica a assinatura e faz o parse do corpo (uma única vez)
+        
+        Args:
+            payload: Corpo da requisição
+            signature: Assinatura recebida no header
+        
+        Returns:
+            Evento parseado
+        
+        Raises:
+            UpayWebhookError: Se a assinatura ou o corpo forem inválidos
+        """
+        if not self.verifier.verify(payload, signature):
+            raise UpayWebhookError("Assinatura do webhook inválida", "WEBHOOK_INVALID_SIGNATURE", 401)
+        
+        try:
+            event = self.codec.decode(payload)
+        except ValueError:
+            event = None
+        if not isinstance(event, dict):
+            raise UpayWebhookError("Corpo do webhook inválido", "WEBHOOK_INVALID_PAYLOAD", 400)
+        return event
+    
+    def _handlers_for(self, event: Dict[str, Any]) -> List[WebhookHandler]:
+        # Reentregas são descartadas antes de qualquer handler
+        event_id = event.get("id")
+        if self.dedup is not None and event_id is not None and self.dedup.seen(event_id):
+            return []
+        
+        event_type = event.get("type") or event.get("event")
+        return self._handlers.get(str(event_type), []) + self._handlers.get("*", [])
+    
+    def _forget(self, event: Dict[str, Any]) -> None:
+        """Desfaz o registro no dedup de um evento que não entrou na fila"""
+        if self.dedup is not None and event.get("id") is not None:
+            self.dedup.forget(event["id"])
+    
+    def _report_error(self, event: Dict[str, Any], error: Exception) -> None:
+        if self.error_handler is not None:
+            try:
+                self.error_handler(event, error)
+                return
+            except Exception:
+                pass
+        logger.exception("Erro no handler do webhook %s", event.get("type"), exc_info=error)
+    
+    @staticmethod
+    def _queue_full_error() -> UpayWebhookError:
+        return UpayWebhookError("Fila de webhooks cheia", "WEBHOOK_QUEUE_FULL", 503)
+
+
+class WebhookRouter(_BaseWebhookRouter):
+    """
+    Roteador de webhooks com handlers executados em um pool de threads
+    
+    dispatch() verifica a assinatura, faz o parse do JSON e coloca o evento
+    em uma fila limitada; o endpoint pode responder na hora enquanto os
+    handlers rodam em segundo plano. Com a fila cheia, dispatch() espera
+    (ou levanta UpayWebhookError com status 503), segurando novas entregas.
+    
+    Exemplo:
+        >>> from upay import WebhookRouter, WebhookEventType, UpayWebhookError
+        >>>
+        >>> router = WebhookRouter("seu_webhook_secret", max_workers=8)
+        >>>
+        >>> @router.on(WebhookEventType.TRANSACTION_PAID)
+        ... def liberar_pedido(event):
+        ...     ...
+        >>>
+        >>> @app.route('/webhook', methods=['POST'])
+        ... def webhook():
+        ...     try:
+        ...         router.dispatch(request.data, request.headers.get('X-Upay-Signature'), timeout=1)
+        ...     except UpayWebhookError as e:
+        ...         return {"error": e.message}, e.status
+        ...     return {"status": "ok"}, 200
+    """
+    
+    def __init__(
+        self,
+        secrets: Union[WebhookVerifier, str, Sequence[str]],
+        max_workers: int = 4,
+        queue_size: int = 1000,
+        error_handler: Optional[Callable[[Dict[str, Any], Exception], Any]] = None,
+        dedup: Optional["WebhookDeduplicator"] = None
+    ):
+        """
+        Inicializa o roteador
+        
+        Args:
+            secrets: WebhookVerifier, secret ou lista de secrets aceitos
+            max_workers: Threads que executam os handlers
+            queue_size: Máximo de eventos aguardando processamento
+            error_handler: Função (evento, exceção) chamada quando um handler
+                falha (padrão: registra no logger "upay.webhooks")
+            dedup: WebhookDeduplicator para descartar reentregas (opcional)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser pelo menos 1")
+        
+        super().__init__(secrets, queue_size, error_handler, dedup)
+        self.max_workers = max_workers
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def dispatch(
+        self,
+        payload: WebhookPayload,
+        signature: Optional[str],
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Verifica um webhook e agenda seus handlers
+        
+        Args:
+            payload: Corpo da requisição
+            signature: Assinatura recebida no header
+            block: Se False, não espera vaga na fila
+            timeout: Espera máxima por vaga na fila, em segundos
+        
+        Returns:
+            Evento parseado
+        
+        Raises:
+            UpayWebhookError: Assinatura/corpo inválidos ou fila cheia
+        """
+        event = self.parse(payload, signature)
+        handlers = self._handlers_for(event)
+        if handlers:
+            self._start()
+            try:
+                self._queue.put((event, handlers), block, timeout)
+            except queue.Full:
+                self._forget(event)
+                raise self._queue_full_error()
+        return event
+    
+    def join(self) -> None:
+        """Espera todos os eventos da fila serem processados"""
+        self._queue.join()
+    
+    def close(self, wait: bool = True) -> None:
+        """
+        Encerra as threads depois de processar o que já está na fila
+        
+        Args:
+            wait: Se True, espera as threads terminarem
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+        
+        for _ in workers:
+            self._queue.put(None)
+        if wait:
+            for worker in workers:
+                worker.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _start(self) -> None:
+        """Cria as threads no primeiro dispatch"""
+        if self._workers:
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WebhookRouter já foi fechado")
+            if self._workers:
+                return
+            for index in range(self.max_workers):
+                worker = threading.Thread(
+                    target=self._run,
+                    name=f"upay-webhooks-{index}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+    
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                event, handlers = item
+                for handler in handlers:
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        self._report_error(event, e)
+            finally:
+                self._queue.task_done()
+
+
+class AsyncWebhookRouter(_BaseWebhookRouter):
+    """
+    Versão para asyncio do WebhookRouter
+    
+    Os handlers podem ser funções comuns ou corrotinas e são executados por
+    `concurrency` tasks que consomem uma asyncio.Queue limitada. Funções
+    comuns rodam no executor padrão do loop (loop.run_in_executor), para não
+    bloquear o event loop.
+    
+    Exemplo:
+        >>> router = AsyncWebhookRouter("seu_webhook_secret", concurrency=16)
+        >>>
+        >>> @router.on(WebhookEventType.TRANSACTION_PAID)
+        ... async def liberar_pedido(event):
+        ...     ...
+        >>>
+        >>> await router.dispatch(body, signature, timeout=1)
+    """
+    
+    def __init__(
+        self,
+        secrets: Union[WebhookVerifier, str, Sequence[str]],
+        concurrency: int = 4,
+        queue_size: int = 1000,
+        error_handler: Optional[Callable[[Dict[str, Any], Exception], Any]] = None,
+        dedup: Optional["WebhookDeduplicator"] = None
+    ):
+        """
+        Inicializa o roteador
+        
+        Args:
+            secrets: WebhookVerifier, secret ou lista de secrets aceitos
+            concurrency: Tasks que executam os handlers
+            queue_size: Máximo de eventos aguardando processamento
+            error_handler: Função (evento, exceção) chamada quando um handler falha
+            dedup: WebhookDeduplicator para descartar reentregas (opcional)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency deve ser pelo menos 1")
+        
+        super().__init__(secrets, queue_size, error_handler, dedup)
+        self.concurrency = concurrency
+        self._queue: Optional["asyncio.Queue"] = None
+        self._workers: List["asyncio.Task"] = []
+        self._closed = False
+    
+    async def dispatch(
+        self,
+        payload: WebhookPayload,
+        signature: Optional[str],
+        block: bool = True,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Verifica um webhook e agenda seus handlers (ver WebhookRouter.dispatch)"""
+        import asyncio
+        
+        event = self.parse(payload, signature)
+        handlers = self._handlers_for(event)
+        if handlers:
+            self._start()
+            try:
+                if not block:
+                    self._queue.put_nowait((event, handlers))
+                else:
+                    await asyncio.wait_for(self._queue.put((event, handlers)), timeout)
+            except (asyncio.QueueFull, asyncio.TimeoutError):
+                self._forget(event)
+                raise self._queue_full_error()
+        return event
+    
+    async def join(self) -> None:
+        """Espera todos os eventos da fila serem processados"""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def aclose(self) -> None:
+        """Encerra as tasks depois de processar o que já está na fila"""
+        import asyncio
+        
+        if self._closed:
+            return
+        self._closed = True
+        
+        for _ in self._workers:
+            await self._queue.put(None)
+        await asyncio.gather(*self._workers)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def _start(self) -> None:
+        """Cria a fila e as tasks no primeiro dispatch (dentro do event loop)"""
+        import asyncio
+        
+        if self._workers:
+            return
+        if self._closed:
+            raise RuntimeError("AsyncWebhookRouter já foi fechado")
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            asyncio.ensure_future(self._run()) for _ in range(self.concurrency)
+        ]
+    
+    async def _run(self) -> None:
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                event, handlers = item
+                for handler in handlers:
+                    try:
+                        if inspect.iscoroutinefunction(handler):
+                            result = handler(event)
+                        else:
+                            result = await loop.run_in_executor(None, handler, event)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception as e:
+                        self._report_error(event, e)
+            finally:
+                self._queue.task_done()
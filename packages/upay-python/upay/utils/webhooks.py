@@ -1,12 +1,35 @@
 """
 Utilitários para verificação de webhooks
+
+O roteador (WebhookRouter, AsyncWebhookRouter) e o deduplicador
+(WebhookDeduplicator, SQLiteDedupBackend) ficam em módulos próprios, para
+que verificar uma assinatura não carregue asyncio, sqlite3 etc. Eles
+continuam acessíveis por este módulo.
 """
 
 import hmac
 import hashlib
-from typing import Dict, Optional, Union
+import importlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from enum import Enum
 
+# Nomes carregados sob demanda -> módulo que os define
+_LAZY = {
+    "WebhookRouter": ".webhook_router",
+    "AsyncWebhookRouter": ".webhook_router",
+    "BloomFilter": ".webhook_dedup",
+    "DedupBackend": ".webhook_dedup",
+    "SQLiteDedupBackend": ".webhook_dedup",
+    "WebhookDeduplicator": ".webhook_dedup",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __package__), name)
+
 
 class WebhookEventType(str, Enum):
     """Tipos de eventos de webhook"""
@@ -20,14 +43,102 @@ class WebhookEventType(str, Enum):
     PAYMENT_LINK_DELETED = "payment_link.deleted"
 
 
+# Corpo do webhook: bytes/memoryview são verificados sem cópia
+WebhookPayload = Union[bytes, bytearray, memoryview, str]
+
+
+class WebhookVerifier:
+    """
+    Verificador de assinaturas de webhook reutilizável
+    
+    O HMAC de cada secret é preparado uma única vez; cada verificação apenas
+    copia esse estado e processa o corpo. Aceita vários secrets ativos para
+    permitir a rotação sem rejeitar entregas assinadas com o secret antigo.
+    
+    Exemplo:
+        >>> from upay import WebhookVerifier
+        >>>
+        >>> verifier = WebhookVerifier(["secret_novo", "secret_antigo"])
+        >>> verifier.verify(request.data, request.headers.get("X-Upay-Signature"))
+        True
+    """
+    
+    def __init__(self, secrets: Union[str, Sequence[str]]):
+        """
+        Inicializa o verificador
+        
+        Args:
+            secrets: Secret ou lista de secrets aceitos
+        """
+        if isinstance(secrets, str):
+            secrets = [secrets]
+        
+        secrets = [secret for secret in secrets if secret]
+        if not secrets:
+            raise ValueError("Informe pelo menos um secret")
+        
+        self._keyed = [
+            hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+            for secret in secrets
+        ]
+    
+    def verify(self, payload: WebhookPayload, signature: Optional[str]) -> bool:
+        """
+        Verifica a assinatura de um webhook
+        
+        Args:
+            payload: Corpo da requisição (bytes, memoryview ou string)
+            signature: Assinatura recebida no header (com ou sem "sha256=")
+        
+        Returns:
+            True se a assinatura corresponder a algum dos secrets
+        """
+        if not payload or not signature:
+            return False
+        
+        try:
+            if isinstance(payload, str):
+                payload = payload.encode('utf-8')
+            if signature.startswith("sha256="):
+                signature = signature[7:]
+            
+            valid = False
+            # Testa todos os secrets para o tempo não indicar qual deles bateu
+            for keyed in self._keyed:
+                hash_obj = keyed.copy()
+                hash_obj.update(payload)
+                valid |= hmac.compare_digest(hash_obj.hexdigest(), signature)
+            return valid
+        except Exception:
+            return False
+    
+    def verify_many(
+        self,
+        deliveries: Iterable[Tuple[WebhookPayload, Optional[str]]]
+    ) -> List[bool]:
+        """
+        Verifica um lote de entregas
+        
+        Args:
+            deliveries: Pares (payload, signature)
+        
+        Returns:
+            Um resultado por entrega, na mesma ordem
+        """
+        verify = self.verify
+        return [verify(payload, signature) for payload, signature in deliveries]
+
+
 def verify_webhook_signature(
-    payload: Union[bytes, str],
+    payload: WebhookPayload,
     signature: str,
     secret: str
 ) -> bool:
     """
     Verifica a assinatura de um webhook usando HMAC SHA256
     
+    Para verificar muitos webhooks, prefira um WebhookVerifier reutilizável.
+    
     Args:
         payload: Corpo da requisição (bytes ou string)
         signature: Assinatura recebida no header
@@ -39,25 +150,7 @@ def verify_webhook_signature(
     if not payload or not signature or not secret:
         return False
     
-    try:
-        # Converte payload para bytes se necessário
-        if isinstance(payload, str):
-            payload_bytes = payload.encode('utf-8')
-        else:
-            payload_bytes = payload
-        
-        # Gera o hash HMAC SHA256
-        hash_obj = hmac.new(
-            secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        )
-        expected_signature = hash_obj.hexdigest()
-        
-        # Comparação segura para prevenir timing attacks
-        return hmac.compare_digest(expected_signature, signature)
-    except Exception:
-        return False
+    return WebhookVerifier(secret).verify(payload, signature)
 
 
 def extract_webhook_signature(headers: Dict[str, Union[str, list, None]]) -> Optional[str]: